@@ -0,0 +1,74 @@
+"""
+Compare, sur des rafales de requêtes concurrentes, le front-end asyncio (utils/async_api.py, avec regroupement des
+requêtes en vol) à l'appel direct de calc_integral dans un exécuteur (une tâche par requête, sans regroupement).
+Dans chaque rafale, les dénominateurs sont tirés parmi --denominators dénominateurs et les numérateurs parmi
+--numerators numérateurs : beaucoup de requêtes partagent leur dénominateur, voire toute la fraction.
+À lancer depuis la racine du projet :
+    python -m benchmarks.async_coalescing [--bursts 5] [--burst-size 500] [--denominators 20] [--numerators 5]
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from main import calc_integral
+from utils.async_api import AsyncIntegrator
+from benchmarks.problems import circle_roots, denominator_from_roots
+
+
+def generate_burst(size, denominators, numerators, rng):
+    pool_down = [denominator_from_roots(*circle_roots(6, 2.0, rng)) for _ in range(denominators)]
+    pool_up = [list(rng.standard_normal(4)) for _ in range(numerators)]
+    return [(pool_up[rng.integers(numerators)], pool_down[rng.integers(denominators)], -1.0, float(rng.uniform(0, 1)))
+            for _ in range(size)]
+
+
+async def timed_call(coroutine):
+    start = time.perf_counter()
+    await coroutine
+    return time.perf_counter() - start
+
+
+async def run_bursts(bursts, integrate):
+    """
+    Lance chaque rafale d'un coup et attend qu'elle soit finie. Retourne (durée totale, latences).
+    """
+    latencies = []
+    start = time.perf_counter()
+    for burst in bursts:
+        latencies += await asyncio.gather(*(timed_call(integrate(*job)) for job in burst))
+    return time.perf_counter() - start, np.array(latencies) * 1e3
+
+
+async def main_async(args):
+    rng = np.random.default_rng(args.seed)
+    bursts = [generate_burst(args.burst_size, args.denominators, args.numerators, rng) for _ in range(args.bursts)]
+
+    executor = ThreadPoolExecutor()
+    loop = asyncio.get_running_loop()
+
+    async def direct(poly_up, poly_down, a, b):
+        return await loop.run_in_executor(executor, calc_integral, poly_up, poly_down, a, b)
+
+    integrator = AsyncIntegrator(executor)
+    print(f"{'front-end':>12} {'requêtes/s':>11} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for name, integrate in (('direct', direct), ('regroupé', integrator.integrate)):
+        seconds, latencies = await run_bursts(bursts, integrate)
+        print(f"{name:>12} {len(latencies) / seconds:>11.0f} {np.percentile(latencies, 50):>9.2f} "
+              f"{np.percentile(latencies, 99):>9.2f}")
+    print("regroupement :", integrator.stats)
+    integrator.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bursts', type=int, default=5)
+    parser.add_argument('--burst-size', type=int, default=500)
+    parser.add_argument('--denominators', type=int, default=20)
+    parser.add_argument('--numerators', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare, pour un dénominateur et des intervalles fixés, trois façons d'intégrer beaucoup de numérateurs :
+- 'scalar' : calc_integral_intervals pour chaque numérateur (une décomposition par numérateur),
+- 'numerators' : calc_integral_numerators pour chaque intervalle (une analyse du dénominateur par intervalle),
+- 'table' : BasisIntegralTable (utils/basis.py), construite une fois, puis un seul produit matriciel.
+À lancer depuis la racine du projet :
+    python -m benchmarks.basis_table [--degree 6] [--numerators 1000] [--intervals 100] [--seed 0]
+"""
+import argparse
+import random
+import time
+import numpy as np
+from main import calc_integral_intervals
+from utils.basis import BasisIntegralTable
+from utils.batch import calc_integral_numerators
+from utils.cache import DecompositionCache
+from benchmarks.problems import circle_roots, denominator_from_roots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--degree', type=int, default=6, help="degré du dénominateur")
+    parser.add_argument('--numerators', type=int, default=1000)
+    parser.add_argument('--intervals', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    random.seed(args.seed)
+    poly_down = denominator_from_roots(*circle_roots(args.degree, 2.0, rng))
+    polys_up = rng.standard_normal((args.numerators, args.degree + 3))  # Numérateurs avec une partie entière
+    a = rng.uniform(-1, 0, args.intervals)
+    b = rng.uniform(0, 1, args.intervals)
+    cache = DecompositionCache()
+
+    start = time.perf_counter()
+    table = BasisIntegralTable(poly_down, a, b, polys_up.shape[1] - 1, cache=cache)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    values = table.integrate(polys_up)
+    lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = np.array([calc_integral_intervals(list(poly_up), poly_down, a, b, cache=cache) for poly_up in polys_up])
+    scalar_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    numerators = np.array([calc_integral_numerators(polys_up, poly_down, a[k], b[k], cache=cache)
+                           for k in range(args.intervals)]).T
+    numerators_seconds = time.perf_counter() - start
+
+    print(f"{args.numerators} numérateurs x {args.intervals} intervalles, dénominateur de degré {args.degree}")
+    print(f"  scalar      {scalar_seconds * 1e3:10.2f} ms")
+    print(f"  numerators  {numerators_seconds * 1e3:10.2f} ms")
+    print(f"  table       {lookup * 1e3:10.2f} ms (+ {build * 1e3:.2f} ms de construction)")
+    print(f"écart relatif maximal avec scalar : {np.max(np.abs(values - scalar) / np.abs(scalar)):.1e}, "
+          f"avec numerators : {np.max(np.abs(values - numerators) / np.abs(numerators)):.1e}")
+
+
+if __name__ == "__main__":
+    main()
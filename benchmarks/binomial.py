@@ -0,0 +1,70 @@
+"""
+Compare, sur les dénominateurs binômes x^n + 2, le chemin rapide de utils/structured.py (racines et constantes en
+forme close) au chemin général (recherche des racines puis calcul des constantes), pour n jusqu'à quelques centaines.
+À lancer depuis la racine du projet :
+    python -m benchmarks.binomial [--degrees 8 32 128 256 400] [--repeat 3] [--seed 0] [--muller-max 40]
+
+Le chemin général utilise la matrice compagnon et les résidus (le plus robuste aux grands degrés) ; Muller et la
+matrice d'identification ne sont mesurés que jusqu'au degré --muller-max.
+La référence est la série exacte, sur [0, 1] :
+    intégrale de x^k / (x^n + 2) = somme_j (-1)^j / 2^(j + 1) / (k + n.j + 1)
+"""
+import argparse
+import time
+import numpy as np
+from utils.decomposition import decompose_rational, evaluate_decomposition
+
+
+def reference_integral(poly_up, n):
+    """
+    L'intégrale de poly_up / (x^n + 2) sur [0, 1], par la série alternée (convergence géométrique de raison 1/2).
+    """
+    j = np.arange(80)
+    return sum(coeff * np.sum((-1.0) ** j / 2.0 ** (j + 1) / (k + n * j + 1)) for k, coeff in enumerate(poly_up))
+
+
+def run(degrees, repeat, seed, muller_max):
+    """
+    Lance le benchmark et retourne une liste de lignes de résultats (dictionnaires).
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for n in degrees:
+        poly_down = [2.0] + [0.0] * (n - 1) + [1.0]
+        poly_up = list(rng.standard_normal(min(n, 4)))
+        reference = reference_integral(poly_up, n)
+
+        paths = [('binôme', {}), ('compagnon', {'structured': False, 'backend': 'companion', 'method': 'residues'})]
+        if n <= muller_max:
+            paths.append(('muller', {'structured': False}))
+        for name, options in paths:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with np.errstate(all='ignore'):
+                    integral = evaluate_decomposition(*decompose_rational(poly_up, poly_down, **options), 1, 0, 1)
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                'degree': n,
+                'path': name,
+                'seconds': best,
+                'relative_error': float(abs(integral - reference) / abs(reference)),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[8, 32, 128, 256, 400])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--muller-max', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'degré':>6} {'chemin':>10} {'temps (ms)':>12} {'erreur relative':>16}")
+    for row in run(args.degrees, args.repeat, args.seed, args.muller_max):
+        print(f"{row['degree']:>6} {row['path']:>10} {row['seconds'] * 1e3:>12.3f} {row['relative_error']:>16.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compare les deux méthodes de décomposition en éléments simples, à racines connues (la recherche des racines est
+exclue de la mesure) :
+- 'matrix' : matrice d'identification (get_identification_matrix) puis solve_linear_system,
+- 'residues' : calcul direct des constantes (utils/residues.py).
+À lancer depuis la racine du projet :
+    python -m benchmarks.decomposition_methods [--degrees 20 50 100 200] [--repeat 3] [--seed 0]
+
+Les dénominateurs ont des racines simples réparties près du cercle unité (paires complexes à des angles réguliers
+légèrement perturbés, et jusqu'à deux racines réelles) : les éléments simples restent alors bien conditionnés.
+La précision est l'erreur relative maximale entre la somme des éléments simples et R(x) / Q(x), en quelques points
+complexes loin des pôles.
+"""
+import argparse
+import time
+import numpy as np
+from utils.decomposition import get_identification_matrix, get_identification_rhs
+from utils.residues import get_residue_constants
+from utils.utils import solve_linear_system
+
+
+def random_denominator(degree, rng):
+    """
+    Racines uniques (sans les conjugués) et multiplicités d'un dénominateur de degré donné.
+    """
+    real_count = 2 - degree % 2
+    pairs = (degree - real_count) // 2
+    real_roots = [complex(1.05), complex(-0.95)][:real_count]
+    angles = np.pi * (np.arange(pairs) + 0.5 + rng.uniform(-0.2, 0.2, pairs)) / pairs
+    complex_roots = list(rng.uniform(0.9, 1.1, pairs) * np.exp(1j * angles))
+    unique = real_roots + complex_roots
+    return unique, [1] * len(unique)
+
+
+def partial_fraction_value(unique, count, constants, x):
+    """
+    Évalue la somme des éléments simples (constantes dans l'ordre des colonnes de la matrice d'identification) en x.
+    """
+    value = 0
+    index = 0
+    for root, multiplicity in zip(unique, count):
+        if root.imag == 0:
+            for j in range(1, multiplicity + 1):
+                value += constants[index] / (x - root.real) ** j
+                index += 1
+        else:
+            quadratic = x ** 2 - 2 * root.real * x + abs(root) ** 2
+            for j in range(1, multiplicity + 1):
+                value += (constants[index + multiplicity + j - 1] * x + constants[index + j - 1]) / quadratic ** j
+            index += 2 * multiplicity
+    return value
+
+
+def relative_error(unique, count, constants, rest_poly_up):
+    """
+    Erreur relative maximale de la décomposition, comparée à R(x) / Q(x) calculé par le produit des facteurs.
+    """
+    points = np.array([2 + 2j, -2 + 1j, 3j, 1.5 - 2.5j])
+    roots = []
+    for root, multiplicity in zip(unique, count):
+        roots += [root] * multiplicity + ([np.conj(root)] * multiplicity if root.imag != 0 else [])
+    exact = np.array([np.polyval(rest_poly_up[::-1], x) / np.prod(x - np.array(roots)) for x in points])
+    approx = np.array([partial_fraction_value(unique, count, constants, x) for x in points])
+    return float(np.max(np.abs(approx - exact) / np.abs(exact)))
+
+
+def run(degrees, repeat, seed):
+    """
+    Lance le benchmark et retourne une liste de lignes de résultats (dictionnaires).
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for degree in degrees:
+        unique, count = random_denominator(degree, rng)
+        rest_poly_up = list(rng.standard_normal(degree))
+
+        def matrix_method():
+            whole_matrix = get_identification_matrix(unique, count, degree)
+            return solve_linear_system(whole_matrix, get_identification_rhs(rest_poly_up, [0] * (degree + 1)))['solution']
+
+        def residues_method():
+            return get_residue_constants(rest_poly_up, unique, count)
+
+        for name, method in (('matrix', matrix_method), ('residues', residues_method)):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                constants = method()
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                'degree': degree,
+                'method': name,
+                'seconds': best,
+                'relative_error': relative_error(unique, count, constants, rest_poly_up),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[20, 50, 100, 200])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'degré':>6} {'méthode':>10} {'temps (ms)':>12} {'erreur relative':>16}")
+    for row in run(args.degrees, args.repeat, args.seed):
+        print(f"{row['degree']:>6} {row['method']:>10} {row['seconds'] * 1e3:>12.3f} {row['relative_error']:>16.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare les deux assemblages de la matrice d'identification (get_identification_matrix), à racines connues :
+- 'recursive' : get_polys_simple_element pour chaque racine (get_other_roots refait tous les produits des autres
+  facteurs pour chaque puissance), puis np.concatenate,
+- 'products' : puissances des facteurs calculées une fois, produits préfixes / suffixes, écriture directe dans une
+  seule matrice (fast=True, le défaut).
+À lancer depuis la racine du projet :
+    python -m benchmarks.identification_matrix [--poles 10 25 50 100 200] [--multiplicity 1] [--repeat 3] [--seed 0]
+
+--poles est le nombre de pôles distincts (une paire de pôles complexes conjugués compte pour deux), chacun de
+multiplicité --multiplicity. L'écart est la différence maximale entre les deux matrices, relative au plus grand
+coefficient. Au-delà d'une cinquantaine de pôles, les coefficients des produits (par puissances de x) subissent de
+fortes compensations : les deux assemblages sont alors aussi loin l'un que l'autre des coefficients exacts, et l'écart
+mesure ce mauvais conditionnement, pas une perte de précision de l'un des deux.
+"""
+import argparse
+import time
+import numpy as np
+from utils.decomposition import get_identification_matrix
+from benchmarks.decomposition_methods import random_denominator
+
+
+def best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(poles, multiplicity, repeat, seed):
+    """
+    Retourne une ligne de résultats (dictionnaire) par nombre de pôles.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for count in poles:
+        unique, _ = random_denominator(count, rng)
+        multiplicities = [multiplicity] * len(unique)
+        degree = count * multiplicity
+        recursive, expected = best_time(lambda: get_identification_matrix(unique, multiplicities, degree, fast=False),
+                                        repeat)
+        products, matrix = best_time(lambda: get_identification_matrix(unique, multiplicities, degree), repeat)
+        rows.append({
+            'poles': count,
+            'recursive': recursive,
+            'products': products,
+            'difference': np.max(np.abs(matrix - expected)) / np.max(np.abs(expected)),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--poles', type=int, nargs='+', default=[10, 25, 50, 100, 200])
+    parser.add_argument('--multiplicity', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pôles':>6} {'recursive (ms)':>15} {'products (ms)':>14} {'accélération':>13} {'écart':>9}")
+    for row in run(args.poles, args.multiplicity, args.repeat, args.seed):
+        print(f"{row['poles']:>6} {row['recursive'] * 1e3:>15.2f} {row['products'] * 1e3:>14.2f} "
+              f"{row['recursive'] / row['products']:>12.1f}x {row['difference']:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
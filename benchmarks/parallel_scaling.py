@@ -0,0 +1,82 @@
+"""
+Mesure le passage à l'échelle de integrate_parallel (utils/parallel.py) de 1 à N processus, sur un lot de calculs aux
+dénominateurs tous différents (le cache n'aide pas : c'est le cas le plus défavorable).
+À lancer depuis la racine du projet :
+    python -m benchmarks.parallel_scaling [--jobs 4000] [--workers 1 2 4 8] [--chunk-size 64] [--seed 0]
+
+Par défaut, --workers va de 1 au nombre de cœurs de la machine (en doublant). Le temps de référence est celui du calcul
+séquentiel (calc_integral dans une boucle, sans processus) ; l'accélération est rapportée à ce temps. On vérifie aussi
+que les résultats sont les mêmes quel que soit le nombre de processus.
+"""
+import argparse
+import os
+import random
+import time
+import numpy as np
+from main import calc_integral
+from utils.parallel import integrate_parallel
+from benchmarks.problems import circle_roots, denominator_from_roots
+
+
+def generate_jobs(count, seed):
+    """
+    count calculs (poly_up, poly_down, a, b) de degré 6, aux racines simples près du cercle de rayon 2.
+    """
+    rng = np.random.default_rng(seed)
+    jobs = []
+    for _ in range(count):
+        real_roots, complex_roots = circle_roots(6, 2.0, rng)
+        jobs.append((list(rng.standard_normal(4)), denominator_from_roots(real_roots, complex_roots), -1.0, 1.0))
+    return jobs
+
+
+def run(jobs_count, workers_list, chunk_size, seed):
+    """
+    Lance le benchmark et retourne une liste de lignes de résultats (dictionnaires).
+    """
+    jobs = generate_jobs(jobs_count, seed)
+    random.seed(seed)
+    start = time.perf_counter()
+    for job in jobs:
+        calc_integral(*job)
+    sequential = time.perf_counter() - start
+
+    results, reference = [], None
+    for workers in workers_list:
+        start = time.perf_counter()
+        values = list(integrate_parallel(jobs, workers, chunk_size, seed=seed))
+        seconds = time.perf_counter() - start
+        reference = values if reference is None else reference
+        results.append({
+            'workers': workers,
+            'seconds': seconds,
+            'jobs_per_second': jobs_count / seconds,
+            'speedup': sequential / seconds,
+            'same_results': values == reference,
+        })
+    return sequential, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=4000)
+    parser.add_argument('--workers', type=int, nargs='+')
+    parser.add_argument('--chunk-size', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    workers_list = args.workers
+    if workers_list is None:
+        cores = os.cpu_count() or 1
+        workers_list = [1 << k for k in range(cores.bit_length()) if 1 << k < cores] + [cores]
+
+    sequential, results = run(args.jobs, workers_list, args.chunk_size, args.seed)
+    print(f"séquentiel : {sequential:.3f} s ({args.jobs / sequential:.0f} calculs/s)")
+    print(f"{'processus':>10} {'temps (s)':>10} {'calculs/s':>10} {'accélération':>13} {'mêmes résultats':>16}")
+    for row in results:
+        print(f"{row['workers']:>10} {row['seconds']:>10.3f} {row['jobs_per_second']:>10.0f} {row['speedup']:>13.2f} "
+              f"{'oui' if row['same_results'] else 'non':>16}")
+
+
+if __name__ == "__main__":
+    main()
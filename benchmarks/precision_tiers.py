@@ -0,0 +1,88 @@
+"""
+Compare les niveaux de précision (utils/precision.py) sur les familles de problèmes de benchmarks/problems.py : pour
+chaque problème et chaque niveau, le meilleur temps de calc_integral et l'erreur relative par rapport à l'intégrale de
+référence.
+À lancer depuis la racine du projet :
+    python -m benchmarks.precision_tiers [--families degree multiplicity] [--tiers fast default high] [--repeat 5]
+Le module random est réinitialisé avant chaque calcul, pour que tous les niveaux partent des mêmes tirages de Muller.
+"""
+import argparse
+import random
+import time
+import numpy as np
+from main import calc_integral
+from utils.precision import PRECISION_PRESETS
+from benchmarks.problems import FAMILIES, generate_problems, reference_integral
+
+
+def run_tier(problem, tier, repeat, seed, options):
+    """
+    Meilleur temps sur repeat exécutions et erreur relative d'un problème, avec le niveau de précision tier.
+    """
+    args = (problem['poly_up'], problem['poly_down'], problem['a'], problem['b'])
+    best = float('inf')
+    for _ in range(repeat):
+        random.seed(seed)
+        start = time.perf_counter()
+        value = calc_integral(*args, precision=tier, **options)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def run(families, tiers, repeat, seed, options):
+    """
+    Retourne une ligne par problème : {'name', 'reference', tier: (secondes, erreur relative), ...}.
+    """
+    rows = []
+    for problem in generate_problems(families, seed):
+        reference = reference_integral(problem['poly_up'], problem['poly_down'], problem['a'], problem['b'])
+        row = {'name': problem['name'], 'reference': reference}
+        for tier in tiers:
+            seconds, value = run_tier(problem, tier, repeat, seed, options)
+            row[tier] = (seconds, abs(value - reference) / abs(reference))
+        rows.append(row)
+    return rows
+
+
+def summarize(rows, tiers):
+    """
+    Pour chaque niveau : (temps médian, erreur relative médiane, erreur maximale, nombre d'échecs).
+    """
+    summary = {}
+    for tier in tiers:
+        errors = np.array([row[tier][1] for row in rows])
+        summary[tier] = (float(np.median([row[tier][0] for row in rows])), float(np.median(errors)),
+                         float(errors.max()), int(np.sum(errors > 1e-3)))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--families', nargs='+', choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument('--tiers', nargs='+', choices=PRECISION_PRESETS, default=list(PRECISION_PRESETS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--method', default='matrix')
+    parser.add_argument('--backend', default='muller')
+    args = parser.parse_args()
+
+    calc_integral([1], [1, 0, 1], 0, 1)  # Échauffement (imports, caches de NumPy)
+    rows = run(args.families, args.tiers, args.repeat, args.seed, {'method': args.method, 'backend': args.backend})
+    print(f"{'problème':<22}" + ''.join(f"{tier + ' (ms)':>14} {'erreur':>9}" for tier in args.tiers))
+    for row in rows:
+        print(f"{row['name']:<22}" + ''.join(f"{row[tier][0] * 1e3:>14.3f} {row[tier][1]:>9.1e}" for tier in args.tiers))
+
+    print("\nrésumé (temps et erreur médians, erreur maximale, échecs : erreur relative > 1e-3) :")
+    summary = summarize(rows, args.tiers)
+    for tier in args.tiers:
+        seconds, error, worst, failures = summary[tier]
+        print(f"  {tier:<8} {seconds * 1e3:.3f} ms, erreur {error:.1e}, maximum {worst:.1e}, {failures} échecs")
+    seconds = [summary[tier][0] for tier in args.tiers]
+    errors = [summary[tier][1] for tier in args.tiers]
+    monotone = seconds == sorted(seconds) and errors == sorted(errors, reverse=True)
+    print(f"compromis temps / précision {'monotone' if monotone else 'NON monotone'} "
+          f"dans l'ordre {' < '.join(args.tiers)}")
+
+
+if __name__ == "__main__":
+    main()
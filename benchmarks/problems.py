@@ -0,0 +1,123 @@
+"""
+Familles de problèmes reproductibles pour les benchmarks, et intégrale de référence.
+
+Chaque problème est un dictionnaire {'name', 'family', 'poly_up', 'poly_down', 'a', 'b'} (coefficients par puissances
+croissantes). Les dénominateurs sont construits à partir de leurs racines, placées hors de l'intervalle [a, b] :
+- 'degree' : racines simples près du cercle de rayon 2, degré croissant,
+- 'multiplicity' : pôles réels et complexes de grande multiplicité,
+- 'clustered' : paquets de racines très proches (mais distinctes),
+- 'far' : pôles loin du pavé [-5, 5] + 5i[-5, 5] des points de départ de Muller,
+- 'tall' : numérateurs de degré bien plus grand que le dénominateur (division euclidienne).
+"""
+import numpy as np
+from numpy.polynomial import polynomial
+
+FAMILIES = ('degree', 'multiplicity', 'clustered', 'far', 'tall')
+
+
+def denominator_from_roots(real_roots=(), complex_roots=(), leading_coeff=1.0):
+    """
+    Les coefficients de leading_coeff * produit des (x - r) * produit des (x - z)(x - conj(z)).
+    Les racines répétées donnent des pôles multiples.
+    """
+    poly = np.array([float(leading_coeff)])
+    for root in real_roots:
+        poly = polynomial.polymul(poly, [-root, 1])
+    for root in complex_roots:
+        poly = polynomial.polymul(poly, [abs(root) ** 2, -2 * root.real, 1])
+    return [float(coeff) for coeff in poly]
+
+
+def circle_roots(degree, radius, rng):
+    """
+    degree racines (dont une réelle si degree est impair) près du cercle de rayon radius, loin de l'axe réel.
+    """
+    pairs = degree // 2
+    angles = np.pi * (np.arange(pairs) + 0.5 + rng.uniform(-0.2, 0.2, pairs)) / pairs
+    complex_roots = list(radius * rng.uniform(0.9, 1.1, pairs) * np.exp(1j * angles))
+    return [-radius] * (degree % 2), complex_roots
+
+
+def problem(name, family, poly_up, poly_down, a, b):
+    return {'name': name, 'family': family, 'poly_up': [float(coeff) for coeff in poly_up],
+            'poly_down': list(poly_down), 'a': a, 'b': b}
+
+
+def family_rng(seed, family):
+    """
+    Le générateur aléatoire d'une famille, tiré de (seed, famille) : un problème a toujours les mêmes coefficients,
+    quelles que soient les autres familles demandées.
+    """
+    return np.random.default_rng([seed, FAMILIES.index(family)])
+
+
+def generate_problems(families=FAMILIES, seed=0):
+    """
+    La liste des problèmes des familles demandées. Une même graine donne toujours les mêmes problèmes (chaque famille
+    a son propre générateur, voir family_rng).
+    """
+    problems = []
+    if 'degree' in families:
+        rng = family_rng(seed, 'degree')
+        for degree in (4, 8, 12, 16, 20):
+            real_roots, complex_roots = circle_roots(degree, 2.0, rng)
+            problems.append(problem(f'degree-{degree}', 'degree', rng.standard_normal(degree),
+                                    denominator_from_roots(real_roots, complex_roots), -1, 1))
+    if 'multiplicity' in families:
+        rng = family_rng(seed, 'multiplicity')
+        for multiplicity in (2, 3, 4, 5):
+            problems.append(problem(f'real-pole-x{multiplicity}', 'multiplicity', rng.standard_normal(multiplicity),
+                                    denominator_from_roots([2.5] * multiplicity, [-1.5 + 1j]), -1, 1))
+            problems.append(problem(f'complex-pole-x{multiplicity}', 'multiplicity',
+                                    rng.standard_normal(2 * multiplicity),
+                                    denominator_from_roots([-3.0], [0.5 + 1.5j] * multiplicity), -1, 1))
+    if 'clustered' in families:
+        rng = family_rng(seed, 'clustered')
+        for spread in (1e-2, 1e-3, 1e-4):
+            problems.append(problem(f'clustered-{spread:g}', 'clustered', rng.standard_normal(5),
+                                    denominator_from_roots([3.0, 3.0 + spread, 3.0 - spread],
+                                                           [1j * 2, 1j * 2 + spread]), -1, 1))
+    if 'far' in families:
+        rng = family_rng(seed, 'far')
+        for radius in (20.0, 100.0, 1000.0):
+            real_roots, complex_roots = circle_roots(6, radius, rng)
+            problems.append(problem(f'far-{radius:g}', 'far', rng.standard_normal(4),
+                                    denominator_from_roots(real_roots, complex_roots), -5, 5))
+    if 'tall' in families:
+        rng = family_rng(seed, 'tall')
+        for degree in (10, 30, 60):
+            # Racines près du cercle unité : le reste de la division euclidienne garde des coefficients modérés (avec
+            # des racines de module 2, ils croîtraient comme 2^degree, et la décomposition perdrait toute précision).
+            real_roots, complex_roots = circle_roots(4, 1.0, rng)
+            problems.append(problem(f'tall-{degree}', 'tall', rng.standard_normal(degree + 1),
+                                    denominator_from_roots(real_roots, complex_roots), -0.5, 0.5))
+    return problems
+
+
+def reference_integral(poly_up, poly_down, a, b, panels=64, nodes=32):
+    """
+    Intégrale de référence de poly_up / poly_down sur [a, b] (sans pôle dans l'intervalle), indépendante de la
+    décomposition en éléments simples.
+    Avec mpmath (si installé), quadrature en précision étendue (30 chiffres). Sinon, Gauss-Legendre composite : le
+    nombre de panneaux est doublé jusqu'à stabilisation de la valeur (précision de l'ordre de 1e-14 en relatif).
+    """
+    try:
+        import mpmath
+    except ImportError:
+        mpmath = None
+    if mpmath is not None:
+        with mpmath.workdps(30):
+            integrand = lambda x: mpmath.polyval(poly_up[::-1], x) / mpmath.polyval(poly_down[::-1], x)
+            return float(mpmath.quad(integrand, [a, b]))
+
+    points, weights = np.polynomial.legendre.leggauss(nodes)
+    up, down = np.array(poly_up[::-1], dtype=float), np.array(poly_down[::-1], dtype=float)
+    previous = None
+    while True:
+        edges = np.linspace(a, b, panels + 1)
+        half = (edges[1:] - edges[:-1])[:, None] / 2
+        x = (edges[:-1] + edges[1:])[:, None] / 2 + half * points
+        value = float(np.sum(half * weights * np.polyval(up, x) / np.polyval(down, x)))
+        if previous is not None and abs(value - previous) <= 1e-14 * max(abs(value), 1e-300) or panels > 1 << 16:
+            return value
+        previous, panels = value, panels * 2
@@ -0,0 +1,69 @@
+"""
+Compare les backends de recherche des racines (utils/roots.py) en temps et en précision, pour des degrés de 2 à 200.
+À lancer depuis la racine du projet :
+    python -m benchmarks.root_backends [--degrees 2 5 10 20 50 100 200] [--repeat 3] [--seed 0]
+
+Les polynômes ont des coefficients aléatoires (loi normale, graine fixée). La précision est mesurée par l'erreur
+inverse relative max_k |p(z_k)| / somme_i |c_i| |z_k|^i, et on compte les racines manquantes.
+"""
+import argparse
+import random
+import time
+import numpy as np
+from utils.roots import ROOT_BACKENDS, find_roots
+
+
+def backward_error(coefficients, roots):
+    """
+    Erreur inverse relative maximale des racines trouvées.
+    """
+    if len(roots) == 0:
+        return float('nan')
+    roots = np.array(roots, dtype=complex)
+    descending = coefficients[::-1]
+    values = np.abs(np.polyval(descending, roots))
+    scales = np.polyval(np.abs(descending), np.abs(roots))
+    return float(np.max(values / scales))
+
+
+def run(degrees, repeat, seed):
+    """
+    Lance le benchmark et retourne une liste de lignes de résultats (dictionnaires).
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for degree in degrees:
+        coefficients = rng.standard_normal(degree + 1)
+        for backend in ROOT_BACKENDS:
+            random.seed(seed)  # Muller tire ses points de départ avec le module random
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with np.errstate(all='ignore'):  # Muller déborde sur les grands degrés : on le compte en racines manquantes
+                    roots = find_roots(coefficients, backend)
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                'degree': degree,
+                'backend': backend,
+                'seconds': best,
+                'missing_roots': degree - len(roots),
+                'backward_error': backward_error(coefficients, roots),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[2, 5, 10, 20, 50, 100, 200])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'degré':>6} {'backend':>10} {'temps (ms)':>12} {'manquantes':>11} {'erreur inverse':>15}")
+    for row in run(args.degrees, args.repeat, args.seed):
+        print(f"{row['degree']:>6} {row['backend']:>10} {row['seconds'] * 1e3:>12.3f} {row['missing_roots']:>11} "
+              f"{row['backward_error']:>15.2e}")
+
+
+if __name__ == "__main__":
+    main()
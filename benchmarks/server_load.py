@@ -0,0 +1,124 @@
+"""
+Test de charge du serveur de calcul (utils/server.py) : plusieurs clients en parallèle envoient chacun une suite de
+requêtes (une à la fois, en attendant la réponse), et on mesure le débit et les percentiles de latence vus par les
+clients. Les dénominateurs sont tirés dans un ensemble de --denominators dénominateurs, pour que le cache serve.
+À lancer depuis la racine du projet :
+    python -m benchmarks.server_load [--clients 1 4 16] [--requests 500] [--denominators 50] [--seed 0]
+    python -m benchmarks.server_load --connect 127.0.0.1:8765       # contre un serveur déjà lancé (server.py)
+
+Sans --connect, un serveur est lancé dans ce processus, sur un port libre. Pour comparaison, on mesure aussi le temps
+d'un calcul fait en lançant un nouveau processus (python cli.py), ce que le serveur évite.
+"""
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+import numpy as np
+from utils.server import IntegrationService, make_server
+from benchmarks.problems import circle_roots, denominator_from_roots
+
+
+def generate_requests(count, denominators, rng):
+    """
+    count requêtes dont les dénominateurs (degré 6) sont tirés parmi denominators dénominateurs différents.
+    """
+    pool = [denominator_from_roots(*circle_roots(6, 2.0, rng)) for _ in range(denominators)]
+    return [{'id': k, 'poly_up': list(rng.standard_normal(4)), 'poly_down': pool[rng.integers(denominators)],
+             'a': -1.0, 'b': float(rng.uniform(0, 1))} for k in range(count)]
+
+
+def client(address, requests, latencies):
+    """
+    Envoie les requêtes une par une sur une connexion, et ajoute les latences mesurées à latencies.
+    """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as connection:
+        connection.connect(address)
+        reader = connection.makefile('rb')
+        for request in requests:
+            start = time.perf_counter()
+            connection.sendall((json.dumps(request) + '\n').encode())
+            response = json.loads(reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+
+
+def query_stats(address):
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as connection:
+        connection.connect(address)
+        connection.sendall(b'{"op": "stats"}\n')
+        return json.loads(connection.makefile('rb').readline())
+
+
+def run_load(address, clients, requests_per_client, denominators, seed):
+    """
+    Lance clients clients en parallèle. Retourne le débit (requêtes/s) et les percentiles de latence (ms).
+    """
+    rng = np.random.default_rng(seed)
+    latencies = []
+    threads = [threading.Thread(target=client, args=(address, generate_requests(requests_per_client, denominators, rng),
+                                                     latencies)) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    latencies = np.array(latencies) * 1e3
+    return {
+        'clients': clients,
+        'requests_per_second': len(latencies) / seconds,
+        **{f'p{q}': float(np.percentile(latencies, q)) for q in (50, 90, 99)},
+    }
+
+
+def cold_call_seconds():
+    """
+    Durée d'un calcul fait en lançant un nouveau processus (import de NumPy compris).
+    """
+    job = json.dumps({'poly_up': [1], 'poly_down': [1, 0, 1], 'a': 0, 'b': 1})
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'cli.py'], input=job.encode(), capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=500, help="requêtes par client")
+    parser.add_argument('--denominators', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--connect', help="adresse host:port (ou chemin de socket Unix) d'un serveur déjà lancé")
+    args = parser.parse_args()
+
+    server = None
+    if args.connect is None:
+        server = make_server(IntegrationService(), port=0)
+        address = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    elif ':' in args.connect:
+        host, port = args.connect.rsplit(':', 1)
+        address = (host, int(port))
+    else:
+        address = args.connect
+
+    print(f"calcul dans un nouveau processus : {cold_call_seconds() * 1e3:.1f} ms")
+    print(f"{'clients':>8} {'requêtes/s':>11} {'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9}")
+    for clients in args.clients:
+        row = run_load(address, clients, args.requests, args.denominators, args.seed)
+        print(f"{row['clients']:>8} {row['requests_per_second']:>11.0f} {row['p50']:>9.3f} {row['p90']:>9.3f} "
+              f"{row['p99']:>9.3f}")
+    print("statistiques du serveur :", json.dumps(query_stats(address)))
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
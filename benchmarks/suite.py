@@ -0,0 +1,136 @@
+"""
+Suite de benchmarks de calc_integral sur les familles de problèmes de benchmarks/problems.py : temps de bout en bout,
+temps par étape (voir utils/instrumentation.py) et erreur relative par rapport à l'intégrale de référence.
+À lancer depuis la racine du projet :
+    python -m benchmarks.suite [--families degree far] [--repeat 5] [--seed 0] [--method matrix] [--backend muller]
+    python -m benchmarks.suite --save benchmarks/baselines/suite.json     # enregistre une référence
+    python -m benchmarks.suite --check benchmarks/baselines/suite.json    # compare à la référence
+
+Avec --check, le programme se termine avec le code 1 si un problème (ou une de ses étapes : recherche des racines,
+système, évaluation des éléments simples, ...) est plus lent que la référence de plus de --tolerance (50 % par défaut,
+et au moins 50 µs), ou si son erreur relative est plus de 10 fois celle de la référence (et au-dessus de 1e-12).
+Les problèmes dont l'erreur relative de référence dépasse 1e-3 sont des échecs connus (Muller qui ne converge pas,
+racines multiples mal regroupées) : leur précision n'est pas vérifiée (ils sont listés), seuls leurs temps le sont.
+Les temps dépendent de la machine : la référence doit être enregistrée sur la machine où la vérification est faite.
+Le module random est réinitialisé avant chaque problème, pour que Muller fasse toujours les mêmes tirages.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from main import calc_integral
+from utils.instrumentation import Collector
+from benchmarks.problems import FAMILIES, generate_problems, reference_integral
+
+MIN_SLOWDOWN = 50e-6  # En dessous de cet écart (secondes), une différence de temps est considérée comme du bruit
+MIN_ERROR = 1e-12
+MAX_REFERENCE_ERROR = 1e-3  # Au-dessus, la référence est un échec connu : sa précision n'est pas vérifiée
+
+
+def run_problem(problem, repeat, seed, options):
+    """
+    Mesure un problème : meilleurs temps (de bout en bout et par étape) sur repeat exécutions, erreur relative.
+    """
+    args = (problem['poly_up'], problem['poly_down'], problem['a'], problem['b'])
+    calc_integral(*args, **options)  # Échauffement (imports, caches de NumPy)
+    best = float('inf')
+    for _ in range(repeat):
+        random.seed(seed)
+        start = time.perf_counter()
+        value = calc_integral(*args, **options)
+        best = min(best, time.perf_counter() - start)
+
+    stages, iterations = {}, {}
+    for _ in range(repeat):  # Un collecteur par exécution, pour garder le meilleur temps de chaque étape
+        collector = Collector()
+        random.seed(seed)
+        calc_integral(*args, collector=collector, **options)
+        for stage, timing in collector.timings.items():
+            if stage != 'total':
+                stages[stage] = min(stages.get(stage, float('inf')), timing['total'])
+        iterations = collector.export()['histograms'].get('muller_iterations', {})
+
+    reference = reference_integral(*args)
+    return {
+        'name': problem['name'],
+        'family': problem['family'],
+        'seconds': best,
+        'stages': stages,
+        'relative_error': abs(value - reference) / abs(reference),
+        'muller_iterations': iterations,
+    }
+
+
+def run(families, repeat, seed, options):
+    """
+    Lance la suite et retourne une liste de lignes de résultats (dictionnaires).
+    """
+    return [run_problem(problem, repeat, seed, options) for problem in generate_problems(families, seed)]
+
+
+def check(results, baseline, tolerance):
+    """
+    Compare les résultats à une référence (même format que run).
+    Retourne (régressions, problèmes dont la précision n'est pas vérifiée), deux listes de chaînes.
+    """
+    reference = {row['name']: row for row in baseline['results']}
+    regressions, unchecked = [], []
+    for row in results:
+        if row['name'] not in reference:
+            continue
+        base = reference[row['name']]
+        timings = [('total', row['seconds'], base['seconds'])]
+        timings += [(stage, seconds, base['stages'][stage])
+                    for stage, seconds in row['stages'].items() if stage in base['stages']]
+        for stage, seconds, base_seconds in timings:
+            if seconds > base_seconds * (1 + tolerance) and seconds - base_seconds > MIN_SLOWDOWN:
+                regressions.append(f"{row['name']} [{stage}] : {seconds * 1e3:.3f} ms "
+                                   f"(référence {base_seconds * 1e3:.3f} ms)")
+        if base['relative_error'] > MAX_REFERENCE_ERROR:
+            unchecked.append(f"{row['name']} (référence {base['relative_error']:.2e})")
+        elif row['relative_error'] > max(10 * base['relative_error'], MIN_ERROR):
+            regressions.append(f"{row['name']} [précision] : {row['relative_error']:.2e} "
+                               f"(référence {base['relative_error']:.2e})")
+    return regressions, unchecked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--families', nargs='+', choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--method', default='matrix')
+    parser.add_argument('--backend', default='muller')
+    parser.add_argument('--square-free', action='store_true')
+    parser.add_argument('--save', help="fichier JSON dans lequel enregistrer les résultats comme référence")
+    parser.add_argument('--check', help="fichier JSON de référence auquel comparer les résultats")
+    parser.add_argument('--tolerance', type=float, default=0.5)
+    args = parser.parse_args()
+
+    options = {'method': args.method, 'backend': args.backend, 'square_free': args.square_free}
+    results = run(args.families, args.repeat, args.seed, options)
+
+    print(f"{'problème':>20} {'temps (ms)':>12} {'racines (ms)':>13} {'termes (ms)':>12} {'erreur relative':>16}")
+    for row in results:
+        print(f"{row['name']:>20} {row['seconds'] * 1e3:>12.3f} {row['stages'].get('roots', 0) * 1e3:>13.3f} "
+              f"{row['stages'].get('terms', 0) * 1e3:>12.3f} {row['relative_error']:>16.2e}")
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'options': options, 'seed': args.seed, 'repeat': args.repeat, 'results': results}, file,
+                      indent=2)
+    if args.check:
+        with open(args.check) as file:
+            regressions, unchecked = check(results, json.load(file), args.tolerance)
+        if unchecked:
+            print(f"précision non vérifiée (échecs connus) : {', '.join(unchecked)}")
+        for regression in regressions:
+            print(f"RÉGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("Aucune régression.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Point d'entrée en ligne de commande : calcule les intégrales d'un fichier de calculs (JSONL ou CSV, voir
+utils/jobs.py) et écrit les résultats dans le même ordre, au fur et à mesure.
+    python cli.py calculs.jsonl -o resultats.jsonl
+    cat calculs.csv | python cli.py --format csv > resultats.csv
+La mémoire utilisée ne dépend que de --chunk-size, pas de la taille du fichier.
+
+Un lot binaire (.npz ou dossier de .npy, voir utils/bulk.py) est intégré par tranches, avec le moteur empilé (ou
+calc_integral ligne par ligne avec --engine scalar), et les résultats sont écrits dans un fichier .npy :
+    python cli.py lot.npz -o resultats.npy [--slice-size 65536] [--workers 4] [--engine scalar]
+--backend, --square-free et --precision s'appliquent aussi aux lots binaires ; --method ne sert qu'au moteur scalar
+(le moteur empilé a sa propre décomposition).
+"""
+import argparse
+import os
+import sys
+from utils.jobs import FORMATS, read_jobs, integrate_chunks, write_results
+from utils.bulk import BULK_ENGINES, integrate_bulk_file
+from utils.precision import PRECISION_PRESETS
+
+
+def guess_format(path, default='jsonl'):
+    """
+    Le format d'un fichier d'après son extension (default pour l'entrée / la sortie standard).
+    """
+    if path is None or path == '-':
+        return default
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', default='-', help="fichier de calculs (par défaut, l'entrée standard)")
+    parser.add_argument('-o', '--output', default='-', help="fichier de résultats (par défaut, la sortie standard)")
+    parser.add_argument('--format', choices=FORMATS, help="format de l'entrée (par défaut, d'après l'extension)")
+    parser.add_argument('--output-format', choices=FORMATS, help="format de la sortie (par défaut, celui de l'entrée)")
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--method', default='matrix')
+    parser.add_argument('--backend', default='muller')
+    parser.add_argument('--square-free', action='store_true')
+    parser.add_argument('--precision', choices=PRECISION_PRESETS, default='default')
+    parser.add_argument('--slice-size', type=int, default=65536, help="taille des tranches d'un lot binaire")
+    parser.add_argument('--workers', type=int, default=1, help="nombre de processus pour un lot binaire")
+    parser.add_argument('--engine', choices=BULK_ENGINES, default='stacked', help="moteur d'un lot binaire")
+    args = parser.parse_args()
+
+    if args.input.endswith('.npz') or os.path.isdir(args.input):
+        if args.output == '-':
+            parser.error("un lot binaire demande un fichier de sortie .npy (-o)")
+        options = {'backend': args.backend, 'precision': args.precision}
+        if args.engine == 'scalar':
+            options['method'] = args.method
+        if args.square_free or args.engine == 'scalar':
+            # Sans --square-free, le moteur empilé garde son défaut (square_free=True pour les racines multiples).
+            options['square_free'] = args.square_free
+        results = integrate_bulk_file(args.input, args.output, args.slice_size, args.workers, args.engine, **options)
+        print(f"{len(results)} calculs", file=sys.stderr)
+        return
+
+    input_format = args.format or guess_format(args.input)
+    output_format = args.output_format or guess_format(args.output, input_format)
+    source = sys.stdin if args.input == '-' else open(args.input, newline='')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        chunks = integrate_chunks(read_jobs(source, input_format), args.chunk_size, method=args.method,
+                                  backend=args.backend, square_free=args.square_free,
+                                  precision=args.precision)
+        total, errors = write_results(chunks, target, output_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"{total} calculs, {errors} erreurs", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
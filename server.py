@@ -0,0 +1,38 @@
+"""
+Lance le serveur de calcul (voir utils/server.py) : un processus persistant qui répond aux calculs envoyés en JSON,
+une ligne par requête, sur une socket TCP locale ou une socket Unix.
+    python server.py [--host 127.0.0.1] [--port 8765] [--unix /tmp/integrale.sock] [--cache-size 1024]
+Exemple de client :
+    echo '{"poly_up": [1], "poly_down": [1, 0, 1], "a": 0, "b": 1}' | nc 127.0.0.1 8765
+"""
+import argparse
+from utils.precision import PRECISION_PRESETS
+from utils.server import IntegrationService, make_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="chemin d'une socket Unix (à la place de TCP)")
+    parser.add_argument('--cache-size', type=int, default=1024)
+    parser.add_argument('--method', default='matrix')
+    parser.add_argument('--backend', default='muller')
+    parser.add_argument('--square-free', action='store_true')
+    parser.add_argument('--precision', choices=PRECISION_PRESETS, default='default')
+    args = parser.parse_args()
+
+    service = IntegrationService(args.cache_size, method=args.method, backend=args.backend,
+                                 square_free=args.square_free, precision=args.precision)
+    server = make_server(service, args.host, args.port, args.unix)
+    print(f"En écoute sur {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Tests du front-end asyncio (utils/async_api.py).
+"""
+import asyncio
+import numpy as np
+from utils.async_api import AsyncIntegrator
+
+
+def integrate_all(requests, **options):
+    async def run():
+        integrator = AsyncIntegrator(**options)
+        try:
+            return await asyncio.gather(*(integrator.integrate(*request) for request in requests)), integrator.stats
+        finally:
+            integrator.close()
+    return asyncio.run(run())
+
+
+def test_proportional_denominators():
+    # Même dénominateur normalisé, mais des intégrales différentes : pi / 4 et pi / 8.
+    values, _ = integrate_all([([1], [1, 0, 1], 0, 1), ([1], [2, 0, 2], 0, 1)])
+    assert np.allclose(values, [np.pi / 4, np.pi / 8], rtol=1e-12)
+
+
+def test_coalescing():
+    requests = [([1], [1, 0, 1], 0, b) for b in (0.5, 1, 2)] + [([0, 1], [1, 0, 1], 0, 1)]
+    values, stats = integrate_all(requests)
+    assert np.allclose(values, [np.arctan(0.5), np.pi / 4, np.arctan(2), np.log(2) / 2], rtol=1e-12)
+    assert stats['groups'] == 1
+    assert stats['decompositions'] == 2
+
+
+def test_reject_overflow():
+    async def run():
+        integrator = AsyncIntegrator(max_pending=1, overflow='reject')
+        try:
+            return await asyncio.gather(*(integrator.integrate([1], [1, 0, 1], 0, 1) for _ in range(3)),
+                                        return_exceptions=True)
+        finally:
+            integrator.close()
+    results = asyncio.run(run())
+    assert any(isinstance(result, asyncio.QueueFull) for result in results)
+    assert any(isinstance(result, float) for result in results)
@@ -0,0 +1,28 @@
+"""
+Tests des calculs par lots (utils/batch.py, utils/bulk.py).
+"""
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+from utils.batch import calc_integral_stacked
+from utils.bulk import integrate_slice
+from benchmarks.problems import reference_integral
+
+REPEATED = list(polynomial.polymul(polynomial.polypow([-3, 1], 3), polynomial.polypow([2, 1], 2)))
+SIMPLE = list(polynomial.polymul(polynomial.polymul([-3, 1], [2, 1]), polynomial.polymul([2, 2, 1], [4, 1])))
+
+
+def test_stacked_mixes_simple_and_repeated_roots():
+    poly_up = [1, -2, 0.5]
+    expected = [reference_integral(poly_up, poly_down, -1, 1) for poly_down in (SIMPLE, REPEATED)]
+    values = calc_integral_stacked([poly_up, poly_up], [SIMPLE, REPEATED], -1, 1)
+    assert values == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize('engine', ['stacked', 'scalar'])
+def test_integrate_slice_repeated_roots(engine):
+    poly_up = np.array([[1, -2, 0.5]])
+    expected = reference_integral([1, -2, 0.5], REPEATED, -1, 1)
+    values = integrate_slice(poly_up, np.array([REPEATED]), np.array([-1.0]), np.array([1.0]), engine=engine,
+                             square_free=True)
+    assert values[0] == pytest.approx(expected, rel=1e-12)
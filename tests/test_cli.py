@@ -0,0 +1,37 @@
+"""
+Tests de la ligne de commande (cli.py) sur des lots binaires.
+"""
+import sys
+import numpy as np
+import pytest
+import cli
+from utils.bulk import save_bulk
+from benchmarks.problems import reference_integral
+
+# x^2 + x + 2, puis (x - 3) (x + 2) (x - 2)^2 (racine double : le moteur empilé passe par decompose_rational)
+POLY_DOWN = [[2, 1, 1, 0, 0], [-24, 20, 2, -5, 1]]
+POLY_UP = [[1, 0], [1, -2]]
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['cli.py', *map(str, args)])
+    cli.main()
+
+
+@pytest.fixture
+def batch(tmp_path):
+    path = tmp_path / 'lot.npz'
+    save_bulk(path, np.array(POLY_UP, dtype=float), np.array(POLY_DOWN, dtype=float), np.zeros(2), np.ones(2))
+    return path
+
+
+@pytest.mark.parametrize('engine', ['stacked', 'scalar'])
+def test_binary_batch_forwards_options(monkeypatch, batch, tmp_path, engine):
+    output = tmp_path / 'resultats.npy'
+    run_cli(monkeypatch, batch, '-o', output, '--engine', engine, '--precision', 'high', '--method', 'residues')
+    expected = [reference_integral(poly_up, list(np.trim_zeros(poly_down, 'b')), 0, 1)
+                for poly_up, poly_down in zip(POLY_UP, POLY_DOWN)]
+    assert np.load(output) == pytest.approx(expected, rel=1e-12)
+    # Un backend inconnu n'était pas transmis : le lot était calculé sans erreur.
+    with pytest.raises(ValueError, match='Backend'):
+        run_cli(monkeypatch, batch, '-o', output, '--engine', engine, '--backend', 'inconnu')
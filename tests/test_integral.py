@@ -0,0 +1,131 @@
+"""
+Tests de calc_integral (utils/integral.py) et des intégrales d'éléments simples, comparés à une quadrature
+(reference_integral, indépendante de la décomposition en éléments simples).
+"""
+import random
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+from main import calc_integral, calc_integral_factored, calc_integral_intervals
+from utils.basis import BasisIntegralTable
+from utils.batch import calc_integral_numerators
+from utils.cache import DecompositionCache, SharedDecompositionCache
+from utils.integral_type2 import calc_integral_type2, calc_type2_power, calc_type2_power_simple
+from utils.roots import RootFindingError
+from benchmarks.problems import reference_integral
+
+# Dénominateurs sous forme factorisée (voir utils/factored.py) : [(r, m), ...] pour les (x - r)^m,
+# [((d, c), m), ...] pour les (x^2 + cx + d)^m.
+FACTORED = {
+    'real': ([(3, 3), (-2, 2)], []),
+    'complex': ([(4, 1)], [((2, 2), 3)]),
+    'mixed': ([(-5, 2), (2, 1)], [((3, -1), 2)]),
+}
+NUMERATORS = [[1, -2, 0.5], [2, 0, -1, 4, 0, 0, 1, 3]]  # Le second a une partie entière
+
+
+def expand(real_roots, quadratic_factors):
+    poly_down = [1.0]
+    for root, multiplicity in real_roots:
+        poly_down = polynomial.polymul(poly_down, polynomial.polypow([-root, 1], multiplicity))
+    for (d, c), multiplicity in quadratic_factors:
+        poly_down = polynomial.polymul(poly_down, polynomial.polypow([d, c, 1], multiplicity))
+    return list(poly_down)
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    random.seed(0)  # Muller part de points aléatoires
+
+
+@pytest.mark.parametrize('name', FACTORED)
+@pytest.mark.parametrize('poly_up', NUMERATORS)
+@pytest.mark.parametrize('method', ['matrix', 'residues', 'hermite'])
+def test_repeated_poles(name, poly_up, method):
+    poly_down = expand(*FACTORED[name])
+    expected = reference_integral(poly_up, poly_down, -1, 1)
+    value = calc_integral(poly_up, poly_down, -1, 1, square_free=True, method=method)
+    # Les facteurs de Yun sont calculés en flottants (erreur de l'ordre de 1e-12 sur leurs coefficients), et la partie
+    # entière du second numérateur se compense presque avec le reste : l'erreur relative atteint quelques 1e-10.
+    assert value == pytest.approx(expected, rel=1e-8)
+
+
+@pytest.mark.parametrize('name', FACTORED)
+@pytest.mark.parametrize('method', ['residues', 'matrix'])
+def test_factored_matches_expanded(name, method):
+    poly_up = NUMERATORS[1]
+    real_roots, quadratic_factors = FACTORED[name]
+    value = calc_integral_factored(poly_up, real_roots, quadratic_factors, -1, 1, leading_coeff=2, method=method)
+    expected = reference_integral(poly_up, list(2 * np.array(expand(real_roots, quadratic_factors))), -1, 1)
+    assert value == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize('power', [2, 3, 4])
+def test_type2_power(power):
+    # A = 3, B = -1 (poly_up = [B, A]) sur (x^2 - 2x + 5)^n : alpha et beta différents de 0 et 1.
+    poly_up, poly_down = [-1, 3], [5, -2, 1]
+    expected = reference_integral(poly_up, list(polynomial.polypow(poly_down, power)), -1, 2)
+    assert calc_type2_power(power, poly_up, poly_down, -1, 2) == pytest.approx(expected, rel=1e-12)
+    assert calc_integral_type2(poly_up, poly_down, power, -1, 2) == pytest.approx(expected, rel=1e-12)
+    expected = reference_integral([1], list(polynomial.polypow(poly_down, power)), -1, 2)
+    assert calc_type2_power_simple(power, poly_down, -1, 2) == pytest.approx(expected, rel=1e-12)
+
+
+def test_cache():
+    cache = DecompositionCache()
+    poly_down = expand(*FACTORED['mixed'])
+    for poly_up in NUMERATORS:
+        expected = reference_integral(poly_up, poly_down, -1, 1)
+        assert calc_integral(poly_up, poly_down, -1, 1, cache=cache, square_free=True) == \
+            pytest.approx(expected, rel=1e-10)
+        # Même dénominateur à un facteur près : même entrée du cache.
+        assert calc_integral(poly_up, list(3 * np.array(poly_down)), -1, 1, cache=cache, square_free=True) == \
+            pytest.approx(expected / 3, rel=1e-10)
+    assert (cache.misses, cache.hits) == (1, 3)
+
+
+def test_shared_cache():
+    cache = SharedDecompositionCache()
+    poly_down = expand(*FACTORED['complex'])
+    values = [calc_integral(NUMERATORS[0], poly_down, -1, 1, cache=cache, square_free=True) for _ in range(2)]
+    assert values[0] == values[1] == pytest.approx(reference_integral(NUMERATORS[0], poly_down, -1, 1), rel=1e-10)
+    assert cache.stats()['hits'] == 1
+
+
+def test_intervals_and_numerators():
+    poly_down = expand(*FACTORED['real'])
+    a, b = np.array([-1.0, 0.0, -1.5]), np.array([1.0, 0.5, 1.5])
+    expected = np.array([[reference_integral(poly_up, poly_down, a[k], b[k]) for k in range(3)]
+                         for poly_up in NUMERATORS])
+
+    values = [calc_integral_intervals(poly_up, poly_down, a, b, square_free=True) for poly_up in NUMERATORS]
+    assert np.allclose(values, expected, rtol=1e-10, atol=0)
+
+    polys_up = np.zeros((2, len(NUMERATORS[1])))
+    polys_up[0, :len(NUMERATORS[0])], polys_up[1] = NUMERATORS[0], NUMERATORS[1]
+    values = np.array([calc_integral_numerators(polys_up, poly_down, a[k], b[k], square_free=True)
+                       for k in range(3)]).T
+    assert np.allclose(values, expected, rtol=1e-10, atol=0)
+
+    table = BasisIntegralTable(poly_down, a, b, polys_up.shape[1] - 1, square_free=True)
+    assert np.allclose(table.integrate(polys_up), expected, rtol=1e-10, atol=0)
+
+
+def missing_roots(coefficients):
+    return []  # Une recherche des racines qui échoue complètement
+
+
+@pytest.mark.filterwarnings('ignore::utils.square_free.SquareFreeWarning')  # Repli sans facteur carré, qui échoue aussi
+@pytest.mark.parametrize('options', [{}, {'method': 'residues'}, {'cache': DecompositionCache()}])
+def test_missing_roots_raise(options):
+    # Sans racines, la décomposition n'a pas d'élément simple : l'intégrale valait 0 au lieu de lever une erreur.
+    with pytest.raises(RootFindingError):
+        calc_integral([1], [2, 1, 1], 0, 1, backend=missing_roots, **options)
+    assert calc_integral([1], [2.0], 0, 1, backend=missing_roots, **options) == pytest.approx(0.5)
+
+
+@pytest.mark.filterwarnings('ignore::utils.square_free.SquareFreeWarning')
+@pytest.mark.parametrize('cache', [None, DecompositionCache()])
+def test_missing_roots_raise_batch(cache):
+    with pytest.raises(RootFindingError):
+        calc_integral_numerators([[1, 0], [0, 1]], [2, 1, 1], 0, 1, cache=cache, backend=missing_roots)
@@ -0,0 +1,42 @@
+"""
+Tests des niveaux de précision (utils/precision.py).
+"""
+import random
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+from main import calc_integral
+from utils.precision import PRECISION_PRESETS, get_precision
+from benchmarks.problems import generate_problems, reference_integral
+
+
+def test_get_precision():
+    assert get_precision() is PRECISION_PRESETS['default']
+    assert get_precision('high').square_free
+    policy = PRECISION_PRESETS['high']._replace(tol=1e-13)
+    assert get_precision(policy) is policy
+    with pytest.raises(ValueError):
+        get_precision('exact')
+
+
+@pytest.mark.parametrize('poly_down', [
+    polynomial.polymul(polynomial.polypow([-3, 1], 3), polynomial.polypow([2, 1], 2)),
+    polynomial.polymul(polynomial.polypow([1, 1, 1], 4), [-4, 1]),
+])
+def test_high_tier_repeated_poles(poly_down):
+    poly_up, poly_down = [1, -2, 0.5], list(poly_down)
+    reference = reference_integral(poly_up, poly_down, -1, 1)
+    value = calc_integral(poly_up, poly_down, -1, 1, precision='high')
+    assert value == pytest.approx(reference, rel=1e-12)
+
+
+def test_high_tier_is_most_accurate():
+    errors = {tier: [] for tier in PRECISION_PRESETS}
+    for problem in generate_problems(('degree', 'multiplicity')):
+        args = (problem['poly_up'], problem['poly_down'], problem['a'], problem['b'])
+        reference = reference_integral(*args)
+        for tier in PRECISION_PRESETS:
+            random.seed(0)
+            errors[tier].append(abs(calc_integral(*args, precision=tier) - reference) / abs(reference))
+    assert max(errors['high']) < 1e-9
+    assert np.median(errors['high']) <= np.median(errors['default']) <= np.median(errors['fast'])
@@ -0,0 +1,66 @@
+"""
+Tests des backends de recherche des racines (utils/roots.py) et de leur politique de précision.
+"""
+import random
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+from main import calc_integral
+from utils.precision import PRECISION_PRESETS
+from utils.roots import MullerSweep, find_roots
+from benchmarks.problems import reference_integral
+
+POLY = list(polynomial.polyfromroots([-3, -1, 0.5, 2, 4]))
+
+
+@pytest.mark.parametrize('backend', ['muller', 'companion', 'aberth'])
+def test_backends_find_roots(backend):
+    random.seed(0)
+    roots = sorted(np.real(find_roots(POLY, backend)))
+    assert roots == pytest.approx([-3, -1, 0.5, 2, 4], abs=1e-9)
+
+
+@pytest.mark.parametrize('backend', ['muller', 'companion', 'aberth'])
+@pytest.mark.parametrize('power', [2, 3])
+def test_backends_find_power_roots(backend, power):
+    # x^n : la borne de Fujiwara est nulle, Aberth partait de points tous confondus (corrections nan).
+    random.seed(0)
+    roots = find_roots([0] * power + [1], backend)
+    assert len(roots) == power
+    assert np.max(np.abs(roots)) < 1e-6
+    expected = {2: 0.5 + np.log(2), 3: 0.875}[power]  # Intégrales de (1 + x) / x^n entre 1 et 2
+    assert calc_integral([1, 1], [0] * power + [1], 1, 2, backend=backend) == pytest.approx(expected, rel=1e-9)
+
+
+def test_aberth_uses_precision():
+    policy = PRECISION_PRESETS['default']._replace(max_iter=1)
+    roots = find_roots(POLY, 'aberth', policy)
+    assert np.max(np.abs(np.polyval(POLY[::-1], roots))) > 1e-3  # Une seule itération : pas encore convergé
+    roots = find_roots(POLY, 'aberth', 'high')
+    assert sorted(np.real(roots)) == pytest.approx([-3, -1, 0.5, 2, 4], abs=1e-12)
+
+
+def test_muller_sweep_uses_precision():
+    sweep = MullerSweep()
+    random.seed(0)
+    sweep(POLY, PRECISION_PRESETS['default']._replace(max_iter=1, attempts=1))
+    assert len(sweep.roots) < 5  # Muller ne converge pas en une itération
+    sweep.reset()
+    random.seed(0)
+    value = calc_integral([1], POLY, 5, 6, backend=sweep, precision='high')
+    assert value == pytest.approx(calc_integral([1], POLY, 5, 6, backend='companion'), rel=1e-12)
+    random.seed(0)
+    assert len(MullerSweep(max_iter=1, attempts=1)(POLY, 'high')) < 5  # Les arguments donnés l'emportent
+
+
+def test_fast_muller_survives_degenerate_steps():
+    # Avec ce tirage, une tentative de Muller retombe sur un point précédent (x2 = x0) : le noyau rapide levait
+    # ZeroDivisionError au lieu de passer à la tentative suivante.
+    rng = np.random.default_rng(0)
+    poly_down = list(rng.standard_normal(31))
+    poly_down[0] += 50
+    random.seed(0)
+    assert len(find_roots(poly_down, 'muller')) == 30
+    random.seed(0)
+    expected = reference_integral([1], poly_down, 0, 0.5)
+    assert calc_integral([1], poly_down, 0, 0.5) == pytest.approx(expected, rel=1e-6)  # Racines arrondies à 1e-7
@@ -0,0 +1,46 @@
+"""
+Tests du serveur de calcul (utils/server.py).
+"""
+import json
+import os
+import socket
+import threading
+import numpy as np
+import pytest
+from utils.server import IntegrationService, make_server
+
+
+def test_handle():
+    service = IntegrationService()
+    response = service.handle(json.dumps({'id': 3, 'poly_up': [1], 'poly_down': [1, 0, 1], 'a': 0, 'b': 1}))
+    assert response['id'] == 3
+    assert np.isclose(response['result'], np.pi / 4, rtol=1e-12)
+    assert 'error' in service.handle('{"poly_up": [1], "a": 0, "b": 1}')
+    assert service.stats()['requests'] == 2
+    assert service.stats()['errors'] == 1
+
+
+def test_unix_socket_refuses_regular_file(tmp_path):
+    path = tmp_path / 'main.py'
+    path.write_text('source')
+    with pytest.raises(FileExistsError):
+        make_server(IntegrationService(), unix_socket=str(path))
+    assert path.read_text() == 'source'
+
+
+def test_unix_socket_replaces_stale_socket(tmp_path):
+    path = str(tmp_path / 'server.sock')
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()
+    server = make_server(IntegrationService(), unix_socket=path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with socket.socket(socket.AF_UNIX) as connection:
+            connection.connect(path)
+            connection.sendall(b'{"poly_up": [1], "poly_down": [1, 0, 1], "a": 0, "b": 1}\n')
+            assert np.isclose(json.loads(connection.makefile('rb').readline())['result'], np.pi / 4)
+    finally:
+        server.shutdown()
+        server.server_close()
+        os.remove(path)
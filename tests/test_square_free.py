@@ -0,0 +1,41 @@
+"""
+Tests de la décomposition sans facteur carré (utils/square_free.py) et de ses signalements d'échec.
+"""
+import random
+import warnings
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+from main import calc_integral
+from utils.square_free import SquareFreeWarning, polynomial_gcd, square_free_roots, yun_square_free
+
+
+def test_yun_multiplicities():
+    poly = polynomial.polymul(polynomial.polypow([1, 0, 1], 8), polynomial.polypow([-3, 1], 5))
+    factors = yun_square_free(poly)
+    assert [multiplicity for _, multiplicity in factors] == [5, 8]
+    assert np.allclose(factors[0][0], [-3, 1])
+    assert np.allclose(factors[1][0], [1, 0, 1])
+
+
+def test_square_free_roots():
+    poly = polynomial.polymul(polynomial.polypow([-3, 1], 3), polynomial.polypow([2, 1], 2))
+    unique, count = square_free_roots(poly)
+    assert sorted(zip(np.real(unique), count)) == [(pytest.approx(-2), 2), (pytest.approx(3), 3)]
+
+
+def test_constant_polynomial():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert yun_square_free([3.0]) == []
+        assert np.allclose(polynomial_gcd([2.0, 1.0], [0.0]), [2, 1])
+        assert calc_integral([1], [2.0], 0, 1, square_free=True) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize('options', [{'square_free': True}, {'method': 'hermite'}])
+def test_failure_is_signalled(options):
+    # Hors du domaine de validité : le PGCD numérique ne voit pas la multiplicité 16.
+    poly_down = list(polynomial.polypow([2, 2, 1], 16))
+    random.seed(0)  # Avec d'autres tirages, Muller peut aussi manquer des racines : RootFindingError
+    with pytest.warns(SquareFreeWarning):
+        calc_integral([1], poly_down, 0, 1, **options)
@@ -0,0 +1,133 @@
+"""
+Ce fichier contient le front-end asyncio de calc_integral : les calculs sont faits dans un exécuteur (par défaut, un
+ThreadPoolExecutor), la boucle d'événements n'est donc jamais bloquée par Muller.
+
+Regroupement des requêtes en vol : toutes les requêtes concurrentes qui ont exactement le même dénominateur (et les
+mêmes options) forment un groupe. Deux dénominateurs proportionnels forment deux groupes (leurs intégrales diffèrent),
+mais leur analyse n'est faite qu'une fois, le cache partagé utilisant le dénominateur normalisé comme clé.
+- L'analyse du dénominateur (racines, matrice d'identification) n'est faite qu'une fois pour le groupe, dans le cache
+  partagé.
+- Les requêtes du groupe qui ont aussi le même numérateur partagent une seule décomposition (RationalIntegral), évaluée
+  sur toutes leurs bornes en un seul appel vectorisé.
+Les requêtes qui arrivent pendant l'analyse du dénominateur rejoignent le groupe ; celles qui arrivent après forment un
+nouveau groupe (qui trouve le dénominateur dans le cache).
+
+Contre-pression : au plus max_pending requêtes sont en cours. Au-delà, integrate attend qu'une place se libère
+(overflow='wait') ou lève asyncio.QueueFull (overflow='reject'), pour que la latence reste prévisible sous charge.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from utils.cache import SharedDecompositionCache
+from utils.rational_integral import RationalIntegral
+
+OVERFLOW_POLICIES = ('wait', 'reject')
+
+
+class AsyncIntegrator:
+    """
+    S'utilise depuis une coroutine :
+        integrator = AsyncIntegrator()
+        value = await integrator.integrate(poly_up, poly_down, a, b)
+    options : les options de calc_integral (backend, method, square_free, precision), communes à toutes les requêtes.
+    stats : 'requests', 'groups' (analyses de dénominateur), 'decompositions' et 'rejected'.
+    """
+
+    def __init__(self, executor=None, max_pending=1024, overflow='wait', cache_size=1024, **options):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Politique inconnue : {overflow!r} (choix : {', '.join(OVERFLOW_POLICIES)})")
+        self.executor = ThreadPoolExecutor() if executor is None else executor
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.cache = SharedDecompositionCache(cache_size)
+        self.options = options
+        self.stats = {'requests': 0, 'groups': 0, 'decompositions': 0, 'rejected': 0}
+        self.pending = 0  # Nombre de requêtes en cours
+        self._slots = None  # Le sémaphore est créé dans la boucle d'événements, au premier appel
+        self._groups = {}  # Dénominateur -> requêtes en attente [(poly_up, a, b, future), ...]
+        self._tasks = set()  # Références vers les tâches des groupes en cours
+
+    async def integrate(self, poly_up: list, poly_down: list, a, b):
+        """
+        Intégrale de poly_up / poly_down entre a et b (scalaires).
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        if self.overflow == 'reject' and self._slots.locked():
+            self.stats['rejected'] += 1
+            raise asyncio.QueueFull(f"plus de {self.max_pending} requêtes en cours")
+
+        async with self._slots:
+            self.pending += 1
+            self.stats['requests'] += 1
+            try:
+                future = asyncio.get_running_loop().create_future()
+                key = tuple(float(coefficient) for coefficient in poly_down)
+                group = self._groups.get(key)
+                if group is None:  # Premier de son groupe : on lance l'analyse du dénominateur
+                    group = self._groups[key] = []
+                    task = asyncio.ensure_future(self._run_group(key, list(key)))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                group.append((tuple(poly_up), float(a), float(b), future))
+                return await future
+            finally:
+                self.pending -= 1
+
+    async def _run_group(self, key, poly_down):
+        """
+        Analyse le dénominateur du groupe, puis calcule toutes les requêtes qui l'ont rejoint entre-temps.
+        """
+        loop = asyncio.get_running_loop()
+        self.stats['groups'] += 1
+        try:
+            if self.options.get('method', 'matrix') != 'hermite':
+                await loop.run_in_executor(self.executor, self.cache.get_denominator, poly_down,
+                                           self.options.get('backend', 'muller'),
+                                           self.options.get('square_free', False),
+                                           self.options.get('precision'))
+        except Exception as error:
+            self._fail(self._groups.pop(key), error)
+            return
+        requests = self._groups.pop(key)  # Les requêtes suivantes formeront un nouveau groupe
+
+        by_numerator = {}
+        for poly_up, a, b, future in requests:
+            by_numerator.setdefault(poly_up, []).append((a, b, future))
+        self.stats['decompositions'] += len(by_numerator)
+        await asyncio.gather(*(self._run_numerator(list(poly_up), poly_down, bounds)
+                               for poly_up, bounds in by_numerator.items()))
+
+    async def _run_numerator(self, poly_up, poly_down, bounds):
+        """
+        Calcule, dans l'exécuteur, toutes les requêtes d'un groupe qui ont le même numérateur.
+        """
+        try:
+            values = await asyncio.get_running_loop().run_in_executor(self.executor, self._evaluate, poly_up,
+                                                                      poly_down, bounds)
+        except Exception as error:
+            self._fail(bounds, error)
+            return
+        for (_, _, future), value in zip(bounds, values):
+            if not future.done():
+                future.set_result(float(value))
+
+    def _evaluate(self, poly_up, poly_down, bounds):
+        """
+        Exécuté dans l'exécuteur : une décomposition, évaluée sur toutes les bornes à la fois.
+        """
+        a = np.array([bound[0] for bound in bounds])
+        b = np.array([bound[1] for bound in bounds])
+        return RationalIntegral(poly_up, poly_down, cache=self.cache, **self.options).integrate(a, b)
+
+    @staticmethod
+    def _fail(requests, error):
+        for *_, future in requests:
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self):
+        """
+        Arrête l'exécuteur (à appeler quand l'intégrateur n'est plus utilisé).
+        """
+        self.executor.shutdown(wait=False)
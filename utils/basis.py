@@ -0,0 +1,84 @@
+"""
+Ce fichier contient la table des intégrales de base : pour un dénominateur et des intervalles fixés, les intégrales
+de x^k / poly_down sur chaque intervalle, pour k = 0, ..., max_degree.
+L'intégrale est linéaire en le numérateur : l'intégrale de poly_up / poly_down est alors un simple produit scalaire
+entre les coefficients de poly_up et la table (un produit matriciel pour beaucoup de numérateurs et d'intervalles).
+La table est construite une seule fois (division euclidienne de chaque monôme, décomposition en éléments simples,
+intégrales de type 1 et 2), peut être enregistrée, puis rechargée au moment des calculs.
+"""
+import numpy as np
+from utils.batch import get_floor_polynomials, get_remainder_constants
+from utils.decomposition import get_column_integrals
+
+
+def get_power_integrals(degree, a, b):
+    """
+    Intégrales de x^j entre a et b, pour j = 0, ..., degree - 1. Retourne un tableau de forme (degree,) + forme de a, b.
+    """
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    powers = np.arange(1, degree + 1).reshape((degree,) + (1,) * np.broadcast(a, b).ndim)
+    # Primitive de x^j : x^(j+1) / (j+1)
+    return (b ** powers - a ** powers) / powers
+
+
+class BasisIntegralTable:
+    """
+    table[k] : l'intégrale de x^k / poly_down sur chaque intervalle [a, b] (forme de a et b diffusés), k allant de 0
+    à max_degree.
+    cache, backend, square_free, precision : les options de l'analyse du dénominateur (voir analyse_denominator).
+
+    L'objet ne contient que des tableaux NumPy : il est sérialisable avec pickle, ou avec save / load (fichier .npz).
+    """
+    __slots__ = ('poly_down', 'a', 'b', 'table')
+
+    def __init__(self, poly_down: list, a, b, max_degree: int, cache=None, backend='muller', square_free=False,
+                 precision=None):
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        # Chaque monôme x^k est un numérateur : une ligne de la matrice identité.
+        quotients, remainders = get_floor_polynomials(np.eye(max_degree + 1), poly_down)
+        unique, count, constants = get_remainder_constants(remainders, poly_down, cache, backend, square_free,
+                                                           precision)
+        columns = get_column_integrals(unique, count, a, b)  # (nombre de constantes,) + forme de a, b
+        table = np.tensordot(constants, columns, axes=1) / poly_down[-1]
+        if quotients.shape[1]:  # Parties entières (monômes de degré au moins celui du dénominateur)
+            table += np.tensordot(quotients, get_power_integrals(quotients.shape[1], a, b), axes=1)
+        self._set_table(poly_down, a, b, table)
+
+    def _set_table(self, poly_down, a, b, table):
+        self.poly_down = np.array(poly_down, dtype=float)
+        self.a = np.array(a, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.table = np.array(table, dtype=float)
+
+    @property
+    def max_degree(self):
+        return self.table.shape[0] - 1
+
+    def integrate(self, poly_up):
+        """
+        Intégrale de poly_up / poly_down sur chaque intervalle.
+        poly_up : coefficients par puissances croissantes (forme (n,)), ou un numérateur par ligne (forme (m, n)),
+        de degré au plus max_degree.
+        Retourne un tableau de forme (forme de a, b) ou (m,) + (forme de a, b).
+        """
+        poly_up = np.asarray(poly_up, dtype=float)
+        if poly_up.shape[-1] > self.table.shape[0]:
+            raise ValueError(f"Numérateur de degré {poly_up.shape[-1] - 1} : la table s'arrête au degré "
+                             f"{self.max_degree}")
+        return np.tensordot(poly_up, self.table[:poly_up.shape[-1]], axes=1)
+
+    def save(self, path):
+        """
+        Enregistre la table dans un fichier .npz.
+        """
+        np.savez(path, poly_down=self.poly_down, a=self.a, b=self.b, table=self.table)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Recharge une table enregistrée avec save.
+        """
+        with np.load(path) as arrays:
+            obj = cls.__new__(cls)
+            obj._set_table(arrays['poly_down'], arrays['a'], arrays['b'], arrays['table'])
+        return obj
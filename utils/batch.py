@@ -0,0 +1,179 @@
+"""
+Ce fichier contient les fonctions de calcul par lots :
+- beaucoup de numérateurs pour un même dénominateur : l'analyse du dénominateur et la factorisation du système
+  d'identification ne sont faites qu'une seule fois, puis tous les seconds membres sont résolus d'un coup ;
+- beaucoup de fractions rationnelles différentes, de mêmes degrés : tous les calculs sont faits sur des tableaux
+  empilés (une fraction par ligne).
+"""
+import numpy as np
+from utils.decomposition import analyse_denominator, get_column_integrals
+from utils.decomposition import decompose_rational, evaluate_decomposition
+
+
+def get_floor_polynomials(polys_up, poly_down):
+    """
+    Division euclidienne de plusieurs numérateurs (un par ligne de polys_up, coefficients par puissances croissantes)
+    par le même dénominateur, ou par un dénominateur par ligne si poly_down est un tableau 2-D de même degré.
+    La boucle porte sur les degrés, chaque étape traite tous les numérateurs à la fois.
+    Retourne (quotients, remainders), de formes (m, max(deg_up - deg_down + 1, 0)) et (m, deg_down).
+    """
+    remainders = np.array(polys_up, dtype=float, ndmin=2).copy()
+    poly_down = np.array(poly_down, dtype=float, ndmin=2)  # (1, deg_down + 1) ou (m, deg_down + 1)
+    degree_down = poly_down.shape[1] - 1
+    quotient_size = max(remainders.shape[1] - degree_down, 0)
+    quotients = np.zeros((remainders.shape[0], quotient_size))
+
+    for k in range(remainders.shape[1] - 1, degree_down - 1, -1):  # Du plus haut degré vers le degré du dénominateur
+        factor = remainders[:, k] / poly_down[:, -1]
+        quotients[:, k - degree_down] = factor
+        remainders[:, k - degree_down:k + 1] -= factor[:, None] * poly_down
+
+    if remainders.shape[1] < degree_down:  # Numérateurs plus petits que le dénominateur : on complète par des 0
+        remainders = np.pad(remainders, ((0, 0), (0, degree_down - remainders.shape[1])))
+    return quotients, remainders[:, :degree_down]
+
+
+def integrate_floored_polynomials(quotients, a, b):
+    """
+    Intégrale entre a et b de chaque partie entière (une par ligne de quotients).
+    a et b sont des scalaires ou des tableaux de forme (m,).
+    """
+    if quotients.shape[1] == 0:
+        return np.zeros(quotients.shape[0])
+    powers = np.arange(1, quotients.shape[1] + 1)
+    a = np.asarray(a, dtype=float)[..., None]
+    b = np.asarray(b, dtype=float)[..., None]
+    # Primitive de x^k : x^(k+1) / (k+1)
+    return np.sum(quotients * (b ** powers - a ** powers) / powers, axis=-1)
+
+
+def get_remainder_constants(remainders, poly_down: list, cache=None, backend='muller', square_free=False,
+                            precision=None):
+    """
+    Décomposition en éléments simples de plusieurs restes (un par ligne de remainders, de forme (m, deg_down)) sur le
+    même dénominateur : une seule analyse du dénominateur, tous les seconds membres résolus d'un coup.
+    Retourne (unique, count, constants), constants étant de forme (m, nombre de constantes).
+    """
+    # Le système d'identification a une ligne de plus que d'inconnues (la ligne du x^deg, nulle) : on complète les
+    # seconds membres, comme get_identification_rhs.
+    rhs = np.pad(remainders, ((0, 0), (0, 1)))
+
+    if cache is not None:
+        entry = cache.get_denominator(poly_down, backend, square_free, precision)
+        return entry['unique'], entry['count'], rhs @ entry['solver'].T
+
+    unique, count, whole_matrix = analyse_denominator(poly_down, backend, square_free, precision)
+    if len(poly_down) == 1:  # Dénominateur constant : pas d'élément simple.
+        return unique, count, np.zeros((rhs.shape[0], 0))
+    # Tous les seconds membres sont résolus d'un coup, avec une seule factorisation.
+    return unique, count, np.linalg.lstsq(whole_matrix, rhs.T, rcond=None)[0].T
+
+
+def calc_integral_numerators(polys_up, poly_down: list, a, b, cache=None, backend='muller', square_free=False,
+                             precision=None):
+    """
+    Calcule l'intégrale de polys_up[k] / poly_down entre a et b pour chaque numérateur k.
+
+    polys_up : tableau 2-D (m, n), un numérateur par ligne (coefficients par puissances croissantes, complétés par
+    des 0 à droite si les degrés diffèrent).
+    a, b : scalaires (même intervalle pour tous) ou tableaux de forme (m,) (un intervalle par numérateur).
+    cache : un DecompositionCache optionnel (voir utils/cache.py).
+    backend, square_free, precision : les options de l'analyse du dénominateur (voir analyse_denominator).
+
+    Retourne un tableau de forme (m,).
+    """
+    quotients, remainders = get_floor_polynomials(polys_up, poly_down)
+    unique, count, constants = get_remainder_constants(remainders, poly_down, cache, backend, square_free, precision)
+
+    columns = get_column_integrals(unique, count, a, b)  # (nombre de constantes,) ou (nombre de constantes, m)
+    integrals = np.einsum('k...,...k->...', columns, constants)
+    integrals = integrals / poly_down[-1]
+    return integrals + integrate_floored_polynomials(quotients, a, b)
+
+
+def stacked_companion_roots(polys_down):
+    """
+    Racines de plusieurs polynômes de même degré (un par ligne, coefficients par puissances croissantes), calculées
+    comme valeurs propres de leurs matrices compagnons empilées : un seul appel à np.linalg.eigvals pour tout le lot.
+    Retourne un tableau complexe de forme (m, deg).
+    """
+    polys_down = np.array(polys_down, dtype=float, ndmin=2)
+    degree = polys_down.shape[1] - 1
+    monic = polys_down[:, :-1] / polys_down[:, -1:]
+    companion = np.zeros((polys_down.shape[0], degree, degree))
+    companion[:, 1:, :-1] = np.eye(degree - 1)  # Sous-diagonale de 1
+    companion[:, :, -1] = -monic  # Dernière colonne : -coefficients du polynôme unitaire
+    return np.linalg.eigvals(companion)
+
+
+def stacked_deflated_polynomials(polys_down, roots):
+    """
+    Pour chaque ligne n et chaque racine r_k, les coefficients (puissances croissantes) de Q_n(x) / (x - r_k), où Q_n
+    est le dénominateur n rendu unitaire. C'est la colonne de la matrice d'identification associée à l'élément simple
+    c_k / (x - r_k). Division synthétique vectorisée sur toutes les lignes et toutes les racines.
+    Retourne un tableau complexe de forme (m, deg, deg) : [n, i, k] = coefficient de x^i pour la racine k.
+    """
+    polys_down = np.array(polys_down, dtype=float, ndmin=2)
+    degree = polys_down.shape[1] - 1
+    monic = polys_down / polys_down[:, -1:]
+    deflated = np.zeros((polys_down.shape[0], degree, degree), dtype=complex)
+    deflated[:, degree - 1, :] = 1
+    for i in range(degree - 1, 0, -1):  # b_(i-1) = q_i + r * b_i
+        deflated[:, i - 1, :] = monic[:, i, None] + roots * deflated[:, i, :]
+    return deflated
+
+
+def calc_integral_stacked(polys_up, polys_down, a, b, epsilon=1e-4, cache=None, backend='muller', square_free=True,
+                          precision=None):
+    """
+    Calcule l'intégrale de polys_up[n] / polys_down[n] entre a[n] et b[n] pour chaque ligne n.
+
+    polys_up : tableau (N, deg_up + 1), polys_down : tableau (N, deg_down + 1), coefficients par puissances
+    croissantes ; toutes les lignes ont les mêmes degrés.
+    a, b : scalaires ou tableaux de forme (N,).
+
+    Toutes les fractions sont traitées ensemble : racines par valeurs propres des matrices compagnons empilées,
+    décomposition sur les racines complexes c_k / (x - r_k) par un seul np.linalg.solve empilé, puis intégration
+    vectorisée par le logarithme complexe. Une paire de racines conjuguées donne les mêmes log et arctan que
+    calc_integral_type2, donc les lignes peuvent mélanger racines réelles et complexes sans traitement particulier.
+
+    Les lignes dont deux racines sont à moins de epsilon (racines multiples) ne rentrent pas dans ce schéma :
+    elles sont calculées une par une avec decompose_rational, avec les options cache, backend, square_free et
+    precision (voir calc_integral). square_free vaut True par défaut : ces lignes ont des racines multiples, dont le
+    regroupement à epsilon près serait bien moins précis que la décomposition sans facteur carré.
+    """
+    polys_up = np.array(polys_up, dtype=float, ndmin=2)
+    polys_down = np.array(polys_down, dtype=float, ndmin=2)
+    count = polys_down.shape[0]
+    a = np.broadcast_to(np.asarray(a, dtype=float), (count,))
+    b = np.broadcast_to(np.asarray(b, dtype=float), (count,))
+
+    quotients, remainders = get_floor_polynomials(polys_up, polys_down)
+    result = integrate_floored_polynomials(quotients, a, b)
+    if polys_down.shape[1] == 1:  # Dénominateurs constants : il n'y a que la partie entière.
+        return result
+
+    roots = stacked_companion_roots(polys_down).astype(complex)  # eigvals rend un tableau réel si toutes les racines le sont
+    roots.imag[np.abs(roots.imag) < 1e-12 * (1 + np.abs(roots.real))] = 0  # Racines réelles à l'erreur d'arrondi près
+
+    # On repère les lignes avec des racines multiples (distance minimale entre deux racines trop petite).
+    distances = np.abs(roots[:, :, None] - roots[:, None, :])
+    distances[:, np.arange(roots.shape[1]), np.arange(roots.shape[1])] = np.inf
+    simple = distances.min(axis=(1, 2)) > epsilon
+
+    matrices = stacked_deflated_polynomials(polys_down[simple], roots[simple])
+    constants = np.linalg.solve(matrices, remainders[simple][..., None].astype(complex))[..., 0]
+    constants /= polys_down[simple, -1:]
+
+    # Une primitive de c / (x - r) est c.log(x - r) : pour x réel et r non réel, x - r ne traverse jamais la coupure
+    # du logarithme complexe. La partie réelle de la somme donne les log |.| et arctan des éléments réels.
+    simple_roots = roots[simple]
+    left = np.log(b[simple, None] - simple_roots)
+    right = np.log(a[simple, None] - simple_roots)
+    result[simple] += np.sum(constants * (left - right), axis=1).real
+
+    for n in np.flatnonzero(~simple):  # Repli sur le calcul classique pour les racines multiples
+        floored_poly_up, unique, multiplicity, row_constants = decompose_rational(
+            list(polys_up[n]), list(polys_down[n]), cache, backend, square_free, precision=precision)
+        result[n] = evaluate_decomposition(floored_poly_up, unique, multiplicity, row_constants, polys_down[n, -1], a[n], b[n])
+    return result
@@ -0,0 +1,180 @@
+"""
+Ce fichier contient les entrées / sorties en masse : des millions de calculs stockés dans des tableaux binaires
+(.npz, dossier de .npy, ou tampons mémoire quelconques), lus par projection en mémoire (memmap) sans copie, intégrés
+par tranches, et dont les résultats sont écrits dans un tableau lui aussi projeté en mémoire. Seule une tranche est
+en mémoire vive à la fois : le lot peut être bien plus grand que la RAM.
+
+Format (N calculs) :
+- poly_up : (N, U), poly_down : (N, D) : les coefficients par puissances croissantes, complétés par des 0 à droite,
+- a, b : (N,) : les bornes,
+- degree_up, degree_down : (N,), optionnels : les degrés (sinon, déduits du dernier coefficient non nul).
+"""
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from numpy.lib import format as npy_format
+from utils.integral import calc_integral
+from utils.batch import calc_integral_stacked
+from utils.cache import DecompositionCache
+
+BULK_FIELDS = ('poly_up', 'poly_down', 'a', 'b', 'degree_up', 'degree_down')
+BULK_ENGINES = ('stacked', 'scalar')
+STACKED_OPTIONS = ('backend', 'square_free', 'precision')  # Options de calc_integral utiles au moteur empilé
+
+
+def save_bulk(path, poly_up, poly_down, a, b, degree_up=None, degree_down=None):
+    """
+    Enregistre un lot de calculs dans un .npz non compressé (qui peut donc être relu par projection en mémoire).
+    """
+    arrays = {'poly_up': poly_up, 'poly_down': poly_down, 'a': a, 'b': b}
+    if degree_up is not None:
+        arrays['degree_up'] = degree_up
+    if degree_down is not None:
+        arrays['degree_down'] = degree_down
+    np.savez(path, **arrays)
+
+
+def memmap_npz_member(path, name):
+    """
+    Projette en mémoire le tableau name d'un .npz, sans le charger. Les membres d'un .npz non compressé sont des .npy
+    stockés tels quels dans l'archive : on lit leur en-tête, puis on projette les données à leur position dans le
+    fichier. Un membre compressé ne peut pas être projeté : il est alors chargé en mémoire.
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(name + '.npy')
+        compressed = info.compress_type != zipfile.ZIP_STORED
+    if compressed:
+        return np.load(path)[name]
+    with open(path, 'rb') as file:
+        file.seek(info.header_offset + 26)  # En-tête local du zip : longueurs du nom et du champ extra aux octets 26-29
+        name_length, extra_length = np.frombuffer(file.read(4), dtype='<u2')
+        file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = npy_format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+        offset = file.tell()
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
+
+def load_bulk(path):
+    """
+    Ouvre un lot de calculs sans le charger : un .npz (voir save_bulk) ou un dossier contenant poly_up.npy,
+    poly_down.npy, a.npy, b.npy (et éventuellement degree_up.npy, degree_down.npy).
+    Retourne un dictionnaire de tableaux projetés en mémoire.
+    """
+    arrays = {}
+    if os.path.isdir(path):
+        for field in BULK_FIELDS:
+            file = os.path.join(path, field + '.npy')
+            if os.path.exists(file):
+                arrays[field] = np.load(file, mmap_mode='r')
+    else:
+        with zipfile.ZipFile(path) as archive:
+            names = {name[:-4] for name in archive.namelist()}
+        for field in BULK_FIELDS:
+            if field in names:
+                arrays[field] = memmap_npz_member(path, field)
+    missing = [field for field in BULK_FIELDS[:4] if field not in arrays]
+    if missing:
+        raise ValueError(f"Champs manquants dans {path} : {', '.join(missing)}")
+    return arrays
+
+
+def open_output(path, size):
+    """
+    Crée le fichier .npy des résultats (size flottants), projeté en mémoire en écriture.
+    """
+    return npy_format.open_memmap(path, mode='w+', dtype=float, shape=(size,))
+
+
+def get_degrees(polys):
+    """
+    Le degré de chaque ligne d'une matrice de coefficients complétée par des 0 (indice du dernier coefficient non nul,
+    0 pour une ligne nulle).
+    """
+    nonzero = polys != 0
+    return np.where(nonzero.any(axis=1), polys.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+
+def integrate_slice(poly_up, poly_down, a, b, degree_up=None, degree_down=None, engine='stacked', cache=None,
+                    **options):
+    """
+    Intègre une tranche de calculs (tableaux en mémoire). Retourne un tableau de forme (n,).
+    engine : 'stacked' (calc_integral_stacked, par groupes de lignes de même degré du dénominateur) ou 'scalar'
+    (calc_integral ligne par ligne, avec un cache ; options : ses options). Avec 'stacked', le cache et les options
+    backend, square_free et precision servent aux lignes à racines multiples.
+    """
+    poly_up, poly_down = np.asarray(poly_up, dtype=float), np.asarray(poly_down, dtype=float)
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    degree_up = get_degrees(poly_up) if degree_up is None else np.asarray(degree_up, dtype=int)
+    degree_down = get_degrees(poly_down) if degree_down is None else np.asarray(degree_down, dtype=int)
+    result = np.empty(len(a))
+
+    if engine == 'scalar':
+        cache = DecompositionCache() if cache is None else cache
+        for n in range(len(a)):
+            result[n] = calc_integral(list(poly_up[n, :degree_up[n] + 1]), list(poly_down[n, :degree_down[n] + 1]),
+                                      a[n], b[n], cache=cache, **options)
+        return result
+    if engine != 'stacked':
+        raise ValueError(f"Moteur inconnu : {engine!r} (choix : {', '.join(BULK_ENGINES)})")
+
+    fallback = {key: options[key] for key in STACKED_OPTIONS if key in options}
+    for degree in np.unique(degree_down):  # Le moteur empilé demande des dénominateurs de même degré
+        rows = np.flatnonzero(degree_down == degree)
+        width = int(degree_up[rows].max()) + 1
+        result[rows] = calc_integral_stacked(poly_up[rows, :width], poly_down[rows, :degree + 1], a[rows], b[rows],
+                                             cache=cache, **fallback)
+    return result
+
+
+def integrate_bulk(arrays, out=None, slice_size=65536, start=0, stop=None, engine='stacked', **options):
+    """
+    Intègre les calculs start à stop (par défaut, tous) d'un lot (voir load_bulk), tranche par tranche, et écrit les
+    résultats dans out (un tableau de forme (N,), par exemple open_output ; créé en mémoire si None).
+    Chaque tranche est lue dans les tableaux projetés, intégrée, puis écrite dans out.
+    Retourne out.
+    """
+    size = len(arrays['a'])
+    stop = size if stop is None else stop
+    out = np.empty(size) if out is None else out
+    cache = DecompositionCache() if engine == 'scalar' else None
+    for first in range(start, stop, slice_size):
+        rows = slice(first, min(first + slice_size, stop))
+        degrees = {field: arrays[field][rows] for field in ('degree_up', 'degree_down') if field in arrays}
+        out[rows] = integrate_slice(arrays['poly_up'][rows], arrays['poly_down'][rows], arrays['a'][rows],
+                                    arrays['b'][rows], engine=engine, cache=cache, **degrees, **options)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def _integrate_file_range(input_path, output_path, start, stop, slice_size, engine, options):
+    """
+    Exécuté dans un processus : chaque processus ouvre lui-même les fichiers, et écrit dans sa propre plage de lignes.
+    """
+    out = np.load(output_path, mmap_mode='r+')
+    integrate_bulk(load_bulk(input_path), out, slice_size, start, stop, engine, **options)
+
+
+def integrate_bulk_file(input_path, output_path, slice_size=65536, workers=1, engine='stacked', **options):
+    """
+    Intègre un lot de calculs enregistré dans input_path (voir load_bulk) et écrit les résultats dans le fichier .npy
+    output_path. Avec workers > 1, le lot est découpé en plages de lignes réparties sur des processus, qui écrivent
+    directement dans le même fichier de sortie (à des positions disjointes).
+    """
+    size = len(load_bulk(input_path)['a'])
+    out = open_output(output_path, size)
+    if workers <= 1:
+        return integrate_bulk(load_bulk(input_path), out, slice_size, engine=engine, **options)
+    del out  # Les processus rouvrent le fichier de sortie
+    bounds = np.linspace(0, size, workers + 1).astype(int)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_integrate_file_range, input_path, output_path, start, stop, slice_size, engine,
+                                   options) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        for future in futures:
+            future.result()
+    return np.load(output_path, mmap_mode='r')
@@ -0,0 +1,153 @@
+"""
+Ce fichier contient le cache des dénominateurs.
+Quand le même dénominateur revient avec d'autres numérateurs ou d'autres bornes, on évite de refaire la recherche des
+racines (Muller), le regroupement des racines multiples et la construction de la matrice d'identification.
+"""
+import threading
+from collections import OrderedDict
+import numpy as np
+from utils.decomposition import analyse_denominator
+from utils.precision import get_precision
+
+
+def normalize_denominator(poly_down: list):
+    """
+    Retourne la clé du cache pour un dénominateur : ses coefficients divisés par le coefficient dominant.
+    Deux dénominateurs proportionnels ont les mêmes racines et la même matrice d'identification.
+    """
+    coefficients = np.asarray(poly_down, dtype=float)
+    return tuple((coefficients / coefficients[-1]).tolist())
+
+
+class DecompositionCache:
+    """
+    Cache LRU (le moins récemment utilisé est évincé en premier) des dénominateurs déjà analysés.
+    Chaque entrée contient :
+    - 'unique', 'count' : les racines uniques et leur multiplicité,
+    - 'solver' : la pseudo-inverse de la matrice d'identification, de sorte que constants = solver @ second_membre.
+
+    Le cache est optionnel : on le passe explicitement à calc_integral (ou decompose_rational).
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize doit être au moins 1")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, poly_down):
+        normalized = normalize_denominator(poly_down)
+        return any(key[-1] == normalized for key in self._entries)
+
+    def get_denominator(self, poly_down: list, backend='muller', square_free=False, precision=None):
+        """
+        Retourne l'entrée du cache associée au dénominateur, en la calculant si besoin.
+        backend, square_free, precision : les options de analyse_denominator, qui font partie de la clé.
+        """
+        key = (backend, square_free, get_precision(precision), normalize_denominator(poly_down))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = self._build_entry(poly_down, backend, square_free, precision)
+        self._entries[key] = entry
+        self.bytes += entry['bytes']
+        while len(self._entries) > self.maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted['bytes']
+            self.evictions += 1
+        return entry
+
+    @staticmethod
+    def _build_entry(poly_down: list, backend, square_free, precision=None):
+        """
+        Analyse complètement un dénominateur et factorise sa matrice d'identification.
+        """
+        unique, count, whole_matrix = analyse_denominator(poly_down, backend, square_free, precision)
+        if len(poly_down) == 1:  # Dénominateur constant : pas d'élément simple.
+            solver = np.zeros((0, len(poly_down)))
+        else:
+            # Le système est rectangulaire (une ligne de plus que de constantes) : la pseudo-inverse donne la même
+            # solution que les moindres carrés de solve_linear_system.
+            solver = np.linalg.pinv(whole_matrix)
+        entry = {'unique': unique, 'count': count, 'solver': solver}
+        entry['bytes'] = solver.nbytes + np.array(unique, dtype=complex).nbytes + np.array(count, dtype=int).nbytes \
+            + 8 * len(poly_down)
+        return entry
+
+    def stats(self):
+        """
+        Retourne les compteurs du cache sous forme de dictionnaire, pour les exporter.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.bytes,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self):
+        """
+        Vide le cache. Les compteurs hits, misses et evictions sont conservés.
+        """
+        self._entries.clear()
+        self.bytes = 0
+
+
+class SharedDecompositionCache(DecompositionCache):
+    """
+    DecompositionCache partagé entre plusieurs threads (serveur, front-end asyncio) : les accès à l'OrderedDict sont
+    protégés par un verrou.
+    Deux threads qui demandent en même temps un dénominateur absent l'analysent chacun (le second écrase le premier),
+    mais aucun ne bloque pendant l'analyse de l'autre.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__(maxsize)
+        self._lock = threading.Lock()
+
+    def get_denominator(self, poly_down: list, backend='muller', square_free=False, precision=None):
+        key = (backend, square_free, get_precision(precision), normalize_denominator(poly_down))
+        with self._lock:
+            entry = self._lookup(key)
+        if entry is not None:
+            return entry
+        entry = self._build_entry(poly_down, backend, square_free, precision)
+        with self._lock:
+            self._store(key, entry)
+        return entry
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, entry):
+        if key in self._entries:
+            self.bytes -= self._entries[key]['bytes']
+        self._entries[key] = entry
+        self.bytes += entry['bytes']
+        while len(self._entries) > self.maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted['bytes']
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return super().stats()
@@ -0,0 +1,388 @@
+"""
+Ce fichier contient les fonctions de décomposition en éléments simples : division euclidienne, construction du système
+d'identification des coefficients, et évaluation de la décomposition obtenue entre deux bornes.
+"""
+from numpy.polynomial import Polynomial
+import numpy as np
+from utils.roots import check_root_count, count_roots, find_roots, polish_roots
+from utils.square_free import square_free_roots
+from utils.residues import get_residue_constants
+from utils.structured import decompose_structured
+from utils.instrumentation import get_collector, timed
+from utils.precision import get_precision
+from utils.terms import TermTable
+from utils.integral_type2 import calc_integral_type2, get_type2_power_table
+from utils.integral_type1 import calc_integral_type1
+from utils.utils import solve_linear_system
+from utils.utils import unique_with_epsilon
+
+
+def get_other_roots(roots, counts):
+    """
+    Pour identifier les coefficients, on rammène tous les éléments simples sous le même dénominateur.
+    Cette fonction retourne le polynôme par lequel multiplier le haut et le bas de l'élément simple que l'on étudie
+    actuellement.
+
+    Par exemple, si on a:
+      A       B        C
+    ----- + ----- + -------
+    x - 2   x - 4   (x-1)^2
+
+    Et que on travaillait actuellement sur le 3ème élément simple, cette fonction retournerait:
+    (x-2) * (x-4) = x^2 - 6x + 8
+
+    Soit le produit des autres dénominateurs.
+    On l'utiliserait de cette façon:
+
+       C * (x^2 - 6x + 8)
+    ------------------------
+    (x-1)^2 * (x^2 - 6x + 8)
+
+    """
+    if len(roots) == 0 or roots[0].imag < 0:  # On passe le conjugué des racines complexes pour éviter les doublons.
+        return Polynomial([1])
+
+    if roots[0].imag == 0:
+        return (Polynomial([-roots[0].real, 1]) ** counts[0]) * get_other_roots(roots[1:], counts[1:])
+    return (Polynomial([roots[0].real ** 2 + roots[0].imag ** 2, -roots[0].real * 2, 1]) ** counts[0]) * get_other_roots(roots[1:], counts[1:])
+
+
+def get_polys_simple_element(index: int, roots, counts, max_degree):
+    """
+    Une des fonctions principales. Retourne une matrice selon ce formatage :
+
+    - Chaque colonne correspond à une des constantes au numérateur des éléments simples.
+    - Chaque ligne correspond à un des x^i.
+
+    Par exemple, avec :
+      A       B         Ax - 4A         Bx - 2B
+    ----- + ----- = -------------- + --------------
+    x - 2   x - 4   (x - 2)(x - 4)   (x - 2)(x - 4)
+
+    On aurait :
+       A   B
+    [ -4, -2 ] ← x^0
+    [  1,  1 ] ← x^1
+
+    Ceci serait le résultat retourné par cette fonction.
+    """
+    root = roots[index]  # On sélectionne la racine actuelle.
+    count = counts[index]  # La multiplicité de la racine. Pour une racine double, on aura deux éléments simples :
+    # Le premier avec une puissance de 1 au dénominateur
+    # Le second avec une puissance de 2 au dénominateur.
+    # La (ou les, dans le cas d'une racine complexe) constante(s) qui se trouvent au numérateur seront uniques
+    # pour chaque puissance au dénominateur.
+    # Exemple :
+    #   P(x)
+    # --------
+    # (x - 2)^2
+    # Ici, la décomposition en éléments simples se fait comme ceci :
+    #
+    #   B        C
+    # ----- + -------
+    # x - 2   (x-2)^2
+    #
+    # Donc les constantes B et C sont uniques. Comme la multiplicité de la racine est de 2, on a 2 constantes différentes.
+    # D'où l'importance de cette variable.
+
+    if root.imag < 0:  # On passe le conjugué des racines complexes pour éviter les doublons.
+        return None
+
+    if root.imag != 0:  # Si la racine et complexe, élément simple de seconde espère
+        base_poly = [root.imag**2 + root.real**2, -2 * root.real, 1]  # Le polynôme en dénominateur de l'élément simple
+        num_vars = count * 2  # Les éléments simples de seconde espèce ont 2 constantes au numérateur (Ax + B).
+    else:  # Sinon, élément simple de première espère
+        base_poly = [-root.real, 1]  # Le polynôme en dénominateur de l'élément simple
+        num_vars = count
+
+    poly = Polynomial(base_poly)
+    matrix = np.zeros([max_degree + 1, num_vars])  # La matrice que l'on remplit de 0.
+    # Le degré maximum de x^i correspond au degré du dénominateur de la fraction rationnelle d'origine.
+    # Donc si le dénominateur est de degré 3, il y aura 3 lignes.
+
+    for i in range(0, count):
+        # On élève progressivement le polynôme à une puissance, tout en la multipliant par les polynômes
+        # des autres éléments simples pour ramener au même dénominateur.
+        elevated_poly = poly ** (count - (i + 1)) * get_other_roots(roots[:index] + roots[index + 1:], counts[:index] + counts[index + 1:])
+
+        # On regarde les coefficients devant chaque x^i du nouveau polynôme.
+        for j, coeff in enumerate(elevated_poly):
+            matrix[j, i] = coeff
+
+        # Si c'est un élement simple de première espèce, on s'arrête là.
+        if root.imag == 0:
+            continue
+
+        # Sinon, on refait l'opération pour A (si on avait Ax + B au numérateur).
+        for j, coeff in enumerate(elevated_poly):
+            matrix[j + 1, i + count] = coeff
+    return matrix
+
+
+def get_floor_polynomial(poly_up: list, poly_down: list):
+    """
+    Cette fonction calcule la division euclidienne entre deux polynômes.
+    Permet de calculer la partie entière à intégrer séparément.
+    """
+    if len(poly_up) < len(poly_down):
+        return [], poly_up
+    quotient, remainder = np.polydiv(poly_up[::-1], poly_down[::-1])
+    return list(quotient[::-1]), list(remainder[::-1])
+
+
+def integrate_floored_polynomial(poly: list, a, b):
+    """
+    Cette fonction calcule l'intégrale d'un polynôme entre deux bornes.
+    Utilisé pour calculer l'intégrale de la partie entière.
+    Les bornes peuvent être des tableaux NumPy : la primitive est évaluée par le schéma de Horner (np.polyval)
+    sur toutes les bornes à la fois.
+    """
+    integral = np.polyint(np.array(poly[::-1], dtype=float))  # Coefficients par puissances décroissantes
+    return np.polyval(integral, b) - np.polyval(integral, a)
+
+
+def get_factor_powers(root, count):
+    """
+    Les puissances 0, 1, ..., count du facteur associé à une racine ((x - r) pour une racine réelle, x^2 - 2 Re(r) x
+    + |r|^2 pour une racine complexe), en coefficients par puissances croissantes.
+    Chaque puissance est obtenue à partir de la précédente, comme le fait Polynomial.__pow__.
+    """
+    if root.imag != 0:
+        base = np.array([root.imag ** 2 + root.real ** 2, -2 * root.real, 1])
+    else:
+        base = np.array([-root.real, 1])
+    powers = [np.ones(1), base]
+    for _ in range(2, count + 1):
+        powers.append(np.convolve(powers[-1], base))
+    return powers[:count + 1]
+
+
+def get_identification_matrix(unique, count, max_degree, fast=True):
+    """
+    Construit la matrice complète du système d'identification des coefficients : les colonnes de
+    get_polys_simple_element pour chaque racine unique, côte à côte.
+    Retourne None si le dénominateur n'a pas de racine (dénominateur constant).
+
+    fast : si True, les puissances de chaque facteur sont calculées une seule fois, et le produit des autres facteurs
+    (get_other_roots) est obtenu à partir des produits des facteurs avant la racine (préfixes) et après la racine
+    (suffixes) : l'assemblage fait un nombre linéaire de produits de polynômes au lieu d'un nombre quadratique, et les
+    colonnes sont écrites directement dans une seule matrice. Le résultat est le même à l'arrondi près (seul l'ordre des
+    produits change). Si False, on concatène les matrices de get_polys_simple_element.
+    """
+    if fast:
+        return assemble_identification_matrix(unique, count, max_degree)
+    whole_matrix = None
+
+    for i in range(len(unique)):  # Pour chaque racine unique, on calcule la matrice des coefficients
+        matrix = get_polys_simple_element(i, unique, count, max_degree)
+        if matrix is None:
+            continue
+        if whole_matrix is None:
+            whole_matrix = matrix
+        else:
+            whole_matrix = np.concatenate((whole_matrix, matrix), axis=1)  # On ajoute progressivement à la matrice existante
+    return whole_matrix
+
+
+def assemble_identification_matrix(unique, count, max_degree):
+    """
+    Assemblage de la matrice d'identification par produits préfixes et suffixes (voir get_identification_matrix).
+    Pour la racine k, le produit des autres facteurs est prefix[k] * suffix[k + 1], avec :
+    - prefix[k] : le produit des facteurs des racines 0, ..., k - 1,
+    - suffix[k] : le produit des facteurs des racines k, ..., n - 1.
+    Comme get_other_roots, le produit s'arrête au premier conjugué (partie imaginaire négative) rencontré.
+    """
+    roots = list(unique)
+    stop = next((k for k, root in enumerate(roots) if root.imag < 0), len(roots))
+    powers = [get_factor_powers(root, multiplicity) for root, multiplicity in zip(roots, count)]
+
+    prefix = [np.ones(1)]
+    for k in range(stop):
+        prefix.append(np.convolve(prefix[-1], powers[k][count[k]]))
+    suffix = [np.ones(1)] * (stop + 1)
+    for k in range(stop - 1, -1, -1):
+        suffix[k] = np.convolve(powers[k][count[k]], suffix[k + 1])
+
+    kept = [k for k, root in enumerate(roots) if root.imag >= 0]  # On passe les conjugués des racines complexes
+    widths = [2 * count[k] if roots[k].imag != 0 else count[k] for k in kept]
+    if sum(widths) == 0:
+        return None
+    whole_matrix = np.zeros([max_degree + 1, sum(widths)])
+
+    column = 0
+    for k, width in zip(kept, widths):
+        others = np.convolve(prefix[k], suffix[k + 1]) if k < stop else prefix[stop]
+        for i in range(count[k]):
+            elevated_poly = np.convolve(powers[k][count[k] - (i + 1)], others)
+            whole_matrix[:len(elevated_poly), column + i] = elevated_poly
+            if roots[k].imag != 0:  # Constante A (Ax + B au numérateur) : décalage d'une puissance de x
+                whole_matrix[1:len(elevated_poly) + 1, column + i + count[k]] = elevated_poly
+        column += width
+    return whole_matrix
+
+
+def find_unique_roots(poly_down: list, backend='muller', square_free=False, precision=None):
+    """
+    Recherche les racines du dénominateur et les regroupe avec leur multiplicité.
+    backend : la méthode de recherche des racines (voir utils/roots.py).
+    square_free : si True, on factorise d'abord le dénominateur sans facteur carré (voir utils/square_free.py) : les
+    multiplicités sont alors exactes et la recherche des racines ne porte que sur les facteurs.
+    precision : la politique de précision (voir utils/precision.py) : tolérances de la recherche des racines, distance
+    de regroupement et arrondi des racines multiples ; avec precision.square_free, on passe toujours par la
+    décomposition sans facteur carré. Avec precision.polish, les racines multiples regroupées sont
+    affinées sur la dérivée du dénominateur dont elles sont racines simples.
+    Si les racines regroupées ne couvrent pas tout le dénominateur (une racine multiple éclatée en racines complexes,
+    ou Muller qui s'arrête avant la fin), on recommence par la décomposition sans facteur carré.
+    Retourne un tuple (unique, count). Lève une RootFindingError (voir utils/roots.py) si les racines trouvées ne
+    couvrent toujours pas tout le dénominateur.
+    """
+    precision = get_precision(precision)
+    degree = len(poly_down) - 1
+    if not (square_free or precision.square_free):
+        roots = timed('roots', find_roots, poly_down, backend, precision)  # On récupère les racines du dénominateur
+        # On récupère les racines uniques avec leur multiplicité
+        unique, count = timed('unique', unique_with_epsilon, roots, precision.epsilon, precision.decimals)
+        if precision.polish and any(multiplicity > 1 for multiplicity in count):
+            unique = timed('polish', polish_roots, poly_down, unique, precision.tol, 5, count)
+        if count_roots(unique, count) == degree:
+            return unique, count
+    unique, count = timed('square_free', square_free_roots, poly_down, backend, precision.epsilon, precision)
+    check_root_count(unique, count, degree)
+    return unique, count
+
+
+def analyse_denominator(poly_down: list, backend='muller', square_free=False, precision=None):
+    """
+    Toute la partie du calcul qui ne dépend que du dénominateur : recherche des racines, regroupement des racines
+    multiples (voir find_unique_roots) et construction de la matrice d'identification.
+    Retourne un tuple (unique, count, whole_matrix).
+    """
+    unique, count = find_unique_roots(poly_down, backend, square_free, precision)
+    return unique, count, timed('matrix', get_identification_matrix, unique, count, len(poly_down) - 1)
+
+
+def get_identification_rhs(rest_poly_up: list, poly_down: list):
+    """
+    Le second membre du système d'identification : les coefficients du reste de la division euclidienne,
+    complétés par des 0 jusqu'au degré du dénominateur.
+    """
+    return list(rest_poly_up) + [0 for _ in range(len(poly_down) - len(rest_poly_up))]
+
+
+def solve_identification(whole_matrix, rhs):
+    """
+    Résout le système d'identification (voir solve_linear_system) et retourne les constantes.
+    Si un collecteur est actif (voir utils/instrumentation.py), on y enregistre aussi le conditionnement de la matrice
+    et la norme du résidu.
+    """
+    collector = get_collector()
+    if collector is None:
+        return solve_linear_system(whole_matrix, rhs)['solution']
+    constants = collector.time('solve', solve_linear_system, whole_matrix, rhs)['solution']
+    collector.record('condition_number', np.linalg.cond(whole_matrix))
+    collector.record('residual', np.linalg.norm(whole_matrix @ constants - np.asarray(rhs, dtype=float)))
+    return constants
+
+
+DECOMPOSITION_METHODS = ('matrix', 'residues')
+
+
+def decompose_rational(poly_up: list, poly_down: list, cache=None, backend='muller', square_free=False,
+                       method='matrix', structured=True, precision=None):
+    """
+    Calcule la décomposition en éléments simples de poly_up / poly_down, sans l'intégrer.
+    Ne dépend pas des bornes : on peut donc la calculer une seule fois puis l'évaluer sur autant d'intervalles
+    que l'on veut avec evaluate_decomposition.
+    Si un cache (voir utils/cache.py) est fourni, les racines et la matrice factorisée du dénominateur y sont lues
+    au lieu d'être recalculées.
+    backend, square_free : les options de l'analyse du dénominateur (voir analyse_denominator).
+    method : 'matrix' pour résoudre le système d'identification, 'residues' pour calculer directement les constantes
+    par les résidus en chaque racine (voir utils/residues.py).
+    structured : si True, les dénominateurs creux (binômes x^n + c, polynômes en x^m) sont détectés et décomposés
+    par le chemin rapide de utils/structured.py, sans passer par le cache.
+    precision : la politique de précision (voir utils/precision.py), qui fait aussi partie de la clé du cache.
+
+    Retourne un tuple (floored_poly_up, unique, count, constants) :
+    - floored_poly_up : la partie entière,
+    - unique, count : les racines uniques du dénominateur (sans les conjugués) et leur multiplicité,
+    - constants : les constantes au numérateur des éléments simples, dans l'ordre des colonnes de la matrice
+      d'identification.
+    """
+    if method not in DECOMPOSITION_METHODS:
+        raise ValueError(f"Méthode de décomposition inconnue : {method!r} (choix : {', '.join(DECOMPOSITION_METHODS)})")
+    precision = get_precision(precision)
+
+    # Extraire la partie entière
+    floored_poly_up, rest_poly_up = timed('floor', get_floor_polynomial, poly_up, poly_down)
+
+    if structured:
+        result = timed('structured', decompose_structured, rest_poly_up, poly_down,
+                       lambda reduced: find_unique_roots(reduced, backend, square_free, precision), method)
+        if result is not None:
+            unique, count, constants = result
+            if constants is None:
+                whole_matrix = timed('matrix', get_identification_matrix, unique, count, len(poly_down) - 1)
+                constants = solve_identification(whole_matrix, get_identification_rhs(rest_poly_up, poly_down))
+            return floored_poly_up, unique, count, constants
+
+    if method == 'residues':
+        if cache is not None:
+            entry = timed('cache', cache.get_denominator, poly_down, backend, square_free, precision)
+            unique, count = entry['unique'], entry['count']
+        else:
+            unique, count = find_unique_roots(poly_down, backend, square_free, precision)
+        return floored_poly_up, unique, count, timed('residues', get_residue_constants, rest_poly_up, unique, count)
+
+    if cache is not None:
+        entry = timed('cache', cache.get_denominator, poly_down, backend, square_free, precision)
+        # La matrice est construite à partir du dénominateur unitaire : le second membre ne change pas.
+        constants = entry['solver'] @ np.array(get_identification_rhs(rest_poly_up, poly_down), dtype=float)
+        return floored_poly_up, entry['unique'], entry['count'], constants
+
+    unique, count, whole_matrix = analyse_denominator(poly_down, backend, square_free, precision)
+
+    if len(poly_down) == 1:  # Dénominateur constant : il n'y a pas d'élément simple.
+        return floored_poly_up, unique, count, np.zeros(0)
+
+    # On calcule la solution au système d'identification des coefficients pour trouver les constantes au numérateur
+    # des éléments simples.
+    constants = solve_identification(whole_matrix, get_identification_rhs(rest_poly_up, poly_down))
+    return floored_poly_up, unique, count, constants
+
+
+def evaluate_decomposition(floored_poly_up: list, unique, count, constants, leading_coeff, a, b):
+    """
+    Évalue l'intégrale d'une décomposition (voir decompose_rational) entre a et b.
+    a et b peuvent être des scalaires ou des tableaux NumPy de même forme.
+    Tous les éléments simples sont rangés dans une TermTable (voir utils/terms.py) et intégrés ensemble, en quelques
+    opérations vectorisées.
+    """
+    integral = timed('terms', lambda: TermTable(unique, count, constants, leading_coeff).integrate(a, b))
+
+    # Ajouter l'intégrale de la partie entière
+    integral += timed('floor_integral', integrate_floored_polynomial, floored_poly_up, a, b)
+    return integral
+
+
+def get_column_integrals(unique, count, a, b):
+    """
+    Calcule l'intégrale de chaque élément simple avec une constante au numérateur égale à 1, dans l'ordre des colonnes
+    de la matrice d'identification. Comme l'intégrale est linéaire en les constantes, on a alors :
+        intégrale des éléments simples = constants @ get_column_integrals(...)
+    Retourne un tableau de forme (nombre de constantes,) + forme commune de a et b.
+    """
+    shape = np.broadcast(np.asarray(a), np.asarray(b)).shape
+    columns = []
+    for i in range(len(unique)):
+        if unique[i].imag == 0:
+            for j in range(1, count[i] + 1):
+                columns.append(calc_integral_type1([1], [-unique[i].real, 1], j, a, b))
+        else:
+            poly_down = [unique[i].real ** 2 + unique[i].imag ** 2, -unique[i].real * 2, 1]
+            table = get_type2_power_table(count[i], poly_down, a, b) if count[i] > 1 else None
+            # D'abord les constantes B (Ax + B avec A = 0), puis les constantes A (B = 0).
+            for j in range(1, count[i] + 1):
+                columns.append(calc_integral_type2([1, 0], poly_down, j, a, b, table))
+            for j in range(1, count[i] + 1):
+                columns.append(calc_integral_type2([0, 1], poly_down, j, a, b, table))
+    return np.array([np.broadcast_to(column, shape) for column in columns]).reshape((len(columns),) + shape)
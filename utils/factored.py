@@ -0,0 +1,71 @@
+"""
+Ce fichier permet de donner le dénominateur directement sous forme factorisée (pôles connus et leur multiplicité), au
+lieu de ses coefficients. La recherche des racines et leur regroupement (les étapes les plus coûteuses et les moins
+fiables) sont alors inutiles : les racines et les multiplicités sont exactes.
+
+Le dénominateur s'écrit :
+    leading_coeff * produit des (x - r)^m * produit des (x^2 + cx + d)^m
+avec real_roots = [(r, m), ...] et quadratic_factors = [((d, c), m), ...].
+"""
+import numpy as np
+from numpy.polynomial import polynomial
+from utils.decomposition import get_floor_polynomial, get_identification_matrix, get_identification_rhs
+from utils.residues import get_residue_constants
+from utils.utils import solve_linear_system
+
+
+def get_factored_roots(real_roots=(), quadratic_factors=()):
+    """
+    Convertit les facteurs en racines uniques (sans les conjugués) et multiplicités, au format de unique_with_epsilon.
+    Un facteur du second degré à discriminant positif est remplacé par ses deux racines réelles.
+    Les racines données plusieurs fois voient leurs multiplicités additionnées.
+    """
+    multiplicities = {}
+    for root, multiplicity in real_roots:
+        root = complex(float(root), 0)
+        multiplicities[root] = multiplicities.get(root, 0) + multiplicity
+    for (d, c), multiplicity in quadratic_factors:
+        alpha = c / 2
+        beta = d - alpha ** 2
+        if beta > 0:
+            roots = [complex(-alpha, np.sqrt(beta))]
+        else:  # Le facteur n'est pas irréductible : deux racines réelles
+            roots = [complex(-alpha + np.sqrt(-beta), 0), complex(-alpha - np.sqrt(-beta), 0)]
+        for root in roots:
+            multiplicities[root] = multiplicities.get(root, 0) + multiplicity
+    return list(multiplicities), list(multiplicities.values())
+
+
+def expand_factored_denominator(unique, count, leading_coeff=1):
+    """
+    Les coefficients (puissances croissantes) du dénominateur, développé à partir de ses racines.
+    """
+    poly_down = np.array([float(leading_coeff)])
+    for root, multiplicity in zip(unique, count):
+        if root.imag == 0:
+            factor = [-root.real, 1]
+        else:
+            factor = [root.real ** 2 + root.imag ** 2, -2 * root.real, 1]
+        poly_down = polynomial.polymul(poly_down, polynomial.polypow(factor, multiplicity))
+    return list(poly_down)
+
+
+def decompose_factored(poly_up: list, real_roots=(), quadratic_factors=(), leading_coeff=1, method='residues'):
+    """
+    Décomposition en éléments simples de poly_up / dénominateur factorisé, sans recherche des racines.
+    method : 'residues' (par défaut, voir utils/residues.py) ou 'matrix' (système d'identification).
+    Retourne (floored_poly_up, unique, count, constants), comme decompose_rational.
+    """
+    unique, count = get_factored_roots(real_roots, quadratic_factors)
+    poly_down = expand_factored_denominator(unique, count, leading_coeff)
+    floored_poly_up, rest_poly_up = get_floor_polynomial(poly_up, poly_down)
+
+    if method == 'residues':
+        constants = get_residue_constants(rest_poly_up, unique, count)
+    elif method == 'matrix':
+        whole_matrix = get_identification_matrix(unique, count, len(poly_down) - 1)
+        constants = np.zeros(0) if whole_matrix is None else \
+            solve_linear_system(whole_matrix, get_identification_rhs(rest_poly_up, poly_down))['solution']
+    else:
+        raise ValueError(f"Méthode de décomposition inconnue : {method!r} (choix : residues, matrix)")
+    return floored_poly_up, unique, count, constants
@@ -0,0 +1,100 @@
+"""
+Ce fichier contient la réduction d'Hermite (méthode d'Ostrogradsky) :
+    ∫ R/Q = P1/Q1 + ∫ P2/Q2
+avec Q1 = PGCD(Q, Q') et Q2 = Q / Q1. Q2 n'a que des racines simples : il ne reste à intégrer que des éléments
+simples en log et arctan, sans les puissances (ni la récurrence sur les puissances de cosinus de utils/integral_type2.py).
+La partie P1/Q1 est une fraction rationnelle, évaluée directement aux bornes. Le coût d'une évaluation ne dépend donc
+plus de la multiplicité des racines.
+
+Q1 et Q2 sont construits à partir de la décomposition sans facteur carré (utils/square_free.py) :
+Q = produit des a_i^i, donc Q2 = produit des a_i et Q1 = produit des a_i^(i-1).
+"""
+import numpy as np
+from numpy.polynomial import polynomial
+from utils.decomposition import get_floor_polynomial, evaluate_decomposition
+from utils.roots import check_root_count, find_roots
+from utils.residues import get_residue_constants
+from utils.square_free import yun_square_free, exact_division, check_square_free_roots
+from utils.instrumentation import timed
+from utils.precision import get_precision
+from utils.utils import unique_with_epsilon
+
+
+def shift_polynomial(poly, power):
+    """
+    Multiplie un polynôme (puissances croissantes) par x^power.
+    """
+    return np.concatenate((np.zeros(power), poly))
+
+
+def hermite_reduce(rest_poly_up: list, poly_down: list):
+    """
+    Calcule P1, Q1, P2, Q2 (coefficients par puissances croissantes, Q1 et Q2 unitaires) tels que
+        rest_poly_up / poly_down = (P1/Q1)' + P2/Q2.
+    En multipliant par Q = Q1.Q2, on obtient le système linéaire (de taille deg Q) :
+        R = P1'.Q2 - P1.H + P2.Q1,    avec H = Q1'.Q2 / Q1 (un polynôme)
+    où les inconnues sont les coefficients de P1 (deg < deg Q1) et de P2 (deg < deg Q2).
+    """
+    poly_down = np.asarray(poly_down, dtype=float)
+    rest = np.asarray(rest_poly_up, dtype=float) / poly_down[-1]
+
+    rational_down, simple_down = np.array([1.0]), np.array([1.0])
+    for factor, multiplicity in yun_square_free(poly_down):
+        simple_down = polynomial.polymul(simple_down, factor)
+        rational_down = polynomial.polymul(rational_down, polynomial.polypow(factor, multiplicity - 1))
+    h = exact_division(polynomial.polymul(polynomial.polyder(rational_down), simple_down), rational_down)
+
+    degree_1, degree_2 = len(rational_down) - 1, len(simple_down) - 1
+    size = degree_1 + degree_2
+    matrix = np.zeros((size, size))
+    for k in range(degree_1):  # Colonne de x^k dans P1 : k.x^(k-1).Q2 - x^k.H
+        column = polynomial.polysub(k * shift_polynomial(simple_down, k - 1) if k > 0 else [0],
+                                    shift_polynomial(h, k))
+        matrix[:len(column), k] = column[:size]
+    for k in range(degree_2):  # Colonne de x^k dans P2 : x^k.Q1
+        column = shift_polynomial(rational_down, k)
+        matrix[:len(column), degree_1 + k] = column[:size]
+
+    rhs = np.zeros(size)
+    rhs[:len(rest)] = rest[:size]
+    solution = np.linalg.solve(matrix, rhs)
+    return solution[:degree_1], rational_down, solution[degree_1:], simple_down
+
+
+def decompose_hermite(poly_up: list, poly_down: list, backend='muller', precision=None):
+    """
+    Décomposition par la réduction d'Hermite.
+    Retourne (floored_poly_up, rational_up, rational_down, unique, count, constants) :
+    - floored_poly_up : la partie entière,
+    - rational_up / rational_down : la partie rationnelle P1/Q1 de la primitive,
+    - unique, count, constants : la décomposition en éléments simples de P2/Q2 (racines simples), au même format que
+      decompose_rational, pour un dénominateur unitaire.
+    """
+    floored_poly_up, rest_poly_up = timed('floor', get_floor_polynomial, poly_up, poly_down)
+    rational_up, rational_down, simple_up, simple_down = timed('hermite', hermite_reduce, rest_poly_up, poly_down)
+    # Q2 n'a que des racines simples (sinon, le PGCD numérique a échoué : check_square_free_roots le signale).
+    precision = get_precision(precision)
+    roots = timed('roots', find_roots, list(simple_down), backend, precision)
+    check_square_free_roots(simple_down, roots, precision.epsilon)
+    # Racines simples : on ne garde qu'une racine par paire de conjuguées, sans l'arrondir (l'arrondi de
+    # precision.decimals ne sert qu'à fusionner les racines multiples).
+    unique, count = timed('unique', unique_with_epsilon, roots, precision.epsilon, None)
+    check_root_count(unique, count, len(simple_down) - 1)
+    constants = timed('residues', get_residue_constants, list(simple_up), unique, count)
+    return floored_poly_up, rational_up, rational_down, unique, count, constants
+
+
+def evaluate_rational_part(rational_up, rational_down, a, b):
+    """
+    P1/Q1 entre a et b (scalaires ou tableaux NumPy).
+    """
+    rational_up, rational_down = np.asarray(rational_up)[::-1], np.asarray(rational_down)[::-1]
+    return np.polyval(rational_up, b) / np.polyval(rational_down, b) - np.polyval(rational_up, a) / np.polyval(rational_down, a)
+
+
+def evaluate_hermite(floored_poly_up, rational_up, rational_down, unique, count, constants, a, b):
+    """
+    Évalue l'intégrale d'une décomposition obtenue par decompose_hermite entre a et b (scalaires ou tableaux NumPy).
+    """
+    integral = evaluate_decomposition(floored_poly_up, unique, count, constants, 1, a, b)
+    return integral + evaluate_rational_part(rational_up, rational_down, a, b)
@@ -0,0 +1,127 @@
+"""
+Ce fichier contient l'instrumentation (optionnelle) du calcul : temps passé dans chaque étape, compteurs et
+histogrammes de Muller (itérations, relances), conditionnement et résidu du système d'identification.
+
+Un Collector est activé pour la durée d'un calcul avec collecting(collector) (ou calc_integral(..., collector=...)).
+Les étapes instrumentées lisent le collecteur actif avec get_collector() : sans collecteur, elles ne font qu'un test
+à None, sans mesure de temps ni calcul supplémentaire (le conditionnement, en particulier, coûte une SVD).
+Le collecteur actif est une ContextVar : chaque thread (ou tâche asyncio) a le sien.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+_active_collector = contextvars.ContextVar('collector', default=None)
+
+
+def get_collector():
+    """
+    Le collecteur actif, ou None si l'instrumentation est désactivée.
+    """
+    return _active_collector.get()
+
+
+@contextmanager
+def collecting(collector):
+    """
+    Active collector pour toutes les étapes exécutées dans le bloc with.
+    """
+    token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(token)
+
+
+def timed(name, function, *args):
+    """
+    Appelle function(*args), en mesurant la durée de l'étape name si un collecteur est actif.
+    """
+    collector = _active_collector.get()
+    if collector is None:
+        return function(*args)
+    return collector.time(name, function, *args)
+
+
+class Collector:
+    """
+    Accumule les mesures du calcul :
+    - timings : pour chaque étape, {'calls', 'total', 'max'} (secondes),
+    - counters : des compteurs entiers (déflations, racines non trouvées, ...),
+    - histograms : pour chaque grandeur, {valeur: nombre d'occurrences} (itérations de Muller par racine, ...),
+    - values : pour chaque grandeur, la liste des valeurs observées (conditionnement, résidu, ...).
+
+    callback : une fonction optionnelle callback(kind, name, value), appelée à chaque mesure (kind vaut 'timing',
+    'counter', 'histogram' ou 'value'), pour transmettre les mesures à un système de métriques au fil de l'eau.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        """
+        Efface toutes les mesures.
+        """
+        self.timings = {}
+        self.counters = {}
+        self.histograms = {}
+        self.values = {}
+
+    def add_timing(self, name, seconds):
+        timing = self.timings.setdefault(name, {'calls': 0, 'total': 0.0, 'max': 0.0})
+        timing['calls'] += 1
+        timing['total'] += seconds
+        timing['max'] = max(timing['max'], seconds)
+        if self.callback is not None:
+            self.callback('timing', name, seconds)
+
+    def count(self, name, increment=1):
+        self.counters[name] = self.counters.get(name, 0) + increment
+        if self.callback is not None:
+            self.callback('counter', name, increment)
+
+    def observe(self, name, value):
+        histogram = self.histograms.setdefault(name, {})
+        histogram[value] = histogram.get(value, 0) + 1
+        if self.callback is not None:
+            self.callback('histogram', name, value)
+
+    def record(self, name, value):
+        self.values.setdefault(name, []).append(value)
+        if self.callback is not None:
+            self.callback('value', name, value)
+
+    def time(self, name, function, *args):
+        """
+        Appelle function(*args) et ajoute sa durée à l'étape name.
+        """
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.add_timing(name, time.perf_counter() - start)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Mesure la durée du bloc with comme une étape name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(name, time.perf_counter() - start)
+
+    def export(self):
+        """
+        Une copie des mesures, sous forme de dictionnaires et listes simples (sérialisable en JSON, les clés des
+        histogrammes étant converties en chaînes).
+        """
+        return {
+            'timings': {name: dict(timing) for name, timing in self.timings.items()},
+            'counters': dict(self.counters),
+            'histograms': {name: {str(value): occurrences for value, occurrences in sorted(histogram.items())}
+                           for name, histogram in self.histograms.items()},
+            'values': {name: [float(value) for value in values] for name, values in self.values.items()},
+        }
@@ -0,0 +1,68 @@
+"""
+Ce fichier contient les fonctions de calcul d'intégrale : calc_integral (une fonction rationnelle entre deux bornes),
+calc_integral_intervals (sur beaucoup d'intervalles) et calc_integral_factored (dénominateur donné sous forme
+factorisée). Elles sont réexportées par main.py ; les modules de utils les importent d'ici, pour ne pas dépendre du
+script principal.
+"""
+import numpy as np
+from utils.decomposition import decompose_rational, evaluate_decomposition
+from utils.hermite import decompose_hermite, evaluate_hermite
+from utils.factored import decompose_factored
+from utils.instrumentation import collecting
+
+
+def calc_integral(poly_up: list, poly_down: list, a, b, cache=None, backend='muller', square_free=False,
+                  method='matrix', collector=None, precision=None):
+    """
+    Ceci est la fonction principale. Elle calcule l'intégrale d'une fonction rationnelle entre deux points a et b.
+    cache : un DecompositionCache optionnel (voir utils/cache.py), pour ne pas refaire l'analyse d'un dénominateur
+    déjà rencontré.
+    backend : la méthode de recherche des racines du dénominateur (voir utils/roots.py).
+    square_free : si True, le dénominateur est d'abord décomposé sans facteur carré (voir utils/square_free.py), ce qui
+    donne des multiplicités exactes.
+    method : 'matrix' (système d'identification), 'residues' (calcul direct des constantes, voir utils/residues.py)
+    ou 'hermite' (réduction d'Hermite, voir utils/hermite.py ; le cache et square_free ne sont alors pas utilisés, la
+    décomposition sans facteur carré faisant partie de la méthode).
+    collector : un Collector optionnel (voir utils/instrumentation.py), qui reçoit le temps passé dans chaque étape et
+    les mesures du calcul. Sans collecteur, rien n'est mesuré.
+    precision : 'fast', 'default' (None) ou 'high', ou une PrecisionPolicy (voir utils/precision.py) : les tolérances
+    de la recherche des racines et du regroupement des racines multiples.
+    """
+    if collector is not None:
+        with collecting(collector):
+            return collector.time('total', calc_integral, poly_up, poly_down, a, b, cache, backend, square_free,
+                                  method, None, precision)
+
+    if method == 'hermite':
+        return evaluate_hermite(*decompose_hermite(poly_up, poly_down, backend, precision), a, b)
+
+    floored_poly_up, unique, count, constants = decompose_rational(poly_up, poly_down, cache, backend, square_free,
+                                                                   method, precision=precision)
+    return evaluate_decomposition(floored_poly_up, unique, count, constants, poly_down[-1], a, b)
+
+
+def calc_integral_intervals(poly_up: list, poly_down: list, a, b, cache=None, backend='muller', square_free=False,
+                            method='matrix', collector=None, precision=None):
+    """
+    Calcule l'intégrale d'une même fonction rationnelle sur un grand nombre d'intervalles [a_k, b_k].
+    a et b sont des tableaux (ou des scalaires, diffusés selon les règles de NumPy).
+    La décomposition en éléments simples n'est faite qu'une seule fois ; seule l'évaluation dépend des bornes.
+    Les options sont celles de calc_integral.
+    Retourne un tableau de la forme commune de a et b.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    integral = calc_integral(poly_up, poly_down, a, b, cache, backend, square_free, method, collector, precision)
+    return np.broadcast_to(integral, a.shape).copy()
+
+
+def calc_integral_factored(poly_up: list, real_roots, quadratic_factors, a, b, leading_coeff=1, method='residues'):
+    """
+    Calcule l'intégrale de poly_up / dénominateur entre a et b, avec un dénominateur donné sous forme factorisée :
+        leading_coeff * produit des (x - r)^m * produit des (x^2 + cx + d)^m
+    real_roots = [(r, m), ...], quadratic_factors = [((d, c), m), ...] (voir utils/factored.py).
+    Il n'y a pas de recherche des racines : les pôles et leurs multiplicités sont exacts.
+    a et b peuvent être des tableaux NumPy.
+    """
+    floored_poly_up, unique, count, constants = decompose_factored(poly_up, real_roots, quadratic_factors,
+                                                                   leading_coeff, method)
+    return evaluate_decomposition(floored_poly_up, unique, count, constants, leading_coeff, a, b)
@@ -4,28 +4,59 @@ Ce fichier contient toutes les fonctions qui servent à calculer l'intégrale de
 import numpy as np
 
 
+def cosine_power_table(max_power: int, interval: list):
+    """
+    Calcule toute la suite I(0), I(1), ..., I(max_power) des intégrales de cosinus à une puissance n, en une seule
+    passe (sans récursion) :
+        I(0) = t1 - t0,    I(1) = sin(t1) - sin(t0),
+        I(n) = [sin(t).cos(t)^(n-1)] / n + (n-1)/n * I(n-2)
+    Les sinus et cosinus des bornes ne sont calculés qu'une fois, et les puissances de cosinus sont obtenues par
+    multiplications successives.
+    interval = [t0, t1], scalaires ou tableaux NumPy (plusieurs intervalles à la fois).
+    Retourne un tableau de forme (max_power + 1,) + forme des bornes : table[n] = I(n).
+    """
+    lower, upper = np.asarray(interval[0], dtype=float), np.asarray(interval[1], dtype=float)
+    table = np.empty((max_power + 1,) + np.broadcast(lower, upper).shape)
+    sin_lower, sin_upper = np.sin(lower), np.sin(upper)
+    cos_lower, cos_upper = np.cos(lower), np.cos(upper)
+
+    table[0] = upper - lower  # I(0)
+    if max_power >= 1:
+        table[1] = sin_upper - sin_lower  # I(1)
+    power_lower, power_upper = cos_lower, cos_upper  # cos(t)^(n-1), pour n = 2
+    for n in range(2, max_power + 1):
+        table[n] = (sin_upper * power_upper - sin_lower * power_lower) / n + ((n - 1) / n) * table[n - 2]
+        power_lower, power_upper = power_lower * cos_lower, power_upper * cos_upper
+    return table
+
+
 def calc_integral_cosine_pow_n(power: int, interval: list):
     """
     Calcule l'intégrale de cosinus à une puissance n.
-    Cette fonction est récursive : elle s'appelle elle-même, pour simuler le comportement d'une suite.
-    On nomme I(n) cette suite
+    On nomme I(n) cette suite ; elle est calculée par cosine_power_table.
     """
-    if power == 0:  # I(0)
-        return interval[1] - interval[0]
-    if power == 1:  # I(1)
-        return np.sin(interval[1]) - np.sin(interval[0])
+    return cosine_power_table(power, interval)[power]
 
-    left_part = (
-                (np.sin(interval[1]) * (np.cos(interval[1]) ** (power - 1)))
-                - (np.sin(interval[0]) * (np.cos(interval[0]) ** (power - 1)))
-        ) / power
 
-    right_part = ((power - 1) / power) * calc_integral_cosine_pow_n(power - 2, interval)  # I(n-2)
+def get_angle_bounds(poly, a, b):
+    """
+    Les bornes de l'intégrale après le changement de variable x + alpha = sqrt(beta).tan(t), pour le polynôme
+    poly = [d, c, 1] = (x + alpha)^2 + beta.
+    """
+    alpha = poly[1] / 2
+    beta = poly[0] - alpha ** 2
+    return [np.arctan((a + alpha) / (beta ** 0.5)), np.arctan((b + alpha) / (beta ** 0.5))]
+
 
-    return left_part + right_part
+def get_type2_power_table(max_power, poly, a, b):
+    """
+    La table des intégrales de cosinus dont ont besoin toutes les puissances 1 à max_power d'un même polynôme du second
+    degré (voir calc_type2_power_simple), calculée une seule fois.
+    """
+    return cosine_power_table(2 * max_power - 2, get_angle_bounds(poly, a, b))
 
 
-def calc_type2_power_simple(power, poly, a, b):
+def calc_type2_power_simple(power, poly, a, b, table=None):
     """
     Calcule l'intégrale d'une fraction de la sorte:
            1
@@ -33,17 +64,19 @@ def calc_type2_power_simple(power, poly, a, b):
     (x^2 + cx + d)^n
 
     Où c, d sont deux constantes réelles, et n un entier positif >= 2.
+    table : la table des intégrales de cosinus de get_type2_power_table, pour la partager entre les puissances d'un même
+    polynôme. Calculée ici si elle n'est pas fournie.
     """
     alpha = poly[1] / 2  # Raccourcis pour simplifier le calcul visuellement
-    beta = poly[2] - alpha ** 2
+    beta = poly[0] - alpha ** 2
 
-    upper_bound = np.arctan((b + alpha) / (beta ** 0.5))  # Borne supérieure de l'intégrale
-    lower_bound = np.arctan((a + alpha) / (beta ** 0.5))  # Borne inférieure de l'intégrale
+    if table is None:
+        table = get_type2_power_table(power, poly, a, b)
 
-    return beta ** 0.5 / (beta ** power) * calc_integral_cosine_pow_n(2 * power - 2, [lower_bound, upper_bound])
+    return beta ** 0.5 / (beta ** power) * table[2 * power - 2]
 
 
-def calc_type2_power(power, poly_up, poly_down, a, b):
+def calc_type2_power(power, poly_up, poly_down, a, b, table=None):
     """
     Calcule l'intégrale d'une fraction de la sorte:
         Ax + B
@@ -54,10 +87,10 @@ def calc_type2_power(power, poly_up, poly_down, a, b):
     """
     left_integral = poly_up[1] / 2 * (
         (
-                1/(1-power) * 1/(b ** 2 + poly_down[1] * b + poly_down[0]))
-                - 1/(1-power) * 1/(a ** 2 + poly_down[1] * a + poly_down[0])
+                1/(1-power) * 1/(b ** 2 + poly_down[1] * b + poly_down[0]) ** (power - 1))
+                - 1/(1-power) * 1/(a ** 2 + poly_down[1] * a + poly_down[0]) ** (power - 1)
     )
-    right_integral = (poly_up[0] - poly_up[1] * poly_down[1] / 2) * calc_type2_power_simple(power, poly_down, a, b)
+    right_integral = (poly_up[0] - poly_up[1] * poly_down[1] / 2) * calc_type2_power_simple(power, poly_down, a, b, table)
     return left_integral + right_integral
 
 
@@ -73,7 +106,7 @@ def calc_type2_no_power(poly_up, poly_down, a, b):
     alpha = poly_down[1] / 2
     beta = poly_down[0] - (poly_down[1] / 2) ** 2
 
-    left_integral = poly_up[1] / 2 * (np.log(abs(b**2 + poly_down[1] * b + poly_down[0])) - np.log(abs(a**2 + poly_down[1] * a + poly_down[0])))
+    left_integral = poly_up[1] / 2 * (np.log(np.abs(b**2 + poly_down[1] * b + poly_down[0])) - np.log(np.abs(a**2 + poly_down[1] * a + poly_down[0])))
     right_integral = (poly_up[0] - poly_down[1] * poly_up[1] / 2) * 1/np.sqrt(beta) * (
             np.arctan((b + alpha) / (np.sqrt(beta)))
             - np.arctan((a + alpha) / (np.sqrt(beta)))
@@ -82,7 +115,7 @@ def calc_type2_no_power(poly_up, poly_down, a, b):
     return left_integral + right_integral
 
 
-def calc_integral_type2(poly_up, poly_down, power, a, b):
+def calc_integral_type2(poly_up, poly_down, power, a, b, table=None):
     """
     Calcule l'intégrale d'une fraction de la sorte:
         Ax + B
@@ -91,7 +124,9 @@ def calc_integral_type2(poly_up, poly_down, power, a, b):
 
     Où A, B, c, d sont des constantes réelles, et n un entier positif.
     Cette fonction est une fonction "pilote" qui appelle celles déclarées plus haut.
+    a et b peuvent être des tableaux NumPy : toutes les fonctions de ce fichier sont vectorisées sur les bornes.
+    table : optionnelle, voir calc_type2_power_simple.
     """
     if power == 1:
         return calc_type2_no_power(poly_up, poly_down, a, b)
-    return calc_type2_power(power, poly_up, poly_down, a, b)
+    return calc_type2_power(power, poly_up, poly_down, a, b, table)
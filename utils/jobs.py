@@ -0,0 +1,142 @@
+"""
+Ce fichier contient le traitement en flux des fichiers de calculs (voir cli.py) : lecture des calculs en JSONL ou CSV,
+calcul par paquets de taille fixe, écriture des résultats dans l'ordre d'entrée.
+Tout est fait par générateurs : seul un paquet est en mémoire à la fois, quelle que soit la taille du fichier.
+
+Un calcul est un numérateur, un dénominateur (coefficients par puissances croissantes) et deux bornes :
+- JSONL : une ligne {"id": ..., "poly_up": [1, 6, 0], "poly_down": [14, 12, -18], "a": 2, "b": 3} par calcul
+  ("id" est optionnel),
+- CSV : colonnes id (optionnelle), poly_up, poly_down, a, b, les coefficients étant séparés par des espaces.
+Chaque résultat contient le numéro de ligne ('line'), l'id s'il y en a un, et soit 'result', soit 'error' : une ligne
+invalide ou un calcul qui échoue ne fait pas échouer tout le fichier.
+"""
+import csv
+import itertools
+import json
+from utils.integral import calc_integral
+from utils.cache import DecompositionCache
+
+FORMATS = ('jsonl', 'csv')
+
+
+def parse_polynomial(value):
+    """
+    Les coefficients d'un polynôme, donnés sous forme de liste ou de chaîne "1 6 0 -12".
+    """
+    if isinstance(value, str):
+        value = value.replace(',', ' ').split()
+    coefficients = [float(coeff) for coeff in value]
+    if not coefficients:
+        raise ValueError("polynôme vide")
+    return coefficients
+
+
+def parse_job(record: dict):
+    """
+    Valide un calcul lu dans le fichier et retourne (poly_up, poly_down, a, b).
+    """
+    for field in ('poly_up', 'poly_down', 'a', 'b'):
+        if record.get(field) in (None, ''):
+            raise ValueError(f"champ manquant : {field}")
+    poly_down = parse_polynomial(record['poly_down'])
+    if poly_down[-1] == 0:
+        raise ValueError("le coefficient dominant du dénominateur est nul")
+    return parse_polynomial(record['poly_up']), poly_down, float(record['a']), float(record['b'])
+
+
+def read_jsonl(file):
+    """
+    Générateur de (numéro de ligne, calcul) ; le calcul est une exception si la ligne n'est pas du JSON valide.
+    Les lignes vides sont ignorées.
+    """
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("un objet JSON est attendu")
+        except ValueError as error:
+            record = error
+        yield line_number, record
+
+
+def read_csv(file):
+    """
+    Générateur de (numéro de ligne, calcul) pour un fichier CSV avec une ligne d'en-tête.
+    """
+    reader = csv.DictReader(file)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def read_jobs(file, file_format='jsonl'):
+    """
+    Générateur de (numéro de ligne, calcul) pour un fichier au format file_format ('jsonl' ou 'csv').
+    """
+    if file_format == 'jsonl':
+        return read_jsonl(file)
+    if file_format == 'csv':
+        return read_csv(file)
+    raise ValueError(f"Format inconnu : {file_format!r} (choix : {', '.join(FORMATS)})")
+
+
+def chunked(iterable, size):
+    """
+    Découpe un itérable en listes de size éléments (la dernière peut être plus courte), sans tout charger en mémoire.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def integrate_job(line_number, record, cache, options):
+    """
+    Calcule un calcul lu dans le fichier et retourne son résultat (ou son erreur).
+    """
+    result = {'line': line_number}
+    if isinstance(record, dict) and record.get('id') not in (None, ''):
+        result['id'] = record['id']
+    try:
+        if isinstance(record, Exception):
+            raise record
+        result['result'] = float(calc_integral(*parse_job(record), cache=cache, **options))
+    except Exception as error:  # Une erreur par calcul, on passe au suivant
+        result['error'] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def integrate_chunks(jobs, chunk_size=1000, cache=None, **options):
+    """
+    Générateur des résultats, paquet par paquet (listes d'au plus chunk_size résultats), dans l'ordre des calculs.
+    jobs : un itérable de (numéro de ligne, calcul), par exemple read_jobs(file).
+    cache : un DecompositionCache partagé par tous les paquets (par défaut, un cache de 128 dénominateurs : la mémoire
+    reste bornée). options : les options de calc_integral (backend, method, square_free, ...).
+    """
+    cache = DecompositionCache() if cache is None else cache
+    for chunk in chunked(jobs, chunk_size):
+        yield [integrate_job(line_number, record, cache, options) for line_number, record in chunk]
+
+
+def write_results(chunks, file, file_format='jsonl'):
+    """
+    Écrit les résultats au fur et à mesure (un flush par paquet). Retourne (nombre de résultats, nombre d'erreurs).
+    """
+    total, errors = 0, 0
+    writer = None
+    if file_format == 'csv':
+        writer = csv.DictWriter(file, fieldnames=['line', 'id', 'result', 'error'])
+        writer.writeheader()
+    for chunk in chunks:
+        for result in chunk:
+            if writer is not None:
+                writer.writerow(result)
+            else:
+                file.write(json.dumps(result) + '\n')
+            errors += 'error' in result
+        total += len(chunk)
+        file.flush()
+    return total, errors
@@ -5,6 +5,7 @@ Toutes les fonctions dans ce fichier ont été générées par Claude 3.7 Sonnet
 import numpy as np
 from numpy.polynomial import Polynomial, polynomial
 import random
+from utils.muller_fast import fast_find_all_roots
 
 def mullers_method(poly, x0, x1, x2, max_iter=100, tol=1e-10):
     """
@@ -173,7 +174,8 @@ def print_roots(roots):
     for i, root in enumerate(roots, 1):
         print(f"Root {i}: {format_complex(root)}")
 
-def muller_find_roots(coefficients, tol=1e-10, max_iter=100, attempts=5, verbose=False):
+def muller_find_roots(coefficients, tol=1e-10, max_iter=100, attempts=5, verbose=False, fast=True, initial=None,
+                      stats=None, guard=1e-15):
     """
     ------------ GÉNÉRÉ PAR CLAUDE 3.7 SONNET ------------
 
@@ -191,13 +193,26 @@ def muller_find_roots(coefficients, tol=1e-10, max_iter=100, attempts=5, verbose
         Number of attempts with different initial guesses per root.
     verbose : bool, optional
         Whether to print additional information during execution.
+    fast : bool, optional
+        Use the Horner / synthetic division kernel of utils/muller_fast.py (same roots within tolerance).
+        The per-root messages of verbose mode are only printed by the original implementation.
+    initial : list, optional
+        Root estimates (e.g. from a previous call) used as warm starts before falling back to random restarts.
+        Only used by the fast kernel.
+    stats : dict, optional
+        Accumulates warm/cold root and iteration counters (see fast_find_all_roots). Only used by the fast kernel.
+    guard : float, optional
+        Threshold of the division-by-zero guards in the Muller iterations. Only used by the fast kernel.
 
     Returns:
     --------
     roots : list
         List of approximated roots.
     """
-    roots = find_all_roots(coefficients, tol, max_iter, attempts, verbose)
+    if fast:
+        roots = fast_find_all_roots(coefficients, tol, max_iter, attempts, initial, stats, guard)
+    else:
+        roots = find_all_roots(coefficients, tol, max_iter, attempts, verbose)
 
     if verbose:
         print_roots(roots)
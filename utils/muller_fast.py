@@ -0,0 +1,193 @@
+"""
+Ce fichier contient une version rapide de la méthode de Muller (utils/muller.py).
+Mêmes itérations et mêmes tirages aléatoires que find_all_roots, mais sans objets numpy.polynomial.Polynomial :
+- les coefficients sont gardés dans une simple liste de complexes, évaluée par le schéma de Horner,
+- chaque itération ne fait qu'une seule nouvelle évaluation du polynôme (les deux autres viennent de l'itération
+  précédente),
+- la déflation se fait sur place, par division synthétique.
+"""
+import cmath
+import random
+from utils.instrumentation import get_collector
+
+
+def horner(coefficients: list, x):
+    """
+    Évalue le polynôme (coefficients par puissances croissantes) en x par le schéma de Horner.
+    """
+    result = 0
+    for coeff in reversed(coefficients):
+        result = result * x + coeff
+    return result
+
+
+def deflate(coefficients: list, root):
+    """
+    Divise sur place le polynôme par (x - root), par division synthétique. Retourne le reste.
+    Après l'appel, coefficients contient le quotient (un coefficient de moins).
+    """
+    carry = coefficients[-1]
+    for k in range(len(coefficients) - 2, -1, -1):
+        coefficients[k], carry = carry, coefficients[k] + root * carry
+    coefficients.pop()
+    return carry
+
+
+def is_root(coefficients: list, root, tol):
+    """
+    Test d'acceptation d'une racine : |p(root)| < tol, relativement à l'ordre de grandeur des termes de p en root
+    (sum |c_k| |root|^k, au moins 1). Pour un polynôme à grands coefficients ou une racine de grand module, l'erreur
+    d'arrondi de l'évaluation dépasse tol bien avant que la racine ne soit fausse : un test absolu la refuserait.
+    """
+    return abs(horner(coefficients, root)) < tol * max(1.0, horner([abs(coeff) for coeff in coefficients], abs(root)))
+
+
+def fast_mullers_method(coefficients: list, x0, x1, x2, max_iter=100, tol=1e-10, guard=1e-15):
+    """
+    Même algorithme que mullers_method, mais avec une seule évaluation de Horner par itération.
+    guard : le seuil des gardes contre les divisions par 0.
+    En arithmétique complexe de Python, une division par 0 ou un dépassement lève une exception (là où NumPy donnait
+    inf ou nan) : on s'arrête alors, comme pour les gardes, et la tentative échoue au test de racine.
+    Retourne (racine, nombre d'itérations).
+    """
+    f0, f1, f2 = horner(coefficients, x0), horner(coefficients, x1), horner(coefficients, x2)
+    iterations = 0
+
+    while iterations < max_iter:
+        h0 = x1 - x0
+        h1 = x2 - x1
+        # On évite une division par 0 (h0 + h1 = x2 - x0 s'annule si x2 revient sur x0)
+        if abs(h0) < guard or abs(h1) < guard or abs(h0 + h1) < guard:
+            return x2, iterations
+
+        try:
+            d0 = (f1 - f0) / h0
+            d1 = (f2 - f1) / h1
+
+            # Coefficients de la parabole qui passe par les trois points
+            a = (d1 - d0) / (h1 + h0)
+            b = a * h1 + d1
+            c = f2
+
+            if abs(a) < guard:  # Parabole presque droite
+                if abs(b) < guard:
+                    return x2, iterations
+                x3 = x2 - c / b
+            else:
+                sqrt_disc = cmath.sqrt(complex(b ** 2 - 4 * a * c))
+                # On prend le dénominateur qui donne la plus petite correction
+                denominator = b + sqrt_disc if abs(b + sqrt_disc) > abs(b - sqrt_disc) else b - sqrt_disc
+                if abs(denominator) < guard:
+                    return x2, iterations
+                x3 = x2 - (2 * c) / denominator
+        except (ZeroDivisionError, OverflowError):
+            return x2, iterations
+        if not cmath.isfinite(x3):  # Évaluations infinies ou nan : la tentative a divergé
+            return x2, iterations
+
+        if abs(x3 - x2) < tol:
+            return x3, iterations
+
+        x0, x1, x2 = x1, x2, x3
+        f0, f1, f2 = f1, f2, horner(coefficients, x3)  # La seule nouvelle évaluation de l'itération
+        iterations += 1
+
+    return x2, iterations
+
+
+def clean_parts(root, tol):
+    """
+    Met à 0 les parties réelles ou imaginaires plus petites que tol.
+    """
+    if abs(root.real) < tol:
+        root = complex(0, root.imag)
+    if abs(root.imag) < tol:
+        root = complex(root.real, 0)
+    return root
+
+
+def polish_root(coefficients: list, estimate, max_iter=100, tol=1e-10, guard=1e-15):
+    """
+    Lance Muller à partir d'une estimation de la racine (démarrage « à chaud ») : les trois points de départ sont
+    l'estimation et deux points très proches. Retourne (racine, nombre d'itérations).
+    """
+    estimate = complex(estimate)
+    step = 1e-3 * (1 + abs(estimate))
+    return fast_mullers_method(coefficients, estimate - step, estimate + step, estimate, max_iter, tol, guard)
+
+
+def fast_find_all_roots(coefficients, tol=1e-10, max_iter=100, attempts_per_root=5, initial=None, stats=None,
+                        guard=1e-15):
+    """
+    Même algorithme que find_all_roots (points de départ aléatoires dans [-5, 5] + 5i[-5, 5], puis déflation),
+    avec le noyau rapide. Avec la même graine pour le module random, les racines sont les mêmes à la tolérance près.
+
+    initial : des estimations des racines (par exemple celles d'un appel précédent). Chaque racine est d'abord
+    cherchée à partir de l'estimation correspondante ; on ne revient aux points de départ aléatoires que si ce
+    démarrage à chaud échoue.
+    stats : un dictionnaire optionnel dans lequel on cumule les compteurs 'warm_roots', 'warm_iterations',
+    'cold_roots', 'cold_iterations' et 'warm_failures'.
+    guard : le seuil des gardes contre les divisions par 0 (voir fast_mullers_method).
+    Si un collecteur est actif (voir utils/instrumentation.py), on y enregistre pour chaque racine le nombre
+    d'itérations ('muller_iterations') et de relances aléatoires ('muller_retries'), ainsi que les compteurs
+    'muller_deflations' et 'muller_failures'.
+    """
+    collector = get_collector()
+    coefficients = [complex(coeff) for coeff in coefficients]
+    degree = len(coefficients) - 1
+    initial = [] if initial is None else list(initial)
+    if stats is not None:
+        for key in ('warm_roots', 'warm_iterations', 'cold_roots', 'cold_iterations', 'warm_failures'):
+            stats.setdefault(key, 0)
+    roots = []
+
+    for i in range(degree):
+        root_found = False
+        root_iterations, retries = 0, 0
+
+        if i < len(initial):  # Démarrage à chaud
+            root, iterations = polish_root(coefficients, initial[i], max_iter, tol, guard)
+            root_found = is_root(coefficients, root, tol)
+            root_iterations += iterations
+            if stats is not None:
+                stats['warm_roots' if root_found else 'warm_failures'] += 1
+                stats['warm_iterations'] += iterations
+
+        attempts = 0 if root_found else attempts_per_root
+        for _ in range(attempts):
+            x0 = complex(random.uniform(-5, 5), random.uniform(-5, 5))
+            x1 = complex(random.uniform(-5, 5), random.uniform(-5, 5))
+            x2 = complex(random.uniform(-5, 5), random.uniform(-5, 5))
+
+            root, iterations = fast_mullers_method(coefficients, x0, x1, x2, max_iter, tol, guard)
+            root_iterations += iterations
+            retries += 1
+            if stats is not None:
+                stats['cold_iterations'] += iterations
+
+            if is_root(coefficients, root, tol):
+                if stats is not None:
+                    stats['cold_roots'] += 1
+                root_found = True
+                break
+
+        if collector is not None:
+            collector.observe('muller_iterations', root_iterations)
+            collector.observe('muller_retries', max(retries - 1, 0))
+        if not root_found:
+            if collector is not None:
+                collector.count('muller_failures')
+            break
+
+        root = clean_parts(root, tol)
+        roots.append(root)
+        deflate(coefficients, root)
+        if collector is not None:
+            collector.count('muller_deflations')
+
+        if len(coefficients) <= 2:  # Polynôme constant ou linéaire : on termine directement
+            if len(coefficients) == 2 and abs(coefficients[1]) > guard:
+                roots.append(clean_parts(-coefficients[0] / coefficients[1], tol))
+            break
+
+    return roots
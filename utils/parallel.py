@@ -0,0 +1,77 @@
+"""
+Ce fichier contient l'exécution parallèle de grands lots de calculs, répartis sur plusieurs processus
+(ProcessPoolExecutor) : calc_integral est limité par Python (Muller, boucles sur les éléments simples), un seul
+processus n'utilise donc qu'un cœur.
+
+- Les calculs sont envoyés par paquets (un aller-retour entre processus par paquet, pas par calcul), avec au plus
+  quelques paquets en attente par processus : on peut passer un générateur arbitrairement long.
+- Chaque processus garde son propre DecompositionCache d'un paquet à l'autre (cache « chaud »).
+- Le module random (points de départ de Muller) est réinitialisé au début de chaque paquet, avec une graine qui ne
+  dépend que de seed et du numéro du paquet : les résultats ne dépendent ni du nombre de processus, ni du processus
+  qui traite le paquet.
+"""
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from utils.integral import calc_integral
+from utils.cache import DecompositionCache
+from utils.jobs import chunked
+
+_worker_cache = None  # Le cache du processus, créé par _init_worker
+
+
+def _init_worker(cache_size):
+    global _worker_cache
+    _worker_cache = DecompositionCache(cache_size)
+
+
+def _integrate_chunk(chunk_index, chunk, seed, options):
+    """
+    Exécuté dans un processus : calcule un paquet de calculs (poly_up, poly_down, a, b).
+    Un calcul qui échoue donne son exception à la place du résultat.
+    """
+    random.seed((seed << 32) + chunk_index)
+    results = []
+    for poly_up, poly_down, a, b in chunk:
+        try:
+            results.append(float(calc_integral(poly_up, poly_down, a, b, cache=_worker_cache, **options)))
+        except Exception as error:
+            results.append(error)
+    return chunk_index, results
+
+
+def integrate_parallel(jobs, workers=None, chunk_size=256, ordered=True, seed=0, cache_size=128, **options):
+    """
+    Générateur des intégrales d'un lot de calculs (poly_up, poly_down, a, b), calculées sur workers processus
+    (par défaut, un par cœur).
+    ordered : si True, les résultats sont donnés dans l'ordre des calculs ; sinon, des couples (indice du calcul,
+    résultat) dans l'ordre où les paquets se terminent.
+    Un calcul qui échoue donne son exception à la place du résultat.
+    options : les options de calc_integral (backend, method, square_free, ...).
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cache_size,)) as executor:
+        max_pending = 2 * workers
+        pending = deque()
+        chunks = enumerate(chunked(jobs, chunk_size))
+
+        def submit():
+            for chunk_index, chunk in chunks:
+                pending.append(executor.submit(_integrate_chunk, chunk_index, chunk, seed, options))
+                if len(pending) >= max_pending:
+                    return
+
+        submit()
+        while pending:
+            if ordered:  # On attend toujours le plus ancien paquet
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                chunk_index, results = future.result()
+                for index, result in enumerate(results):
+                    yield result if ordered else (chunk_index * chunk_size + index, result)
+            submit()
@@ -0,0 +1,48 @@
+"""
+Ce fichier contient les politiques de précision : un seul objet qui fixe toutes les tolérances du calcul, passé à
+calc_integral (precision=...) et transmis à toutes les étapes :
+
+- tol, max_iter, attempts : la convergence de Muller, le nombre maximum d'itérations et de tirages aléatoires par
+  racine (aussi le seuil sous lequel une partie réelle ou imaginaire est mise à 0),
+- guard : les gardes contre les divisions par 0 dans les itérations de Muller,
+- epsilon : la distance sous laquelle deux racines sont regroupées en une racine multiple (unique_with_epsilon),
+- decimals : l'arrondi des racines regroupées (None : pas d'arrondi),
+- polish : si True, chaque racine est affinée par la méthode de Newton sur le polynôme d'origine (non déflaté), ce
+  qui corrige les erreurs accumulées par les déflations successives,
+- square_free : si True, le dénominateur est toujours décomposé sans facteur carré avant la recherche des racines
+  (comme calc_integral(..., square_free=True)) : les multiplicités sont exactes au lieu d'être devinées par
+  regroupement, et les racines sont cherchées sur des facteurs à racines simples.
+
+Trois niveaux sont fournis (PRECISION_PRESETS) :
+- 'fast' : tolérances plus larges et moins de tirages, pour trier rapidement de gros lots,
+- 'default' : les tolérances historiques, sans décomposition sans facteur carré ni affinage,
+- 'high' : décomposition sans facteur carré, tolérance plus fine, pas d'arrondi des racines, plus d'itérations et de
+  tirages, et affinage sur le polynôme d'origine.
+"""
+from collections import namedtuple
+
+PrecisionPolicy = namedtuple('PrecisionPolicy', ['name', 'tol', 'max_iter', 'attempts', 'guard', 'epsilon',
+                                                 'decimals', 'polish', 'square_free'])
+
+PRECISION_PRESETS = {
+    'fast': PrecisionPolicy('fast', tol=1e-7, max_iter=50, attempts=2, guard=1e-15, epsilon=1e-4, decimals=5,
+                            polish=False, square_free=False),
+    'default': PrecisionPolicy('default', tol=1e-10, max_iter=100, attempts=5, guard=1e-15, epsilon=1e-6, decimals=7,
+                               polish=False, square_free=False),
+    'high': PrecisionPolicy('high', tol=1e-12, max_iter=200, attempts=10, guard=1e-15, epsilon=1e-6, decimals=None,
+                            polish=True, square_free=True),
+}
+
+
+def get_precision(precision=None):
+    """
+    La politique de précision correspondant à precision : None (niveau 'default'), le nom d'un niveau de
+    PRECISION_PRESETS, ou directement une PrecisionPolicy (par exemple PRECISION_PRESETS['high']._replace(tol=1e-13)).
+    """
+    if precision is None:
+        return PRECISION_PRESETS['default']
+    if isinstance(precision, PrecisionPolicy):
+        return precision
+    if precision not in PRECISION_PRESETS:
+        raise ValueError(f"Niveau de précision inconnu : {precision!r} (choix : {', '.join(PRECISION_PRESETS)})")
+    return PRECISION_PRESETS[precision]
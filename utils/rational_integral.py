@@ -0,0 +1,72 @@
+"""
+Ce fichier contient la classe RationalIntegral : une fonction rationnelle déjà décomposée en éléments simples.
+La décomposition (division euclidienne, recherche des racines, résolution du système d'identification) n'est faite
+qu'une seule fois, à la construction. Les intégrales sont ensuite calculées à partir d'une primitive explicite.
+"""
+import numpy as np
+from utils.decomposition import decompose_rational
+from utils.hermite import decompose_hermite
+from utils.terms import TermTable
+
+
+class RationalIntegral:
+    """
+    Représente poly_up / poly_down sous forme décomposée :
+
+    - primitive_poly : les coefficients (puissances décroissantes) d'une primitive de la partie entière,
+    - roots, multiplicities : les racines uniques du dénominateur (sans les conjugués) et leur multiplicité,
+    - terms : les éléments simples, rangés dans une TermTable (voir utils/terms.py),
+    - rational_up, rational_down : une partie rationnelle de la primitive (puissances décroissantes), non triviale
+      seulement avec la réduction d'Hermite (method='hermite').
+
+    L'objet ne contient que des tableaux NumPy : il est donc sérialisable avec pickle.
+    """
+    __slots__ = ('primitive_poly', 'roots', 'multiplicities', 'terms', 'rational_up', 'rational_down')
+
+    def __init__(self, poly_up: list, poly_down: list, cache=None, backend='muller', square_free=False,
+                 method='matrix', precision=None):
+        if method == 'hermite':
+            floored_poly_up, rational_up, rational_down, unique, count, constants = decompose_hermite(
+                poly_up, poly_down, backend, precision)
+            self._set_decomposition(floored_poly_up, unique, count, constants, 1, rational_up, rational_down)
+            return
+        floored_poly_up, unique, count, constants = decompose_rational(poly_up, poly_down, cache, backend, square_free,
+                                                                       method, precision=precision)
+        self._set_decomposition(floored_poly_up, unique, count, constants, poly_down[-1])
+
+    @classmethod
+    def from_decomposition(cls, floored_poly_up: list, unique, count, constants, leading_coeff, rational_up=(0,),
+                           rational_down=(1,)):
+        """
+        Construit l'objet à partir d'une décomposition déjà calculée (voir decompose_rational et decompose_hermite).
+        """
+        obj = cls.__new__(cls)
+        obj._set_decomposition(floored_poly_up, unique, count, constants, leading_coeff, rational_up, rational_down)
+        return obj
+
+    def _set_decomposition(self, floored_poly_up, unique, count, constants, leading_coeff, rational_up=(0,),
+                           rational_down=(1,)):
+        """
+        Range la décomposition dans des tableaux.
+        """
+        self.rational_up = np.array(rational_up, dtype=float)[::-1]
+        self.rational_down = np.array(rational_down, dtype=float)[::-1]
+        self.primitive_poly = np.polyint(np.array(floored_poly_up[::-1], dtype=float))
+        self.roots = np.array(unique, dtype=complex)
+        self.multiplicities = np.array(count, dtype=int)
+        self.terms = TermTable(unique, count, constants, leading_coeff)
+
+    def antiderivative(self, x):
+        """
+        Évalue une primitive de la fonction rationnelle en x (scalaire ou tableau NumPy).
+        Cette primitive n'est valable que sur un intervalle qui ne contient aucune racine réelle du dénominateur.
+        """
+        x = np.asarray(x, dtype=float)
+        result = np.polyval(self.primitive_poly, x) + np.polyval(self.rational_up, x) / np.polyval(self.rational_down, x)
+        return result + self.terms.antiderivative(x)
+
+    def integrate(self, a, b):
+        """
+        Calcule l'intégrale entre a et b (scalaires ou tableaux NumPy de formes compatibles).
+        """
+        return self.antiderivative(b) - self.antiderivative(a)
@@ -0,0 +1,123 @@
+"""
+Ce fichier contient le calcul direct des constantes des éléments simples, sans système d'identification.
+Pour une racine r de multiplicité m, on écrit R(x) / Q(x) = g(x) / (x - r)^m avec g = R / (produit des autres
+facteurs). Les constantes des éléments simples en r sont alors les coefficients de Taylor de g en r :
+    c_(m - s) = g^(s)(r) / s!    pour s = 0, ..., m - 1
+(pour une racine simple, c'est la formule du « cache » : c = R(r) / produit des (r - r_j)^(m_j)).
+
+Les racines complexes conjuguées donnent des constantes conjuguées, qu'on regroupe ensuite en éléments simples de
+seconde espèce (Ax + B) / (x^2 + cx + d)^i, dans le même ordre que les colonnes de la matrice d'identification
+(voir get_polys_simple_element). Le résultat se substitue donc directement à celui de solve_linear_system.
+"""
+import numpy as np
+from numpy.polynomial import polynomial
+
+
+def taylor_coefficients(poly, root, order):
+    """
+    Les coefficients de Taylor de poly (puissances croissantes) en root, jusqu'à l'ordre order - 1 :
+    poly(root + t) = somme_s coeffs[s] * t^s + O(t^order). Divisions synthétiques successives par (x - root).
+    """
+    coefficients = np.array(poly, dtype=complex)
+    result = np.zeros(order, dtype=complex)
+    for s in range(min(order, len(coefficients))):
+        carry = 0
+        for k in range(len(coefficients) - 1, -1, -1):  # Horner, en gardant le quotient
+            coefficients[k], carry = carry, coefficients[k] + root * carry
+        result[s] = carry  # Le reste de la division par (x - root)
+        coefficients = coefficients[:-1]
+    return result
+
+
+def inverse_factor_series(delta, power, order):
+    """
+    Les coefficients en t de (delta + t)^(-power), jusqu'à l'ordre order - 1 :
+    delta^(-power) * somme_s binom(-power, s) * (t / delta)^s.
+    """
+    series = np.zeros(order, dtype=complex)
+    term = delta ** (-power)
+    for s in range(order):
+        series[s] = term
+        term *= (-power - s) / ((s + 1) * delta)  # binom(-power, s + 1) / binom(-power, s), divisé par delta
+    return series
+
+
+def multiply_series(left, right):
+    """
+    Produit de deux séries tronquées à la même longueur.
+    """
+    return np.convolve(left, right)[:len(left)]
+
+
+def get_residues(rest_poly_up: list, roots, counts):
+    """
+    Pour chaque racine roots[k] (toutes les racines, conjuguées comprises) de multiplicité counts[k], retourne le
+    tableau des constantes c_1, ..., c_m de l'élément simple c_i / (x - roots[k])^i, pour le dénominateur unitaire.
+    """
+    roots = np.array(roots, dtype=complex)
+    counts = np.array(counts, dtype=int)
+    residues = []
+    for k, (root, multiplicity) in enumerate(zip(roots, counts)):
+        series = taylor_coefficients(rest_poly_up, root, multiplicity)
+        others = np.arange(len(roots)) != k
+        if multiplicity == 1:  # Racine simple : c = R(r) / produit des (r - r_j)^(m_j), en un seul produit vectorisé
+            residues.append(series / np.prod((root - roots[others]) ** counts[others]))
+            continue
+        for other, other_multiplicity in zip(roots[others], counts[others]):
+            series = multiply_series(series, inverse_factor_series(root - other, other_multiplicity, multiplicity))
+        residues.append(series[::-1])  # Le coefficient de t^s donne la constante de la puissance m - s
+    return residues
+
+
+def pair_conjugate_residues(root, residues):
+    """
+    Regroupe les éléments simples c_i / (x - r)^i et conj(c_i) / (x - conj(r))^i (i = 1..m) en
+    (A_i x + B_i) / (x^2 + cx + d)^i. Retourne (B_1..B_m, A_1..A_m), l'ordre des colonnes de la matrice
+    d'identification.
+    """
+    multiplicity = len(residues)
+    quadratic = np.array([root.real ** 2 + root.imag ** 2, -2 * root.real, 1])
+    conjugate_factor = np.array([-np.conj(root), 1])
+
+    # Numérateur commun, sur (x^2 + cx + d)^m : somme_i 2 Re(c_i (x - conj(r))^i) (x^2 + cx + d)^(m - i)
+    numerator = np.zeros(1)
+    for i in range(1, multiplicity + 1):
+        term = 2 * np.real(residues[i - 1] * polynomial.polypow(conjugate_factor, i))
+        numerator = polynomial.polyadd(numerator, polynomial.polymul(term, polynomial.polypow(quadratic, multiplicity - i)))
+
+    # Développement en base (x^2 + cx + d) : numerator = somme_k L_k (x^2 + cx + d)^k, avec L_k de degré <= 1,
+    # donc L_k est le numérateur de la puissance m - k.
+    b_constants, a_constants = np.zeros(multiplicity), np.zeros(multiplicity)
+    for k in range(multiplicity):
+        numerator, remainder = polynomial.polydiv(numerator, quadratic)
+        remainder = np.pad(remainder, (0, max(0, 2 - len(remainder))))
+        b_constants[multiplicity - k - 1] = remainder[0]
+        a_constants[multiplicity - k - 1] = remainder[1]
+    return list(b_constants) + list(a_constants)
+
+
+def get_residue_constants(rest_poly_up: list, unique, count):
+    """
+    Les constantes des éléments simples, calculées directement par les résidus, dans l'ordre des colonnes de la
+    matrice d'identification (mêmes conventions que solve_linear_system(whole_matrix, ...)['solution']).
+    unique, count : les racines uniques sans les conjugués et leur multiplicité (voir unique_with_epsilon).
+    """
+    roots, counts = [], []
+    for root, multiplicity in zip(unique, count):
+        roots.append(complex(root))
+        counts.append(multiplicity)
+        if root.imag != 0:  # On remet le conjugué, qui est aussi un pôle
+            roots.append(complex(root).conjugate())
+            counts.append(multiplicity)
+
+    residues = get_residues(rest_poly_up, roots, counts)
+    constants = []
+    index = 0
+    for root, multiplicity in zip(unique, count):
+        if root.imag == 0:
+            constants.extend(np.real(residues[index]))
+            index += 1
+        else:
+            constants.extend(pair_conjugate_residues(complex(root), residues[index]))
+            index += 2
+    return np.array(constants, dtype=float)
@@ -0,0 +1,227 @@
+"""
+Ce fichier contient les différentes méthodes (« backends ») de recherche des racines du dénominateur.
+Chaque backend est une fonction qui prend les coefficients du polynôme (puissances croissantes) et retourne la liste
+de ses racines complexes, comme muller_find_roots.
+
+- 'muller' : la méthode de Muller avec déflation (utils/muller.py), à partir de points de départ aléatoires,
+- 'companion' : les valeurs propres de la matrice compagnon,
+- 'aberth' : la méthode d'Aberth–Ehrlich, qui affine toutes les racines en même temps à partir de points de départ
+  déterministes.
+
+MullerSweep est un backend avec mémoire, pour les balayages de paramètre : il repart des racines de l'appel précédent.
+"""
+import numpy as np
+from utils.muller import muller_find_roots
+from utils.precision import get_precision
+
+
+class RootFindingError(ValueError):
+    """
+    Les racines trouvées ne couvrent pas tout le dénominateur (la recherche des racines a échoué) : la décomposition
+    serait fausse.
+    """
+
+
+def count_roots(unique, count):
+    """
+    Le nombre de racines, avec multiplicité, représentées par des racines uniques (sans les conjugués) : une racine
+    complexe compte avec son conjugué.
+    """
+    return sum(multiplicity * (2 if root.imag != 0 else 1) for root, multiplicity in zip(unique, count))
+
+
+def check_root_count(unique, count, degree):
+    """
+    Vérifie que les racines uniques et leurs multiplicités couvrent les degree racines du polynôme. Lève une
+    RootFindingError sinon.
+    """
+    found = count_roots(unique, count)
+    if found != degree:
+        raise RootFindingError(f"{found} racines (avec multiplicité) trouvées pour un dénominateur de degré {degree} : "
+                               f"la recherche des racines a échoué")
+
+
+def clean_root(root, tol=1e-10):
+    """
+    Met à 0 les parties réelles ou imaginaires négligeables, comme le fait find_all_roots.
+    """
+    root = complex(root)
+    if abs(root.real) < tol:
+        root = complex(0, root.imag)
+    if abs(root.imag) < tol:
+        root = complex(root.real, 0)
+    return root
+
+
+def companion_find_roots(coefficients, tol=1e-10):
+    """
+    Calcule les racines comme valeurs propres de la matrice compagnon du polynôme unitaire.
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    degree = len(coefficients) - 1
+    if degree < 1:
+        return []
+    companion = np.zeros((degree, degree))
+    companion[1:, :-1] = np.eye(degree - 1)  # Sous-diagonale de 1
+    companion[:, -1] = -coefficients[:-1] / coefficients[-1]
+    return [clean_root(root, tol) for root in np.linalg.eigvals(companion)]
+
+
+def aberth_initial_guesses(coefficients):
+    """
+    Points de départ déterministes pour Aberth–Ehrlich : répartis sur un cercle centré sur la moyenne des racines,
+    de rayon donné par la borne de Fujiwara (toutes les racines sont dans ce disque).
+    L'angle de départ est décalé pour ne pas partir symétriquement par rapport à l'axe réel.
+    Le rayon a un minimum : pour (x - c)^n, la borne est nulle et tous les points de départ seraient confondus.
+    """
+    degree = len(coefficients) - 1
+    monic = coefficients / coefficients[-1]
+    center = -monic[-2] / degree  # Moyenne des racines
+    ratios = np.abs(monic[:-1][::-1]) ** (1 / np.arange(1, degree + 1))  # |c_(n-k) / c_n|^(1/k)
+    ratios[-1] /= 2 ** (1 / degree)
+    radius = max(2 * ratios.max(), 1e-3 * max(1, abs(center)))
+    angles = 2 * np.pi * np.arange(degree) / degree + 0.4
+    return center + radius * np.exp(1j * angles)
+
+
+def aberth_find_roots(coefficients, tol=1e-12, max_iter=500, initial=None):
+    """
+    Méthode d'Aberth–Ehrlich : toutes les racines z_k sont corrigées ensemble par
+        w_k = N_k / (1 - N_k * somme_(j != k) 1 / (z_k - z_j)),  avec N_k = p(z_k) / p'(z_k)
+    La convergence est cubique pour des racines simples, et les points de départ sont déterministes (voir
+    aberth_initial_guesses), donc le temps de calcul ne dépend pas du hasard.
+    tol : une racine est considérée comme convergée quand sa correction est inférieure à tol * (1 + |z_k|).
+    initial : des estimations des racines, utilisées à la place des points de départ par défaut.
+    Les racines non finies (une itération qui a divergé) sont écartées : il manque alors des racines, ce que
+    find_unique_roots signale.
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    degree = len(coefficients) - 1
+    if degree < 1:
+        return []
+    descending = coefficients[::-1]
+    derivative = np.polyder(descending)
+    roots = aberth_initial_guesses(coefficients) if initial is None else np.array(initial, dtype=complex)
+
+    converged = np.zeros(degree, dtype=bool)
+    for _ in range(max_iter):
+        newton = np.polyval(descending, roots) / np.polyval(derivative, roots)
+        differences = roots[:, None] - roots[None, :]
+        np.fill_diagonal(differences, 1)
+        inverse_sum = np.sum(1 / differences, axis=1) - 1  # On retire le terme diagonal 1 / 1
+        correction = newton / (1 - newton * inverse_sum)
+        correction[converged] = 0
+        roots = roots - correction
+        converged |= np.abs(correction) <= tol * (1 + np.abs(roots))
+        if converged.all():
+            break
+
+    return [clean_root(root, tol) for root in roots if np.isfinite(root)]
+
+
+def polish_roots(coefficients, roots, tol=1e-10, max_iter=5, multiplicities=None):
+    """
+    Affine des racines par la méthode de Newton sur le polynôme d'origine (coefficients par puissances croissantes).
+    Les racines trouvées après plusieurs déflations accumulent les erreurs des polynômes déflatés : quelques pas de
+    Newton sur le polynôme non déflaté les corrigent. Un pas n'est gardé que s'il diminue |p(racine)| (près d'une
+    racine multiple, Newton peut s'éloigner).
+    multiplicities : si elles sont connues (après regroupement), une racine de multiplicité m est affinée sur la
+    dérivée (m-1)-ième de p, dont elle est une racine simple.
+    """
+    if not len(roots):
+        return list(roots)
+    multiplicities = [1] * len(roots) if multiplicities is None else multiplicities
+    descending = np.asarray(coefficients, dtype=float)[::-1]
+    polished = []
+    for multiplicity in sorted(set(multiplicities)):
+        indices = [k for k, m in enumerate(multiplicities) if m == multiplicity]
+        target = np.polyder(descending, multiplicity - 1) if multiplicity > 1 else descending
+        derivative = np.polyder(target)
+        group = np.array([roots[k] for k in indices], dtype=complex)
+        values = np.abs(np.polyval(target, group))
+        for _ in range(max_iter):
+            slopes = np.polyval(derivative, group)
+            candidates = group - np.polyval(target, group) / np.where(slopes == 0, 1, slopes)
+            candidate_values = np.abs(np.polyval(target, candidates))
+            better = (candidate_values < values) & (slopes != 0)
+            if not better.any():
+                break
+            group[better], values[better] = candidates[better], candidate_values[better]
+        polished += list(zip(indices, group))
+    return [clean_root(root, tol) for _, root in sorted(polished, key=lambda item: item[0])]
+
+
+ROOT_BACKENDS = {
+    'muller': lambda coefficients, precision: muller_find_roots(coefficients, precision.tol, precision.max_iter,
+                                                                precision.attempts, guard=precision.guard),
+    'companion': lambda coefficients, precision: companion_find_roots(coefficients, precision.tol),
+    'aberth': lambda coefficients, precision: aberth_find_roots(coefficients, precision.tol, precision.max_iter),
+}
+
+
+def find_roots(coefficients, backend='muller', precision=None):
+    """
+    Cherche les racines d'un polynôme avec le backend choisi.
+    backend : le nom d'un backend de ROOT_BACKENDS, ou directement une fonction coefficients -> liste des racines (un
+    MullerSweep reçoit aussi la politique de précision).
+    precision : la politique de précision (voir utils/precision.py) ; avec polish, les racines sont ensuite affinées
+    sur le polynôme d'origine (polish_roots).
+    """
+    precision = get_precision(precision)
+    if isinstance(backend, MullerSweep):
+        roots = backend(coefficients, precision)
+    elif callable(backend):
+        roots = backend(coefficients)
+    elif backend in ROOT_BACKENDS:
+        roots = ROOT_BACKENDS[backend](coefficients, precision)
+    else:
+        raise ValueError(f"Backend de recherche des racines inconnu : {backend!r} (choix : {', '.join(ROOT_BACKENDS)})")
+    if precision.polish:
+        roots = polish_roots(coefficients, roots, precision.tol)
+    return roots
+
+
+class MullerSweep:
+    """
+    Backend de recherche des racines pour un balayage de paramètre : les racines trouvées à un appel servent de points
+    de départ (démarrage à chaud) pour l'appel suivant. Quand le dénominateur change peu d'un appel à l'autre, Muller
+    converge alors en quelques itérations, sans tirages aléatoires.
+
+    S'utilise comme backend : calc_integral(poly_up, poly_down, a, b, backend=sweep).
+    tol, max_iter, attempts : s'ils sont donnés, ils remplacent ceux de la politique de précision de chaque appel
+    (le precision de calc_integral, voir utils/precision.py) ; sinon, ce sont ceux de la politique.
+    """
+
+    def __init__(self, tol=None, max_iter=None, attempts=None):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.attempts = attempts
+        self.roots = None  # Les racines de l'appel précédent
+        self.stats = {}
+
+    def __call__(self, coefficients, precision=None):
+        precision = get_precision(precision)
+        tol = precision.tol if self.tol is None else self.tol
+        max_iter = precision.max_iter if self.max_iter is None else self.max_iter
+        attempts = precision.attempts if self.attempts is None else self.attempts
+        self.roots = muller_find_roots(coefficients, tol, max_iter, attempts, initial=self.roots, stats=self.stats,
+                                       guard=precision.guard)
+        return self.roots
+
+    def reset(self):
+        """
+        Oublie les racines précédentes : le prochain appel repart des points de départ aléatoires.
+        """
+        self.roots = None
+
+    @property
+    def iterations_saved(self):
+        """
+        Estimation du nombre d'itérations de Muller économisées : le coût moyen d'une racine trouvée à froid
+        pendant ce balayage, multiplié par le nombre de racines trouvées à chaud, moins les itérations réellement faites
+        à chaud. Vaut None tant qu'aucune racine n'a été cherchée à froid.
+        """
+        if not self.stats.get('cold_roots'):
+            return None
+        cold_cost = self.stats['cold_iterations'] / self.stats['cold_roots']
+        return cold_cost * self.stats['warm_roots'] - self.stats['warm_iterations']
@@ -0,0 +1,117 @@
+"""
+Ce fichier contient le mode serveur (voir server.py) : un processus qui reste lancé et répond aux calculs envoyés sur
+une socket TCP ou Unix, une ligne JSON par requête et par réponse. NumPy n'est importé qu'une fois, et le cache des
+dénominateurs reste chaud d'une requête à l'autre.
+
+Requêtes :
+- {"id": ..., "poly_up": [...], "poly_down": [...], "a": 2, "b": 3} (plus, optionnellement, "method", "backend",
+  "square_free" et "precision") -> {"id": ..., "result": ...} ou {"id": ..., "error": "..."},
+- {"op": "stats"} -> nombre de requêtes et d'erreurs, percentiles de latence (ms), statistiques du cache.
+Chaque client a son propre thread ; une connexion peut envoyer autant de requêtes qu'elle veut.
+"""
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+import numpy as np
+from utils.integral import calc_integral
+from utils.cache import SharedDecompositionCache
+from utils.jobs import parse_job
+
+REQUEST_OPTIONS = ('method', 'backend', 'square_free', 'precision')
+LATENCY_WINDOW = 10000  # Nombre de latences gardées pour les percentiles
+
+
+class IntegrationService:
+    """
+    L'état du serveur, partagé par toutes les connexions : le cache des dénominateurs et les latences récentes.
+    """
+
+    def __init__(self, cache_size=1024, **options):
+        self.cache = SharedDecompositionCache(cache_size)
+        self.options = options  # Options par défaut de calc_integral
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def handle(self, line):
+        """
+        Traite une ligne de requête et retourne la réponse (dictionnaire).
+        """
+        start = time.perf_counter()
+        response = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("un objet JSON est attendu")
+            if 'id' in request:
+                response['id'] = request['id']
+            if request.get('op') == 'stats':
+                return self.stats()
+            options = dict(self.options)
+            options.update({key: request[key] for key in REQUEST_OPTIONS if key in request})
+            response['result'] = float(calc_integral(*parse_job(request), cache=self.cache, **options))
+        except Exception as error:  # Une erreur par requête, la connexion reste ouverte
+            response['error'] = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self.latencies.append(time.perf_counter() - start)
+            self.requests += 1
+            self.errors += 'error' in response
+        return response
+
+    def stats(self):
+        """
+        Nombre de requêtes et d'erreurs, percentiles de latence (en ms, sur les dernières requêtes) et cache.
+        """
+        with self._lock:
+            latencies = np.array(self.latencies) * 1e3
+            stats = {'requests': self.requests, 'errors': self.errors}
+        if len(latencies):
+            stats['latency_ms'] = {f'p{q}': float(np.percentile(latencies, q)) for q in (50, 90, 99, 99.9)}
+            stats['latency_ms']['max'] = float(latencies.max())
+        stats['cache'] = self.cache.stats()
+        return stats
+
+
+class IntegrationHandler(socketserver.StreamRequestHandler):
+    """
+    Une connexion : lit les requêtes ligne par ligne et écrit chaque réponse dès qu'elle est calculée.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.service.handle(line)
+            self.wfile.write((json.dumps(response) + '\n').encode())
+            self.wfile.flush()
+
+
+class ThreadingTCPIntegrationServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ThreadingUnixIntegrationServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, host='127.0.0.1', port=8765, unix_socket=None):
+    """
+    Crée le serveur (sans le lancer : serve_forever). Avec unix_socket, écoute sur cette socket Unix plutôt qu'en TCP.
+    Une ancienne socket restée au même chemin est supprimée ; tout autre fichier est laissé en place (FileExistsError).
+    """
+    if unix_socket is not None:
+        if os.path.exists(unix_socket):
+            if not stat.S_ISSOCK(os.stat(unix_socket).st_mode):
+                raise FileExistsError(f"{unix_socket} existe et n'est pas une socket")
+            os.remove(unix_socket)
+        server = ThreadingUnixIntegrationServer(unix_socket, IntegrationHandler)
+    else:
+        server = ThreadingTCPIntegrationServer((host, port), IntegrationHandler)
+    server.service = service
+    return server
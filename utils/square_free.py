@@ -0,0 +1,153 @@
+"""
+Ce fichier contient la décomposition sans facteur carré (algorithme de Yun) du dénominateur.
+On écrit le dénominateur f = a_1 * a_2^2 * a_3^3 * ... où chaque a_i n'a que des racines simples : les racines de a_i
+sont exactement les racines de multiplicité i de f. La recherche des racines ne porte alors que sur les a_i, de degré
+bien plus petit, et les multiplicités sont connues sans avoir à regrouper des racines approchées.
+
+Par exemple, pour (x^2 + 1)^8 (x - 3)^5, on obtient a_5 = x - 3 et a_8 = x^2 + 1 : une recherche de degré 3 au lieu
+de 21.
+
+Les PGCD sont calculés en flottants : la décomposition réussit tant que les coefficients du dénominateur restent
+modérés, en pratique jusqu'à un degré total d'une trentaine pour des racines de module 1 à 3 (par exemple (x - 3)^16
+ou (x^2 + 2x + 2)^14, mais pas (x^2 + 2x + 2)^16). Au-delà, ou pour des racines distinctes très proches, le PGCD
+numérique rate des facteurs communs : un SquareFreeWarning est alors émis (voir check_square_free_roots), et le
+résultat n'est plus fiable. Le même avertissement signale des racines distinctes trop proches pour être séparées
+(à moins de 1e-4 environ l'une de l'autre, pour des racines de module 3).
+"""
+import warnings
+import numpy as np
+from numpy.polynomial import polynomial
+from utils.roots import find_roots
+
+
+class SquareFreeWarning(RuntimeWarning):
+    """
+    La décomposition sans facteur carré a échoué (PGCD numérique raté) : les multiplicités sont devinées par
+    regroupement des racines, et le résultat peut être très faux. Peut être changé en erreur avec
+    warnings.simplefilter('error', SquareFreeWarning).
+    """
+
+
+def trim_polynomial(poly, scale, tol):
+    """
+    Retire les coefficients de plus haut degré négligeables devant scale (erreurs d'arrondi des divisions).
+    """
+    poly = np.array(poly, dtype=float)
+    while len(poly) > 1 and abs(poly[-1]) <= tol * scale:
+        poly = poly[:-1]
+    return poly
+
+
+def polynomial_gcd(p, q, tol=1e-9):
+    """
+    PGCD unitaire de deux polynômes (coefficients par puissances croissantes) par l'algorithme d'Euclide.
+    Un reste est considéré comme nul quand tous ses coefficients sont négligeables devant ceux du dividende.
+    Chaque reste est remis à l'échelle (plus grand coefficient égal à 1) pour garder des valeurs comparables.
+    Si q est nul (dérivée d'un polynôme constant), le PGCD est p.
+    """
+    if not np.any(q):
+        return np.array(p, dtype=float) / p[-1] if np.any(p) else np.array([1.0])
+    p = trim_polynomial(p, np.max(np.abs(p)), tol)
+    q = trim_polynomial(q, np.max(np.abs(q)), tol)
+    p, q = p / np.max(np.abs(p)), q / np.max(np.abs(q))
+    while len(q) > 1:
+        remainder = trim_polynomial(polynomial.polydiv(p, q)[1], 1, tol)
+        if np.max(np.abs(remainder)) <= tol:  # q divise p : q est le PGCD
+            return q / q[-1]
+        p, q = q, remainder / np.max(np.abs(remainder))
+    return np.array([1.0])  # Reste constant non nul : les polynômes sont premiers entre eux
+
+
+def exact_division(p, q):
+    """
+    Quotient de p par q, quand on sait que q divise p (le reste, qui ne contient que des erreurs d'arrondi, est ignoré).
+    """
+    return polynomial.polydiv(p, q)[0]
+
+
+def yun_square_free(poly, tol=1e-9):
+    """
+    Algorithme de Yun. Retourne la liste des couples (a_i, i) avec deg(a_i) >= 1, où les a_i sont unitaires et
+    poly = coefficient dominant * produit des a_i^i.
+    Si le produit ne redonne pas poly à tol près (PGCD numérique raté), émet un SquareFreeWarning et retourne
+    [(poly unitaire, 1)] : on retombe alors sur la recherche des racines classique.
+    """
+    poly = np.array(poly, dtype=float)
+    monic = poly / poly[-1]
+    if len(monic) == 1:  # Polynôme constant : aucun facteur
+        return []
+    derivative = polynomial.polyder(monic)
+
+    factors = []
+    gcd = polynomial_gcd(monic, derivative, tol)
+    b = exact_division(monic, gcd)
+    c = exact_division(derivative, gcd)
+    d = polynomial.polysub(c, polynomial.polyder(b))
+    multiplicity = 1
+    # En arithmétique exacte, b perd au moins un facteur par tour ; numériquement, un PGCD raté peut le laisser
+    # inchangé : on s'arrête au degré du polynôme (aucune multiplicité ne le dépasse).
+    while len(b) > 1 and multiplicity < len(monic):
+        a = polynomial_gcd(b, d, tol) if np.max(np.abs(d)) > tol * np.max(np.abs(b)) else b / b[-1]
+        if len(a) > 1:
+            factors.append((a, multiplicity))
+        b = exact_division(b, a)
+        c = exact_division(d, a)
+        d = polynomial.polysub(c, polynomial.polyder(b))
+        multiplicity += 1
+
+    rebuilt = np.array([1.0])
+    for factor, power in factors:
+        rebuilt = polynomial.polymul(rebuilt, polynomial.polypow(factor, power))
+    if len(rebuilt) != len(monic) or np.max(np.abs(rebuilt - monic)) > 1e3 * tol * np.max(np.abs(monic)):
+        warnings.warn(f"Décomposition sans facteur carré ratée pour un dénominateur de degré {len(monic) - 1} : "
+                      f"multiplicités devinées par regroupement des racines", SquareFreeWarning, stacklevel=2)
+        return [(monic, 1)]
+    return factors
+
+
+def square_free_roots(poly_down: list, backend='muller', epsilon=1e-6, precision=None):
+    """
+    Racines uniques du dénominateur (sans les conjugués) et leur multiplicité, au même format que
+    unique_with_epsilon, obtenues par la décomposition sans facteur carré puis la recherche des racines de chaque
+    facteur (avec le backend choisi, voir utils/roots.py).
+    precision : la politique de précision de la recherche des racines (voir utils/precision.py).
+    """
+    unique, count = [], []
+    for factor, multiplicity in yun_square_free(poly_down):
+        roots = find_roots(factor, backend, precision)
+        check_square_free_roots(factor, roots, epsilon)
+        for root in roots:
+            if abs(root.imag) < epsilon:  # Partie imaginaire négligeable : racine réelle
+                root = complex(root.real, 0)
+            elif root.imag < 0:  # On passe les conjugués
+                continue
+            unique.append(root)
+            count.append(multiplicity)
+    return unique, count
+
+
+def check_square_free_roots(factor, roots, epsilon=1e-6):
+    """
+    Vérifie les racines (avec les conjugués) d'un facteur censé n'avoir que des racines simples, et émet un
+    SquareFreeWarning :
+    - s'il en manque (la recherche des racines a échoué),
+    - si l'une d'elles est mal conditionnée : l'erreur due aux arrondis, estimée par
+      eps * sum |c_k| |r|^k / |f'(r)|, dépasse epsilon. C'est le cas des racines d'une racine multiple que le PGCD
+      numérique n'a pas détectée (elles s'écartent les unes des autres), ou de racines distinctes trop proches.
+    """
+    factor = np.asarray(factor, dtype=float)
+    roots = np.array(roots, dtype=complex)
+    degree = len(factor) - 1
+    if len(roots) != degree:
+        warnings.warn(f"{len(roots)} racines trouvées pour un facteur de degré {degree} : intégrale fausse",
+                      SquareFreeWarning, stacklevel=2)
+        return
+    if degree == 0:
+        return
+    scale = np.polyval(np.abs(factor[::-1]), np.abs(roots))
+    slopes = np.abs(np.polyval(polynomial.polyder(factor)[::-1], roots))
+    error = np.finfo(float).eps * scale / np.maximum(slopes, np.finfo(float).tiny)
+    if error.max() > epsilon:
+        warnings.warn(f"Racines mal conditionnées (erreur estimée {error.max():.1e}) dans un facteur de degré "
+                      f"{degree} censé n'avoir que des racines simples : racine multiple non détectée ou racines "
+                      f"trop proches, multiplicités et intégrale peu fiables", SquareFreeWarning, stacklevel=2)
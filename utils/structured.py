@@ -0,0 +1,99 @@
+"""
+Ce fichier contient les chemins rapides pour les dénominateurs creux à structure connue :
+
+- les binômes lead.x^n + c (x^n - 1, x^2n + a, ...) : les racines sont les racines n-ièmes de -c/lead (racines de
+  l'unité mises à l'échelle et tournées), et les constantes des éléments simples ont une forme close :
+      pour Q(x) = x^n + C,  Q'(r) = n.r^(n-1) = -n.C / r,  donc  c_r = R(r) / Q'(r) = -r.R(r) / (n.C)
+- plus généralement, les polynômes en x^m, Q(x) = S(x^m) : on ne cherche que les racines de S (degré divisé par m),
+  puis on en prend les racines m-ièmes.
+
+Les paires de racines conjuguées sont ensuite regroupées en éléments simples réels, intégrés avec les formules
+habituelles (voir utils/terms.py).
+"""
+import math
+import numpy as np
+from utils.residues import get_residue_constants
+
+
+def get_sparse_degree(poly_down: list):
+    """
+    Le plus grand m tel que le dénominateur soit un polynôme en x^m (le PGCD des exposants des coefficients non nuls).
+    Retourne 1 si le dénominateur n'a pas de structure exploitable (terme constant nul ou polynôme plein).
+    """
+    exponents = [i for i, coeff in enumerate(poly_down) if coeff != 0]
+    if len(poly_down) < 3 or poly_down[0] == 0:
+        return 1
+    degree = 0
+    for exponent in exponents:
+        degree = math.gcd(degree, exponent)
+    return degree
+
+
+def get_mth_roots(values, counts, m):
+    """
+    Toutes les racines m-ièmes des valeurs (complexes, conjuguées comprises), en ne gardant que celles de partie
+    imaginaire positive ou nulle. Les racines réelles sont reconnues par leur angle, et rendues exactement réelles.
+    Retourne (unique, count) au format de unique_with_epsilon.
+    """
+    unique, count = [], []
+    for value, multiplicity in zip(values, counts):
+        radius = abs(value) ** (1 / m)
+        for k in range(m):
+            angle = (np.angle(value) + 2 * np.pi * k) / m
+            if abs(np.sin(angle)) < 1e-12:  # Angle 0 ou pi : racine réelle
+                unique.append(complex(radius * np.sign(np.cos(angle)), 0))
+            elif np.sin(angle) > 0:  # On passe les conjugués
+                unique.append(complex(radius * np.cos(angle), radius * np.sin(angle)))
+            else:
+                continue
+            count.append(multiplicity)
+    return unique, count
+
+
+def get_binomial_constants(rest_poly_up: list, unique, n, constant):
+    """
+    Les constantes des éléments simples de rest_poly_up / (x^n + constant), en forme close, dans l'ordre des colonnes
+    de la matrice d'identification. Toutes les racines sont simples.
+    Pour une paire conjuguée, c/(x - r) + conj(c)/(x - conj(r)) = (A.x + B) / (x^2 + cx + d) avec A = 2.Re(c) et
+    B = -2.Re(c.conj(r)).
+    """
+    roots = np.array(unique, dtype=complex)
+    residues = -roots * np.polyval(np.array(rest_poly_up, dtype=float)[::-1], roots) / (n * constant)
+    constants = []
+    for root, residue in zip(roots, residues):
+        if root.imag == 0:
+            constants.append(residue.real)
+        else:
+            constants.extend([-2 * (residue * np.conj(root)).real, 2 * residue.real])
+    return np.array(constants, dtype=float)
+
+
+def decompose_structured(rest_poly_up: list, poly_down: list, find_unique_roots, method='matrix'):
+    """
+    Décompose rest_poly_up / poly_down (rest_poly_up déjà réduit par la division euclidienne) si le dénominateur est
+    un binôme ou un polynôme en x^m. Retourne (unique, count, constants), ou None si le dénominateur n'a pas de
+    structure exploitable.
+    find_unique_roots : la fonction de recherche des racines à utiliser sur le polynôme réduit S (voir
+    utils/decomposition.py), method : la méthode de calcul des constantes dans le cas d'un polynôme en x^m.
+    """
+    m = get_sparse_degree(poly_down)
+    if m == 1:
+        return None
+    reduced = list(poly_down[::m])  # S(y), avec Q(x) = S(x^m)
+
+    if len(reduced) == 2:  # Binôme : forme close
+        unique, count = get_mth_roots([complex(-reduced[0] / reduced[1])], [1], m)
+        return unique, count, get_binomial_constants(rest_poly_up, unique, m, reduced[0] / reduced[1])
+
+    values, counts = find_unique_roots(reduced)
+    all_values, all_counts = [], []
+    for value, multiplicity in zip(values, counts):  # On remet les conjugués, qui ont aussi des racines m-ièmes
+        all_values.append(complex(value))
+        all_counts.append(multiplicity)
+        if value.imag != 0:
+            all_values.append(complex(value).conjugate())
+            all_counts.append(multiplicity)
+    unique, count = get_mth_roots(all_values, all_counts, m)
+    if method == 'residues':
+        return unique, count, get_residue_constants(rest_poly_up, unique, count)
+    return unique, count, None  # Les constantes seront obtenues par le système d'identification
@@ -0,0 +1,123 @@
+"""
+Ce fichier contient la table des éléments simples (TermTable) : toute la décomposition rangée dans des tableaux,
+pour évaluer la somme des primitives de tous les éléments simples en quelques appels vectorisés, sans boucle Python
+sur les éléments simples.
+
+Chaque racine réelle r (de multiplicité m) donne un « facteur » x - r, et chaque paire de racines complexes un facteur
+x^2 + cx + d = (x + alpha)^2 + beta. Les quantités qui ne dépendent que du facteur (log |x - r|, log(x^2 + cx + d),
+arctan((x + alpha) / sqrt(beta))) sont calculées une seule fois par facteur, puis partagées par toutes ses puissances.
+
+Primitives utilisées (mêmes formules que utils/integral_type1.py et utils/integral_type2.py) :
+    A / (x - r)                  ->  A.log|x - r|
+    A / (x - r)^n                ->  A / (1 - n) . (x - r)^(1 - n)
+    (Ax + B) / (x^2 + cx + d)    ->  A/2 . log(x^2 + cx + d) + (B - A.alpha) / sqrt(beta) . arctan(t)
+    (Ax + B) / (x^2 + cx + d)^n  ->  A/2 / (1 - n) . (x^2 + cx + d)^(1 - n) + (B - A.alpha) . sqrt(beta) / beta^n . C(2n - 2)
+avec t = arctan((x + alpha) / sqrt(beta)) et C(k) la primitive de cos^k (voir cosine_power_table).
+"""
+import numpy as np
+from utils.integral_type2 import cosine_power_table
+
+
+class TermTable:
+    """
+    Les éléments simples d'une décomposition (voir decompose_rational), rangés par type :
+
+    - real_roots : les racines réelles (une par facteur), real_log : la constante de l'élément simple de puissance 1,
+    - real_index, real_exponents, real_coeffs : les éléments simples de puissance n >= 2 (facteur, 1 - n,
+      A / (1 - n)),
+    - quad_alpha, quad_beta : les facteurs du second degré, quad_log, quad_arctan : les coefficients du log et de
+      l'arctan de l'élément simple de puissance 1,
+    - quad_index, quad_exponents, quad_rational, quad_cosine, quad_cosine_power : les éléments simples de puissance
+      n >= 2 (facteur, 1 - n, coefficient de (x^2 + cx + d)^(1 - n), coefficient de C(2n - 2), 2n - 2).
+
+    Les constantes sont déjà divisées par le coefficient dominant du dénominateur.
+    """
+    __slots__ = (
+        'real_roots', 'real_log', 'real_index', 'real_exponents', 'real_coeffs',
+        'quad_alpha', 'quad_beta', 'quad_log', 'quad_arctan',
+        'quad_index', 'quad_exponents', 'quad_rational', 'quad_cosine', 'quad_cosine_power',
+    )
+
+    def __init__(self, unique, count, constants, leading_coeff=1):
+        constants = np.asarray(constants, dtype=float) / leading_coeff
+        real_roots, real_log, real_index, real_powers, real_constants = [], [], [], [], []
+        quad_alpha, quad_beta, quad_a, quad_b = [], [], [], []
+        quad_index, quad_powers, quad_power_a, quad_power_b = [], [], [], []
+
+        constant_idx = 0
+        for root, multiplicity in zip(unique, count):  # Même ordre que les colonnes de la matrice d'identification
+            if root.imag == 0:
+                real_roots.append(root.real)
+                real_log.append(constants[constant_idx])
+                for j in range(2, multiplicity + 1):
+                    real_index.append(len(real_roots) - 1)
+                    real_powers.append(j)
+                    real_constants.append(constants[constant_idx + j - 1])
+                constant_idx += multiplicity
+            else:
+                quad_alpha.append(-root.real)  # x^2 + cx + d avec c = -2.Re(r), donc alpha = c / 2 = -Re(r)
+                quad_beta.append(root.imag ** 2)  # beta = d - alpha^2 = Im(r)^2
+                quad_b.append(constants[constant_idx])
+                quad_a.append(constants[constant_idx + multiplicity])
+                for j in range(2, multiplicity + 1):
+                    quad_index.append(len(quad_alpha) - 1)
+                    quad_powers.append(j)
+                    quad_power_b.append(constants[constant_idx + j - 1])
+                    quad_power_a.append(constants[constant_idx + multiplicity + j - 1])
+                constant_idx += 2 * multiplicity
+
+        self.real_roots = np.array(real_roots, dtype=float)
+        self.real_log = np.array(real_log, dtype=float)
+        self.real_index = np.array(real_index, dtype=int)
+        self.real_exponents = 1 - np.array(real_powers, dtype=float)
+        self.real_coeffs = np.array(real_constants, dtype=float) / self.real_exponents
+
+        self.quad_alpha = np.array(quad_alpha, dtype=float)
+        self.quad_beta = np.array(quad_beta, dtype=float)
+        quad_a, quad_b = np.array(quad_a, dtype=float), np.array(quad_b, dtype=float)
+        self.quad_log = quad_a / 2
+        self.quad_arctan = (quad_b - quad_a * self.quad_alpha) / np.sqrt(self.quad_beta)
+
+        self.quad_index = np.array(quad_index, dtype=int)
+        powers = np.array(quad_powers, dtype=int)
+        quad_power_a, quad_power_b = np.array(quad_power_a, dtype=float), np.array(quad_power_b, dtype=float)
+        alpha, beta = self.quad_alpha[self.quad_index], self.quad_beta[self.quad_index]
+        self.quad_exponents = 1 - powers.astype(float)
+        self.quad_rational = quad_power_a / 2 / self.quad_exponents
+        self.quad_cosine = (quad_power_b - quad_power_a * alpha) * np.sqrt(beta) / beta ** powers
+        self.quad_cosine_power = 2 * powers - 2
+
+    def antiderivative(self, x):
+        """
+        Évalue la somme des primitives de tous les éléments simples en x (scalaire ou tableau NumPy).
+        """
+        x = np.asarray(x, dtype=float)
+        points = x[..., None]  # Une colonne par facteur
+        result = np.zeros(x.shape)
+
+        if len(self.real_roots):
+            differences = points - self.real_roots
+            result += np.log(np.abs(differences)) @ self.real_log
+            if len(self.real_index):
+                powers = differences[..., self.real_index] ** self.real_exponents
+                result += powers @ self.real_coeffs
+
+        if len(self.quad_alpha):
+            shifted = points + self.quad_alpha
+            quadratics = shifted ** 2 + self.quad_beta
+            angles = np.arctan(shifted / np.sqrt(self.quad_beta))
+            result += np.log(quadratics) @ self.quad_log + angles @ self.quad_arctan
+            if len(self.quad_index):
+                result += (quadratics[..., self.quad_index] ** self.quad_exponents) @ self.quad_rational
+                # Primitives C(k) de cos^k qui s'annulent en 0, pour tous les facteurs à la fois, puis une seule lecture
+                # de la table par élément simple.
+                table = cosine_power_table(self.quad_cosine_power.max(), [np.zeros_like(angles), angles])
+                table = np.moveaxis(table, 0, -2)  # (..., puissance de cos, facteur)
+                result += table[..., self.quad_cosine_power, self.quad_index] @ self.quad_cosine
+        return result
+
+    def integrate(self, a, b):
+        """
+        Intégrale de la somme des éléments simples entre a et b (scalaires ou tableaux NumPy de formes compatibles).
+        """
+        return self.antiderivative(b) - self.antiderivative(a)
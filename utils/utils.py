@@ -4,11 +4,12 @@ Ce fichier contient des fonctions utiles sans catégorie particulière.
 import numpy as np
 
 
-def unique_with_epsilon(numbers, epsilon=1e-6):
+def unique_with_epsilon(numbers, epsilon=1e-6, decimals=7):
     """
     ------------ GÉNÉRÉ PAR CLAUDE 4.0 SONNET ------------
 
     Permet de trouver les racines multiples à epsilon près (les valeurs ne sont pas exactes), et retourne leur multiplicité.
+    Les racines gardées sont arrondies à decimals décimales (pas d'arrondi si decimals vaut None).
     """
     if not numbers:
         return [], []
@@ -30,7 +31,7 @@ def unique_with_epsilon(numbers, epsilon=1e-6):
 
         # If no match found, add as new unique value
         if not found_match and num.imag >= 0:  # Skip conjugates
-            unique_values.append(np.round(num, 7))
+            unique_values.append(np.round(num, decimals) if decimals is not None else num)
             counts.append(1)
 
     return unique_values, counts